@@ -0,0 +1,32 @@
+"""add keyset pagination indexes on (created_at, id)
+
+Revision ID: 3b7c9e1a2d4f
+Revises: 766d68015e08
+Create Date: 2025-09-28 10:12:41.503218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b7c9e1a2d4f'
+down_revision = '766d68015e08'
+branch_labels = None
+depends_on = None
+
+CATALOG_TABLES = ['specialties', 'therapeutic_approaches', 'modalities']
+
+
+def upgrade() -> None:
+    # Public professional listing only returns active rows
+    op.create_index('ix_professionals_active_created_at_id', 'professionals',
+                    ['created_at', 'id'], postgresql_where=sa.text('is_active'))
+    for table in CATALOG_TABLES:
+        op.create_index(f'ix_{table}_created_at_id', table, ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    for table in CATALOG_TABLES:
+        op.drop_index(f'ix_{table}_created_at_id', table_name=table)
+    op.drop_index('ix_professionals_active_created_at_id', table_name='professionals')
@@ -0,0 +1,41 @@
+"""add unique constraints on professional specialty and therapeutic approach links
+
+Revision ID: 7a3e5c1f9b24
+Revises: e5a1c9f3b7d2
+Create Date: 2025-10-02 09:41:17.552380
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7a3e5c1f9b24'
+down_revision = 'e5a1c9f3b7d2'
+branch_labels = None
+depends_on = None
+
+# Table -> (constraint name, linked column)
+LINK_TABLES = {
+    'professional_specialties': ('uq_professional_specialties_professional_specialty', 'specialty_id'),
+    'professional_therapeutic_approaches': (
+        'uq_professional_therapeutic_approaches_professional_approach',
+        'therapeutic_approach_id',
+    ),
+}
+
+
+def upgrade() -> None:
+    for table, (name, column) in LINK_TABLES.items():
+        # Keep the oldest link of every duplicated pair
+        op.execute(
+            f'DELETE FROM {table} AS duplicate USING {table} AS kept '
+            f'WHERE duplicate.professional_id = kept.professional_id '
+            f'AND duplicate.{column} = kept.{column} '
+            f'AND (duplicate.created_at, duplicate.id) > (kept.created_at, kept.id)'
+        )
+        op.create_unique_constraint(name, table, ['professional_id', column])
+
+
+def downgrade() -> None:
+    for table, (name, _column) in LINK_TABLES.items():
+        op.drop_constraint(name, table, type_='unique')
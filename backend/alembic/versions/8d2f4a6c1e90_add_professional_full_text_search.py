@@ -0,0 +1,56 @@
+"""add full-text search vector on professional name and bio
+
+Revision ID: 8d2f4a6c1e90
+Revises: 3b7c9e1a2d4f
+Create Date: 2025-09-29 09:41:07.118342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2f4a6c1e90'
+down_revision = '3b7c9e1a2d4f'
+branch_labels = None
+depends_on = None
+
+TEXT_SEARCH_CONFIG = 'spanish_unaccent'
+
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(full_name, '')), 'A') || "
+    f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(bio, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # Spanish configuration with accent folding; an explicit configuration keeps
+    # to_tsvector immutable so it can back a generated column
+    op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{TEXT_SEARCH_CONFIG}') THEN
+                CREATE TEXT SEARCH CONFIGURATION {TEXT_SEARCH_CONFIG} (COPY = spanish);
+                ALTER TEXT SEARCH CONFIGURATION {TEXT_SEARCH_CONFIG}
+                    ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+            END IF;
+        END
+        $$
+    """)
+
+    # A stored generated column is computed for every existing row when added,
+    # which backfills the search vector in the same statement
+    op.add_column('professionals',
+                  sa.Column('search_vector', postgresql.TSVECTOR(),
+                            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+                            nullable=True))
+    op.create_index('ix_professionals_search_vector', 'professionals', ['search_vector'],
+                    postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_professionals_search_vector', table_name='professionals')
+    op.drop_column('professionals', 'search_vector')
+    op.execute(f'DROP TEXT SEARCH CONFIGURATION IF EXISTS {TEXT_SEARCH_CONFIG}')
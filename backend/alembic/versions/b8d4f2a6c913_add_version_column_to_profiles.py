@@ -0,0 +1,29 @@
+"""add version column to professionals and users
+
+Revision ID: b8d4f2a6c913
+Revises: 7a3e5c1f9b24
+Create Date: 2025-10-03 11:26:04.917635
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8d4f2a6c913'
+down_revision = '7a3e5c1f9b24'
+branch_labels = None
+depends_on = None
+
+PROFILE_TABLES = ['professionals', 'users']
+
+
+def upgrade() -> None:
+    # Optimistic concurrency counter (mapper version_id_col); existing rows start at 1
+    for table in PROFILE_TABLES:
+        op.add_column(table, sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+
+def downgrade() -> None:
+    for table in PROFILE_TABLES:
+        op.drop_column(table, 'version')
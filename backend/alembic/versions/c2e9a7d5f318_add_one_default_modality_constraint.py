@@ -0,0 +1,49 @@
+"""add one-default-modality constraint on professional modalities
+
+Revision ID: c2e9a7d5f318
+Revises: b8d4f2a6c913
+Create Date: 2025-10-03 15:48:52.204716
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2e9a7d5f318'
+down_revision = 'b8d4f2a6c913'
+branch_labels = None
+depends_on = None
+
+CONSTRAINT_NAME = 'ex_professional_modalities_one_default'
+
+# Professionals with several defaults keep the oldest one
+CLEAR_EXTRA_DEFAULTS = """
+UPDATE professional_modalities AS extra
+SET is_default = false
+WHERE extra.is_default
+AND EXISTS (
+    SELECT 1 FROM professional_modalities AS kept
+    WHERE kept.professional_id = extra.professional_id
+    AND kept.is_default
+    AND (kept.created_at, kept.id) < (extra.created_at, extra.id)
+)
+"""
+
+
+def upgrade() -> None:
+    op.execute(CLEAR_EXTRA_DEFAULTS)
+    # A unique partial index on professional_id WHERE is_default, checked at the end of each
+    # statement (not per row) so a single UPDATE can move the default
+    op.create_exclude_constraint(
+        CONSTRAINT_NAME,
+        'professional_modalities',
+        ('professional_id', '='),
+        where='is_default',
+        using='btree',
+        deferrable=True,
+        initially='IMMEDIATE',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(CONSTRAINT_NAME, 'professional_modalities')
@@ -0,0 +1,28 @@
+"""add GIN indexes on professional array columns
+
+Revision ID: c41e7b9d2a35
+Revises: 8d2f4a6c1e90
+Create Date: 2025-09-30 16:05:52.640917
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41e7b9d2a35'
+down_revision = '8d2f4a6c1e90'
+branch_labels = None
+depends_on = None
+
+ARRAY_COLUMNS = ['specialty_ids', 'therapy_approaches_ids', 'languages']
+
+
+def upgrade() -> None:
+    # GIN indexes serve the containment (@>) and overlap (&&) filters
+    for column in ARRAY_COLUMNS:
+        op.create_index(f'ix_professionals_{column}', 'professionals', [column], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    for column in ARRAY_COLUMNS:
+        op.drop_index(f'ix_professionals_{column}', table_name='professionals')
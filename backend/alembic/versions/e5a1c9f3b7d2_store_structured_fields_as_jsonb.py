@@ -0,0 +1,55 @@
+"""store structured professional and user fields as JSONB
+
+Revision ID: e5a1c9f3b7d2
+Revises: c41e7b9d2a35
+Create Date: 2025-10-01 10:12:41.308214
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a1c9f3b7d2'
+down_revision = 'c41e7b9d2a35'
+branch_labels = None
+depends_on = None
+
+JSONB_COLUMNS = {
+    'professionals': ['academic_experience', 'work_experience', 'certifications', 'working_hours'],
+    'users': ['preferences'],
+}
+
+# Existing values are JSON text; anything unparsable (the API served it as an empty value) becomes NULL
+CREATE_TRY_JSONB = """
+CREATE FUNCTION pg_temp.try_jsonb(value text) RETURNS jsonb AS $$
+BEGIN
+    RETURN value::jsonb;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE
+"""
+
+
+def upgrade() -> None:
+    op.execute(CREATE_TRY_JSONB)
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.execute(
+                f'ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING pg_temp.try_jsonb({column})'
+            )
+    # Containment queries on certifications, e.g. certifications @> '[{"name": "..."}]'
+    op.create_index(
+        'ix_professionals_certifications',
+        'professionals',
+        ['certifications'],
+        postgresql_using='gin',
+        postgresql_ops={'certifications': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_professionals_certifications', table_name='professionals')
+    for table, columns in JSONB_COLUMNS.items():
+        for column in columns:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE text USING {column}::text')
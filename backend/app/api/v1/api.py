@@ -6,6 +6,7 @@ from fastapi import APIRouter
 
 from app.api.v1.endpoints import (
     auth,
+    catalog,
     files,
     modalities,
     professional_modalities,
@@ -16,14 +17,16 @@ from app.api.v1.endpoints import (
     therapeutic_approaches,
     users,
 )
+from app.core.responses import default_response_class
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=default_response_class())
 
 # Include all endpoint routers
 api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(professionals.router, prefix="/professionals", tags=["professionals"])
 api_router.include_router(files.router, prefix="/files", tags=["files"])
+api_router.include_router(catalog.router, prefix="/catalog", tags=["catalog"])
 
 # Legacy endpoints (keep for backward compatibility)
 api_router.include_router(specialties.router, prefix="/specialties", tags=["specialties"])
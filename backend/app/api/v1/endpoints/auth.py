@@ -3,9 +3,9 @@ Authentication endpoints.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.core.security import create_token_response, verify_token
 from app.utils.auth import get_current_user_id
 from app.schemas.auth import (
@@ -23,7 +23,8 @@ from app.schemas.professional import (
     ProfessionalResponse,
 )
 from app.schemas.user import UserCreate, UserResponse
-from app.services.auth_service import AuthService
+from app.services.auth_service import AsyncAuthService
+from app.services.catalog_cache import get_catalog_snapshot
 
 router = APIRouter()
 
@@ -34,10 +35,10 @@ INVALID_REFRESH_TOKEN_MESSAGE = "Invalid refresh token"
 
 
 @router.post("/register/user", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register_user(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new user."""
-    auth_service = AuthService(db)
-    user = auth_service.create_user(user_data)
+    auth_service = AsyncAuthService(db)
+    user = await auth_service.create_user(user_data)
     return user
 
 
@@ -46,18 +47,18 @@ async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
     response_model=ProfessionalResponse,
     status_code=status.HTTP_201_CREATED,
 )
-async def register_professional(professional_data: ProfessionalCreate, db: Session = Depends(get_db)):
+async def register_professional(professional_data: ProfessionalCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new professional."""
-    auth_service = AuthService(db)
-    professional = auth_service.create_professional(professional_data)
+    auth_service = AsyncAuthService(db)
+    professional = await auth_service.create_professional(professional_data)
     return professional
 
 
 @router.post("/login/user", response_model=UserTokenResponse)
-async def login_user(user_login: UserLogin, db: Session = Depends(get_db)):
+async def login_user(user_login: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """Login user."""
-    auth_service = AuthService(db)
-    user = auth_service.authenticate_user(user_login.email, user_login.password)
+    auth_service = AsyncAuthService(db)
+    user = await auth_service.authenticate_user(user_login.email, user_login.password)
 
     if not user:
         raise HTTPException(
@@ -79,10 +80,10 @@ async def login_user(user_login: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.post("/login/professional", response_model=ProfessionalTokenResponse)
-async def login_professional(professional_login: ProfessionalLogin, db: Session = Depends(get_db)):
+async def login_professional(professional_login: ProfessionalLogin, db: AsyncSession = Depends(get_async_db)):
     """Login professional."""
-    auth_service = AuthService(db)
-    professional = auth_service.authenticate_professional(professional_login.email, professional_login.password)
+    auth_service = AsyncAuthService(db)
+    professional = await auth_service.authenticate_professional(professional_login.email, professional_login.password)
 
     if not professional:
         raise HTTPException(
@@ -103,13 +104,13 @@ async def login_professional(professional_login: ProfessionalLogin, db: Session
     )
 
 
-@router.post("/login", response_model=UnifiedLoginResponse)
-async def login_unified(login_data: UnifiedLogin, db: Session = Depends(get_db)):
+@router.post("/login", response_model=UnifiedLoginResponse, dependencies=[Depends(get_catalog_snapshot)])
+async def login_unified(login_data: UnifiedLogin, db: AsyncSession = Depends(get_async_db)):
     """Unified login for both users and professionals."""
-    auth_service = AuthService(db)
+    auth_service = AsyncAuthService(db)
 
     # Try to authenticate as professional first
-    professional = auth_service.authenticate_professional(login_data.email, login_data.password)
+    professional = await auth_service.authenticate_professional(login_data.email, login_data.password)
     if professional and professional.is_active:
         token_response = create_token_response(str(professional.id))
 
@@ -127,7 +128,7 @@ async def login_unified(login_data: UnifiedLogin, db: Session = Depends(get_db))
         )
 
     # Try to authenticate as regular user
-    user = auth_service.authenticate_user(login_data.email, login_data.password)
+    user = await auth_service.authenticate_user(login_data.email, login_data.password)
     if user and user.is_active:
         token_response = create_token_response(str(user.id))
 
@@ -153,22 +154,24 @@ async def login_unified(login_data: UnifiedLogin, db: Session = Depends(get_db))
 
 
 @router.post("/simulate-verification")
-async def simulate_email_verification(user_id: str = Depends(get_current_user_id), db: Session = Depends(get_db)):
+async def simulate_email_verification(
+    user_id: str = Depends(get_current_user_id), db: AsyncSession = Depends(get_async_db)
+):
     """Simulate email verification for development purposes."""
-    auth_service = AuthService(db)
+    auth_service = AsyncAuthService(db)
 
     # Try to update user first
-    user = auth_service.get_user_by_id(user_id)
+    user = await auth_service.get_user_by_id(user_id)
     if user:
         user.is_verified = True
-        db.commit()
+        await db.commit()
         return {"message": "User email verification simulated", "user_type": "user"}
 
     # Try to update professional
-    professional = auth_service.get_professional_by_id(user_id)
+    professional = await auth_service.get_professional_by_id(user_id)
     if professional:
         professional.is_verified = True
-        db.commit()
+        await db.commit()
         return {
             "message": "Professional email verification simulated",
             "user_type": "professional",
@@ -178,7 +181,7 @@ async def simulate_email_verification(user_id: str = Depends(get_current_user_id
 
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(refresh_data: RefreshToken, _db: Session = Depends(get_db)):
+async def refresh_token(refresh_data: RefreshToken, _db: AsyncSession = Depends(get_async_db)):
     """Refresh access token."""
     user_id = verify_token(refresh_data.refresh_token)
 
@@ -193,17 +196,19 @@ async def refresh_token(refresh_data: RefreshToken, _db: Session = Depends(get_d
 
 
 @router.get("/me")
-async def get_current_user_info(current_user_id: str = Depends(get_current_user_id), db: Session = Depends(get_db)):
+async def get_current_user_info(
+    current_user_id: str = Depends(get_current_user_id), db: AsyncSession = Depends(get_async_db)
+):
     """Get current user information."""
-    auth_service = AuthService(db)
+    auth_service = AsyncAuthService(db)
 
     # Try to get as user first
-    user = auth_service.get_user_by_id(current_user_id)
+    user = await auth_service.get_user_by_id(current_user_id)
     if user:
         return {"type": "user", "data": user}
 
     # Try to get as professional
-    professional = auth_service.get_professional_by_id(current_user_id)
+    professional = await auth_service.get_professional_by_id(current_user_id)
     if professional:
         return {"type": "professional", "data": professional}
 
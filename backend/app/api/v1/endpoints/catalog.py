@@ -0,0 +1,34 @@
+"""
+Catalog lookup endpoints spanning specialties, therapeutic approaches and modalities.
+"""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+from app.schemas.catalog import CATALOG_NAMES_LIMIT, CatalogNamesResponse
+from app.services.catalog_cache import get_catalog_cache
+
+router = APIRouter()
+
+# Error messages
+CATALOG_NAMES_LIMIT_MESSAGE = f"At most {CATALOG_NAMES_LIMIT} IDs can be resolved at once"
+
+
+@router.get("/names", response_model=CatalogNamesResponse)
+async def get_catalog_names_by_id(
+    ids: List[str] = Query(..., description="Catalog IDs of any kind, comma-separated or repeated"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Resolve specialty, therapeutic approach and modality IDs to names in one request.
+
+    Names come from an in-memory snapshot of the catalogs; IDs found in none of them are
+    listed in ``missing_ids``.
+    """
+    catalog_ids = list(dict.fromkeys(value.strip() for chunk in ids for value in chunk.split(",") if value.strip()))
+    if len(catalog_ids) > CATALOG_NAMES_LIMIT:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=CATALOG_NAMES_LIMIT_MESSAGE)
+    snapshot = await get_catalog_cache().snapshot(db)
+    return snapshot.resolve(catalog_ids)
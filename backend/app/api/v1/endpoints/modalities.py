@@ -1,36 +1,49 @@
 """Endpoints for managing intervention modalities."""
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.utils.auth import get_current_user_id
-from app.core.database import get_db
-from app.models.modality import Modality
+from app.core.database import get_async_db
 from app.schemas.modality import ModalityCreate, ModalityResponse, ModalityUpdate
+from app.services.catalog_cache import MODALITIES, get_catalog_cache
+from app.services.modality_service import AsyncModalityService
+from app.utils.http_cache import catalog_conditional_request
+from app.utils.pagination import NEXT_CURSOR_HEADER, Cursor, get_cursor, next_cursor
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(catalog_conditional_request(MODALITIES))])
 
 # Error messages
 MODALITY_NOT_FOUND_MESSAGE = "Modality not found"
 
 
 @router.get("/", response_model=List[ModalityResponse])
-async def get_modalities(db: Session = Depends(get_db)):
-    """Get all active modalities."""
-    modalities = db.query(Modality).filter(Modality.is_active).all()
+async def get_modalities(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get all active modalities. Without a limit the full list is returned."""
+    service = AsyncModalityService(db, catalog=get_catalog_cache())
+    modalities = await service.get_active_modalities(limit=limit, cursor=cursor)
+    token = next_cursor(modalities, limit)
+    if token:
+        response.headers[NEXT_CURSOR_HEADER] = token
     return modalities
 
 
 @router.get("/{modality_id}", response_model=ModalityResponse)
 async def get_modality(
     modality_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user_id: str = Depends(get_current_user_id),  # auth enforced, value not used
 ):
     """Get a specific modality by ID."""
-    modality = db.query(Modality).filter(Modality.id == modality_id).first()
+    service = AsyncModalityService(db, catalog=get_catalog_cache())
+    modality = await service.get_modality(modality_id)
     if not modality:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=MODALITY_NOT_FOUND_MESSAGE)
     return modality
@@ -39,57 +52,45 @@ async def get_modality(
 @router.post("/", response_model=ModalityResponse)
 async def create_modality(
     modality: ModalityCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user_id: str = Depends(get_current_user_id),
 ):
     """Create a new modality."""
+    service = AsyncModalityService(db)
     # Check if modality with same name already exists
-    existing_modality = db.query(Modality).filter(Modality.name == modality.name).first()
+    existing_modality = await service.get_modality_by_name(modality.name)
     if existing_modality:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Modality with this name already exists",
         )
 
-    db_modality = Modality(**modality.dict())
-    db.add(db_modality)
-    db.commit()
-    db.refresh(db_modality)
-    return db_modality
+    return await service.create_modality(modality)
 
 
 @router.put("/{modality_id}", response_model=ModalityResponse)
 async def update_modality(
     modality_id: str,
     modality_update: ModalityUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user_id: str = Depends(get_current_user_id),
 ):
     """Update a modality."""
-    modality = db.query(Modality).filter(Modality.id == modality_id).first()
+    service = AsyncModalityService(db)
+    modality = await service.update_modality(modality_id, modality_update)
     if not modality:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=MODALITY_NOT_FOUND_MESSAGE)
-
-    update_data = modality_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(modality, field, value)
-
-    db.commit()
-    db.refresh(modality)
     return modality
 
 
 @router.delete("/{modality_id}")
 async def delete_modality(
     modality_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _user_id: str = Depends(get_current_user_id),
 ):
     """Delete a modality (soft delete by setting is_active to False)."""
-    modality = db.query(Modality).filter(Modality.id == modality_id).first()
-    if not modality:
+    service = AsyncModalityService(db)
+    if not await service.deactivate_modality(modality_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=MODALITY_NOT_FOUND_MESSAGE)
-
-    modality.is_active = False
-    db.commit()
     return {"message": "Modality deleted successfully"}
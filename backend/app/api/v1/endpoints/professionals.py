@@ -2,144 +2,520 @@
 Professional endpoints.
 """
 
-import json
 import uuid
-from typing import List
+from typing import FrozenSet, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.utils.auth import get_current_user_id
-from app.core.database import get_db
+from app.core.database import get_async_db, get_async_session_factory
 from app.models.professional import Professional
 from app.models.professional_modality import ProfessionalModality
-from app.schemas.professional import ProfessionalResponse, ProfessionalUpdate
-from app.services.auth_service import AuthService
-from app.utils.parsers import parse_professional_data
-
-router = APIRouter()
+from app.models.professional_specialty import ProfessionalSpecialty
+from app.models.specialty import Specialty
+from app.schemas.professional import (
+    PROFESSIONAL_BATCH_LIMIT,
+    ArrayMatch,
+    ProfessionalBatchFieldsResponse,
+    ProfessionalBatchRequest,
+    ProfessionalBatchResponse,
+    ProfessionalCard,
+    ProfessionalResponse,
+    ProfessionalSearchFieldsResponse,
+    ProfessionalSearchFilters,
+    ProfessionalSearchResponse,
+    ProfessionalUpdate,
+)
+from app.services.auth_service import AsyncAuthService
+from app.services.catalog_cache import get_catalog_snapshot
+from app.services.professional_card_service import AsyncProfessionalCardService
+from app.services.professional_cache import CachedResponse, get_professional_cache
+from app.services.professional_changes import publish_professional_changes
+from app.services.professional_export_service import (
+    EXPORT_MEDIA_TYPES,
+    AsyncProfessionalExportService,
+    ExportFormat,
+)
+from app.services.professional_index import get_professional_index
+from app.services.professional_search_service import (
+    TEXT_FILTER,
+    AsyncProfessionalSearchService,
+    build_search_criteria,
+)
+from app.services.professional_service import (
+    MAX_PAGE_SIZE,
+    AsyncProfessionalService,
+    professional_relationship_loaders,
+)
+from app.utils.http_cache import (
+    PRECONDITION_FAILED_MESSAGE,
+    check_if_match,
+    conditional_response,
+    make_etag,
+    professional_validators,
+    professionals_etag,
+    validator_headers,
+    version_etag,
+)
+from app.utils.pagination import NEXT_CURSOR_HEADER, Cursor, get_cursor, next_cursor
+from app.utils.parsers import parse_professional_data, professional_json, professionals_json
+
+# Serialized professionals read their specialties from the catalog snapshot
+router = APIRouter(dependencies=[Depends(get_catalog_snapshot)])
 
 # Constants
 PROFESSIONAL_NOT_FOUND_MESSAGE = "Professional not found"
+TEXT_SEARCH_CURSOR_MESSAGE = "Cursor pagination is not available for text search, use skip"
+UNKNOWN_FIELDS_MESSAGE = "Unknown fields: {fields}"
+INVALID_ID_MESSAGE = "Invalid ID format"
+BATCH_LIMIT_MESSAGE = f"At most {PROFESSIONAL_BATCH_LIMIT} IDs can be looked up at once"
 
 # Fields that require special handling
-JSON_FIELDS = ["academic_experience", "work_experience", "certifications"]
 SPECIAL_FIELDS = ["specialty_ids", "therapy_approaches_ids", "modalities"]
 
+# Fields that can be requested with ?fields=
+PROFESSIONAL_FIELDS = frozenset(ProfessionalResponse.model_fields)
+
+# Responses are serialized straight to JSON bytes; the response models document them
+PROFESSIONAL_CARD_LIST_ADAPTER = TypeAdapter(List[ProfessionalCard])
+
+
+def get_professional_fields(
+    fields: Optional[str] = Query(None, description="Comma-separated response fields, e.g. id,full_name,rate_cents"),
+) -> Optional[FrozenSet[str]]:
+    """FastAPI dependency parsing the optional sparse fieldset; ``id`` is always included."""
+    if not fields:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - PROFESSIONAL_FIELDS
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=UNKNOWN_FIELDS_MESSAGE.format(fields=", ".join(sorted(unknown))),
+        )
+    return frozenset(requested | {"id"})
+
+
+def _json_response(body: bytes, headers: Optional[dict] = None) -> Response:
+    """Response for a body already serialized to JSON, bypassing response model validation."""
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def get_search_filters(
+    q: Optional[str] = Query(None, min_length=1, max_length=200),
+    specialty_ids: List[str] = Query([]),
+    specialty_ids_match: ArrayMatch = "any",
+    therapy_approaches_ids: List[str] = Query([]),
+    therapy_approaches_ids_match: ArrayMatch = "any",
+    languages: List[str] = Query([]),
+    languages_match: ArrayMatch = "any",
+    modality_ids: List[uuid.UUID] = Query([]),
+    min_price_cents: Optional[int] = Query(None, ge=0),
+    max_price_cents: Optional[int] = Query(None, ge=0),
+    is_verified: Optional[bool] = None,
+) -> ProfessionalSearchFilters:
+    """Collect the multi-valued professional filters from the query string.
+
+    Repeat a parameter to select several values; ``*_match=all`` requires every value
+    instead of any of them.
+    """
+    return ProfessionalSearchFilters(
+        text=q,
+        specialty_ids=specialty_ids,
+        specialty_ids_match=specialty_ids_match,
+        therapy_approaches_ids=therapy_approaches_ids,
+        therapy_approaches_ids_match=therapy_approaches_ids_match,
+        languages=languages,
+        languages_match=languages_match,
+        modality_ids=modality_ids,
+        min_price_cents=min_price_cents,
+        max_price_cents=max_price_cents,
+        is_verified=is_verified,
+    )
+
 
 @router.get("/", response_model=List[ProfessionalResponse])
 async def get_professionals(
     *,
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    search_filters: ProfessionalSearchFilters = Depends(get_search_filters),
+    fields: Optional[FrozenSet[str]] = Depends(get_professional_fields),
     specialty: str = None,
     min_rate_cents: int = None,
     max_rate_cents: int = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Get all active professionals with optional filtering."""
-    query = db.query(Professional).filter(Professional.is_active)
+    """Get all active professionals with optional filtering.
+
+    Pass the X-Next-Cursor response header back as ``cursor`` to fetch the next page.
+    With ``q``, only professionals whose name or bio match are returned, ranked by relevance.
+    With ``fields``, only those fields are loaded and returned.
+    Supports conditional requests (If-None-Match).
+    """
+    q = search_filters.text
+    _check_text_search_cursor(q, cursor)
+    cache = get_professional_cache()
+    cache_key = None
+    if cache:
+        cache_key, cached = await cache.cached_list(request.query_params.multi_items())
+        if cached:
+            return cached.to_response(request)
+
+    service = AsyncProfessionalService(db)
+    filters = _professional_filters(specialty, min_rate_cents, max_rate_cents)
+    criteria = build_search_criteria(search_filters)
+    filters.extend(criterion for name, criterion in criteria.items() if name != TEXT_FILTER)
+    professionals = await service.get_professionals(
+        skip=skip, limit=limit, filters=filters, cursor=cursor, text=q, fields=fields
+    )
+    _set_next_cursor(response, professionals, limit, q)
+
+    # Short-circuit before serialization when the client copy is current
+    etag = professionals_etag(professionals, fields)
+    if not cache_key:
+        not_modified = conditional_response(request, response, etag)
+        if not_modified:
+            return not_modified
+
+    headers = {**validator_headers(etag), **_next_cursor_headers(response)}
+    entry = CachedResponse(professionals_json(professionals, fields), headers)
+    if cache_key:
+        await cache.store(cache_key, entry)
+    return entry.to_response(request)
+
+
+def _check_text_search_cursor(q: Optional[str], cursor: Optional[Cursor]) -> None:
+    """Ranked results are not ordered by the keyset, so they can only be paged with skip."""
+    if q and cursor is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=TEXT_SEARCH_CURSOR_MESSAGE)
+
+
+def _set_next_cursor(response: Response, professionals: list, limit: int, q: Optional[str]) -> None:
+    """Expose the next page cursor, unless the page is ranked by text relevance."""
+    token = None if q else next_cursor(professionals, limit)
+    if token:
+        response.headers[NEXT_CURSOR_HEADER] = token
+
+
+def _next_cursor_headers(response: Response) -> dict:
+    """Next page cursor set by _set_next_cursor, for responses built outside ``response``."""
+    if NEXT_CURSOR_HEADER in response.headers:
+        return {NEXT_CURSOR_HEADER: response.headers[NEXT_CURSOR_HEADER]}
+    return {}
+
+
+def _professional_filters(specialty, min_rate_cents, max_rate_cents) -> list:
+    """Build the filtering criteria for the professionals query."""
+    filters = []
+    # Filter by specialty name if provided
+    if specialty:
+        filters.append(
+            Professional.professional_specialties.any(
+                ProfessionalSpecialty.specialty.has(Specialty.name.ilike(f"%{specialty}%"))
+            )
+        )
+
+    # Filter by rate range if provided
+    if min_rate_cents is not None:
+        filters.append(Professional.rate_cents >= min_rate_cents)
+
+    if max_rate_cents is not None:
+        filters.append(Professional.rate_cents <= max_rate_cents)
+
+    return filters
 
-    # Apply filters
-    query = _apply_professional_filters(query, specialty, min_rate_cents, max_rate_cents)
 
-    professionals = query.offset(skip).limit(limit).all()
+@router.get("/search", response_model=ProfessionalSearchResponse)
+async def search_professionals(
+    *,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    filters: ProfessionalSearchFilters = Depends(get_search_filters),
+    fields: Optional[FrozenSet[str]] = Depends(get_professional_fields),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Search active professionals with multi-valued filters and per-facet counts.
+
+    Values within a facet are OR-ed (or AND-ed with ``*_match=all``), facets are AND-ed.
+    With ``q``, results are ranked by name/bio relevance. With ``fields``, items only
+    carry those fields.
+    """
+    _check_text_search_cursor(filters.text, cursor)
+    service = AsyncProfessionalSearchService(db, index=get_professional_index())
+    result = await service.search(filters, skip=skip, limit=limit, cursor=cursor, fields=fields)
+    _set_next_cursor(response, result.items, limit, filters.text)
+
+    data = {
+        "items": [parse_professional_data(professional, fields) for professional in result.items],
+        "total": result.total,
+        "facets": result.facets,
+    }
+    model = ProfessionalSearchResponse if fields is None else ProfessionalSearchFieldsResponse
+    body = model.model_validate(data).model_dump_json(exclude_unset=fields is not None)
+    return _json_response(body, _next_cursor_headers(response))
+
+
+@router.get("/cards", response_model=List[ProfessionalCard])
+async def get_professional_cards(
+    *,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    search_filters: ProfessionalSearchFilters = Depends(get_search_filters),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get compact cards of active professionals for the directory grid.
+
+    Takes the same filters, ordering and pagination as the listing, but only reads the
+    columns a card shows, in a single statement.
+    """
+    q = search_filters.text
+    _check_text_search_cursor(q, cursor)
+    criteria = build_search_criteria(search_filters)
+    filters = [criterion for name, criterion in criteria.items() if name != TEXT_FILTER]
+    cards = await AsyncProfessionalCardService(db).get_cards(
+        skip=skip, limit=limit, filters=filters, cursor=cursor, text=q
+    )
+    _set_next_cursor(response, cards, limit, q)
+
+    body = PROFESSIONAL_CARD_LIST_ADAPTER.dump_json(PROFESSIONAL_CARD_LIST_ADAPTER.validate_python(cards))
+    return _json_response(body, _next_cursor_headers(response))
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_professionals(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    search_filters: ProfessionalSearchFilters = Depends(get_search_filters),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
+):
+    """Stream every active professional matching the filters as NDJSON or CSV.
 
-    # Parse JSON fields for each professional
-    return [parse_professional_data(professional) for professional in professionals]
+    Includes specialty, therapeutic approach and modality names. Memory use is constant
+    whatever the number of professionals.
+    """
+    filters = list(build_search_criteria(search_filters).values())
 
+    async def chunks():
+        # The request session is closed before the body is streamed, so the export opens its own
+        async with session_factory() as db:
+            async for chunk in AsyncProfessionalExportService(db).export(export_format, filters):
+                yield chunk
 
-def _apply_professional_filters(query, specialty, min_rate_cents, max_rate_cents):
-    """Apply filtering parameters to the professionals query."""
-    # Filter by specialty if provided
-    if specialty:
-        query = query.filter(Professional.specialty.ilike(f"%{specialty}%"))
+    return StreamingResponse(
+        chunks(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="professionals.{export_format}"'},
+    )
 
-    # Filter by rate range if provided
-    if min_rate_cents is not None:
-        query = query.filter(Professional.rate_cents >= min_rate_cents)
 
-    if max_rate_cents is not None:
-        query = query.filter(Professional.rate_cents <= max_rate_cents)
+def _batch_ids(ids: List[str]) -> List[uuid.UUID]:
+    """Parse comma-separated and/or repeated ``ids`` values, dropping duplicates but keeping order."""
+    try:
+        professional_ids = [uuid.UUID(value.strip()) for chunk in ids for value in chunk.split(",") if value.strip()]
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=INVALID_ID_MESSAGE) from exc
+    professional_ids = list(dict.fromkeys(professional_ids))
+    if not professional_ids:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=INVALID_ID_MESSAGE)
+    if len(professional_ids) > PROFESSIONAL_BATCH_LIMIT:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=BATCH_LIMIT_MESSAGE)
+    return professional_ids
+
+
+async def _get_professionals_batch(
+    professional_ids: List[uuid.UUID], fields: Optional[FrozenSet[str]], db: AsyncSession
+) -> tuple[list, list, bytes]:
+    """Professionals found with the given IDs (in that order), the missing IDs and the serialized response."""
+    service = AsyncProfessionalService(db)
+    professionals = await service.get_active_professionals_by_ids(professional_ids, fields)
+    found = {professional.id for professional in professionals}
+    missing_ids = [professional_id for professional_id in professional_ids if professional_id not in found]
+
+    data = {
+        "items": [parse_professional_data(professional, fields) for professional in professionals],
+        "missing_ids": missing_ids,
+    }
+    model = ProfessionalBatchResponse if fields is None else ProfessionalBatchFieldsResponse
+    return professionals, missing_ids, model.model_validate(data).model_dump_json(exclude_unset=fields is not None)
+
+
+@router.get("/batch", response_model=ProfessionalBatchResponse)
+async def get_professionals_batch(
+    request: Request,
+    response: Response,
+    ids: List[str] = Query(..., description="Professional IDs, comma-separated or repeated"),
+    fields: Optional[FrozenSet[str]] = Depends(get_professional_fields),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get many active professionals by ID in one request, or only the given ``fields`` of them.
+
+    Items follow the order of ``ids`` (at most PROFESSIONAL_BATCH_LIMIT of them); unknown or
+    inactive IDs are listed in ``missing_ids``.
+    Supports conditional requests (If-None-Match).
+    """
+    professional_ids = _batch_ids(ids)
+    professionals, missing_ids, body = await _get_professionals_batch(professional_ids, fields, db)
+
+    etag = professionals_etag(professionals, fields)
+    if missing_ids:
+        etag = make_etag([etag, *missing_ids])
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
+    return _json_response(body, validator_headers(etag))
+
+
+@router.post("/batch", response_model=ProfessionalBatchResponse)
+async def post_professionals_batch(
+    batch: ProfessionalBatchRequest,
+    fields: Optional[FrozenSet[str]] = Depends(get_professional_fields),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get many active professionals by ID, for ID lists too long for a query string.
 
-    return query
+    Behaves like ``GET /professionals/batch``, without conditional requests.
+    """
+    _, _, body = await _get_professionals_batch(list(dict.fromkeys(batch.ids)), fields, db)
+    return _json_response(body)
 
 
 @router.get("/{professional_id}", response_model=ProfessionalResponse)
-async def get_professional(professional_id: str, db: Session = Depends(get_db)):
-    """Get professional by ID."""
+async def get_professional(
+    professional_id: str,
+    request: Request,
+    response: Response,
+    fields: Optional[FrozenSet[str]] = Depends(get_professional_fields),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get professional by ID, or only the given ``fields`` of it.
+
+    Supports conditional requests (If-None-Match / If-Modified-Since).
+    """
     try:
         professional_uuid = uuid.UUID(professional_id)
     except ValueError as exc:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid ID format") from exc
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=INVALID_ID_MESSAGE) from exc
 
-    professional = db.query(Professional).filter(Professional.id == professional_uuid, Professional.is_active).first()
+    cache = get_professional_cache()
+    cache_key = None
+    if cache:
+        cache_key, cached = await cache.cached_detail(professional_uuid, fields)
+        if cached:
+            return cached.to_response(request)
+
+    service = AsyncProfessionalService(db)
+    professional = await service.get_active_professional_by_id(professional_uuid, fields)
 
     if not professional:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=PROFESSIONAL_NOT_FOUND_MESSAGE)
 
-    return parse_professional_data(professional)
+    etag, last_modified = professional_validators(professional, fields)
+    if not cache_key:
+        not_modified = conditional_response(request, response, etag, last_modified)
+        if not_modified:
+            return not_modified
+
+    entry = CachedResponse(professional_json(professional, fields), validator_headers(etag, last_modified))
+    if cache_key:
+        await cache.store(cache_key, entry)
+    return entry.to_response(request)
 
 
 @router.get("/me/profile", response_model=ProfessionalResponse)
 async def get_current_professional(
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get current professional profile."""
-    auth_service = AuthService(db)
-    professional = auth_service.get_professional_by_id(current_user_id)
+    auth_service = AsyncAuthService(db)
+    professional = await auth_service.get_professional_by_id(current_user_id)
 
     if not professional:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=PROFESSIONAL_NOT_FOUND_MESSAGE)
 
-    return parse_professional_data(professional)
+    # Sent back in If-Match when saving, see update_current_professional
+    return _json_response(professional_json(professional), {"ETag": version_etag(professional)})
 
 
-def _update_json_fields(professional: Professional, update_data: dict) -> None:
-    """Update JSON fields in the professional model."""
-    for field in JSON_FIELDS:
-        if field in update_data:
-            setattr(professional, field, json.dumps(update_data[field]))
+def _modality_values(modality_data: dict) -> dict:
+    """Column values of a professional modality from its PUT /me payload."""
+    return {
+        "modality_name": modality_data["modalityName"],
+        "virtual_price": modality_data["virtualPrice"],
+        "presencial_price": modality_data.get("presencialPrice", 0),
+        "offers_presencial": modality_data.get("offersPresencial", False),
+        "description": modality_data.get("description"),
+        "is_default": modality_data.get("isDefault", False),
+        "is_active": True,
+    }
 
 
-def _update_modalities(professional: Professional, update_data: dict, db: Session) -> None:
-    """Update professional modalities relationship."""
-    if "modalities" not in update_data:
-        return
-
-    print(f"DEBUG: Processing modalities data: {update_data['modalities']}")
-
-    # Remove existing modalities
-    db.query(ProfessionalModality).filter(ProfessionalModality.professional_id == professional.id).delete()
-
-    # Add new modalities
-    for modality_data in update_data["modalities"]:
-        print(f"DEBUG: Creating modality with data: {modality_data}")
-        new_modality = ProfessionalModality(
-            professional_id=professional.id,
-            modality_id=uuid.UUID(modality_data["modalityId"]),
-            modality_name=modality_data["modalityName"],
-            virtual_price=modality_data["virtualPrice"],
-            presencial_price=modality_data.get("presencialPrice", 0),
-            offers_presencial=modality_data.get("offersPresencial", False),
-            description=modality_data.get("description"),
-            is_default=modality_data.get("isDefault", False),
-        )
-        db.add(new_modality)
-        print(f"DEBUG: Added modality to database: {new_modality}")
+async def _update_modalities(professional: Professional, update_data: dict, db: AsyncSession) -> bool:
+    """Update professional modalities relationship.
 
-    # Flush to ensure the modalities are saved before commit
-    db.flush()
-    print(f"DEBUG: Flushed {len(update_data['modalities'])} modalities to database")
+    Incoming modalities are matched to the stored rows by modalityId, and only the difference is
+    written, with at most one bulk DELETE, UPDATE and INSERT. Kept rows keep their IDs; nothing is
+    written when the payload matches what is stored. Returns whether anything was written.
+    """
+    if "modalities" not in update_data:
+        return False
+
+    stored = {}
+    removed_ids = []
+    for row in professional.professional_modalities:
+        if row.modality_id in stored:
+            removed_ids.append(row.id)
+        else:
+            stored[row.modality_id] = row
+    incoming = {
+        uuid.UUID(str(modality_data["modalityId"])): _modality_values(modality_data)
+        for modality_data in update_data["modalities"]
+    }
+    # A professional has at most one default modality: the first one flagged wins
+    defaults = [values for values in incoming.values() if values["is_default"]]
+    for values in defaults[1:]:
+        values["is_default"] = False
+
+    removed_ids += [row.id for modality_id, row in stored.items() if modality_id not in incoming]
+    updates = [
+        {"id": stored[modality_id].id, **values}
+        for modality_id, values in incoming.items()
+        if modality_id in stored
+        and any(getattr(stored[modality_id], column) != value for column, value in values.items())
+    ]
+    inserts = [
+        {"professional_id": professional.id, "modality_id": modality_id, **values}
+        for modality_id, values in incoming.items()
+        if modality_id not in stored
+    ]
+
+    if removed_ids:
+        await db.execute(delete(ProfessionalModality).where(ProfessionalModality.id.in_(removed_ids)))
+    if updates:
+        # One row per statement: clear the previous default before setting the new one
+        updates.sort(key=lambda values: values["is_default"])
+        await db.execute(update(ProfessionalModality), updates)
+    if inserts:
+        await db.execute(insert(ProfessionalModality), inserts)
+    return bool(removed_ids or updates or inserts)
 
 
 def _update_other_fields(professional: Professional, update_data: dict) -> None:
     """Update other fields in the professional model."""
-    excluded_fields = JSON_FIELDS + SPECIAL_FIELDS
-
     for field, value in update_data.items():
-        if field not in excluded_fields and hasattr(professional, field):
+        if field not in SPECIAL_FIELDS and hasattr(professional, field):
             # Map hourly_rate_cents to rate_cents
             if field == "hourly_rate_cents":
                 professional.rate_cents = value
@@ -147,51 +523,40 @@ def _update_other_fields(professional: Professional, update_data: dict) -> None:
                 setattr(professional, field, value)
 
 
-def _commit_changes(professional: Professional, db: Session) -> Professional:
-    """Commit changes to database and refresh the professional."""
-    try:
-        print("DEBUG: Committing changes to database...")
-        db.commit()
-        print("DEBUG: Changes committed successfully")
-        db.refresh(professional)
-        print("DEBUG: Professional refreshed from database")
-
-        # Explicitly reload the modalities relationship
-        db.refresh(professional, ["professional_modalities"])
-        modalities_count_after = (
-            len(professional.professional_modalities) if professional.professional_modalities else 0
-        )
-        print(f"DEBUG: After refresh, modalities count: {modalities_count_after}")
-
-        return professional
-    except Exception as exc:  # pylint: disable=broad-exception-caught
-        print(f"DEBUG: Error during commit: {str(exc)}")
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error updating professional: {str(exc)}",
-        ) from exc
+async def _reload_professional(professional_id: uuid.UUID, db: AsyncSession) -> Professional:
+    """Re-select a professional, overwriting stale state and relationships in the identity map."""
+    result = await db.execute(
+        select(Professional)
+        .where(Professional.id == professional_id)
+        .options(*professional_relationship_loaders())
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().one()
 
 
 @router.put("/me", response_model=ProfessionalResponse)
 async def update_current_professional(
     professional_update: ProfessionalUpdate,
+    request: Request,
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Update current professional profile."""
-    auth_service = AuthService(db)
-    professional = auth_service.get_professional_by_id(current_user_id)
+    """Update current professional profile.
+
+    With If-Match (the ETag of GET /me/profile or of a previous save), the update only applies
+    to that version of the profile and fails with 412 otherwise, including when another save
+    commits in between.
+    """
+    auth_service = AsyncAuthService(db)
+    professional = await auth_service.get_professional_by_id(current_user_id)
 
     if not professional:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=PROFESSIONAL_NOT_FOUND_MESSAGE)
+    check_if_match(request, version_etag(professional))
 
     # Update professional fields
     update_data = professional_update.dict(exclude_unset=True)
 
-    # Handle different types of field updates
-    _update_json_fields(professional, update_data)
-
     # Handle specialty_ids - update directly in the professional model
     if "specialty_ids" in update_data:
         professional.specialty_ids = update_data["specialty_ids"]
@@ -201,21 +566,33 @@ async def update_current_professional(
         professional.therapy_approaches_ids = update_data["therapy_approaches_ids"]
 
     # Handle modalities - update professional modalities
-    if "modalities" in update_data:
-        _update_modalities(professional, update_data, db)
+    modalities_changed = await _update_modalities(professional, update_data, db)
+    if modalities_changed:
+        # Modalities are part of the profile: bump its version even when no column changed
+        professional.version += 1
 
     # Update other fields
     for field, value in update_data.items():
-        if field not in SPECIAL_FIELDS and field not in JSON_FIELDS:
+        if field not in SPECIAL_FIELDS:
             setattr(professional, field, value)
 
     try:
-        db.commit()
-        db.refresh(professional)
-        return parse_professional_data(professional)
+        # The UPDATE checks the version read above and returns the new updated_at
+        await db.commit()
+        if modalities_changed:
+            # Modalities are written with bulk statements the flush hooks cannot see
+            publish_professional_changes([professional.id])
+            professional = await _reload_professional(professional.id, db)
+    except StaleDataError as exc:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED, detail=PRECONDITION_FAILED_MESSAGE
+        ) from exc
     except Exception as exc:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error updating professional: {str(exc)}",
         ) from exc
+
+    return _json_response(professional_json(professional), {"ETag": version_etag(professional)})
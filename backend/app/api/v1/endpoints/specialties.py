@@ -2,73 +2,87 @@
 Specialty (new version) endpoints.
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.schemas.specialty import (
     SpecialtyCreate,
     SpecialtyResponse,
     SpecialtyUpdate,
 )
-from app.services.specialty_service import SpecialtyService
+from app.services.catalog_cache import SPECIALTIES, get_catalog_cache
+from app.services.specialty_service import AsyncSpecialtyService
+from app.utils.http_cache import catalog_conditional_request
+from app.utils.pagination import NEXT_CURSOR_HEADER, Cursor, get_cursor, next_cursor
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(catalog_conditional_request(SPECIALTIES))])
 
 # Error messages
 SPECIALTY_NOT_FOUND_MESSAGE = "Specialty not found"
 
 
 @router.get("/", response_model=List[SpecialtyResponse])
-def get_specialties(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def get_specialties(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    db: AsyncSession = Depends(get_async_db),
+):
     """Get all specialties."""
-    service = SpecialtyService(db)
-    specialties = service.get_specialties(skip=skip, limit=limit)
+    service = AsyncSpecialtyService(db, catalog=get_catalog_cache())
+    specialties = await service.get_specialties(skip=skip, limit=limit, cursor=cursor)
+    token = next_cursor(specialties, limit)
+    if token:
+        response.headers[NEXT_CURSOR_HEADER] = token
     return specialties
 
 
 @router.get("/category/{category}", response_model=List[SpecialtyResponse])
-def get_specialties_by_category(category: str, db: Session = Depends(get_db)):
+async def get_specialties_by_category(category: str, db: AsyncSession = Depends(get_async_db)):
     """Get specialties by category."""
-    service = SpecialtyService(db)
-    specialties = service.get_specialties_by_category(category)
+    service = AsyncSpecialtyService(db, catalog=get_catalog_cache())
+    specialties = await service.get_specialties_by_category(category)
     return specialties
 
 
 @router.get("/{specialty_id}", response_model=SpecialtyResponse)
-def get_specialty(specialty_id: str, db: Session = Depends(get_db)):
+async def get_specialty(specialty_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get a specialty by ID."""
-    service = SpecialtyService(db)
-    specialty = service.get_specialty(specialty_id)
+    service = AsyncSpecialtyService(db, catalog=get_catalog_cache())
+    specialty = await service.get_specialty(specialty_id)
     if not specialty:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=SPECIALTY_NOT_FOUND_MESSAGE)
     return specialty
 
 
 @router.post("/", response_model=SpecialtyResponse)
-def create_specialty(specialty: SpecialtyCreate, db: Session = Depends(get_db)):
+async def create_specialty(specialty: SpecialtyCreate, db: AsyncSession = Depends(get_async_db)):
     """Create a new specialty."""
-    service = SpecialtyService(db)
-    return service.create_specialty(specialty)
+    service = AsyncSpecialtyService(db)
+    return await service.create_specialty(specialty)
 
 
 @router.put("/{specialty_id}", response_model=SpecialtyResponse)
-def update_specialty(specialty_id: str, specialty_update: SpecialtyUpdate, db: Session = Depends(get_db)):
+async def update_specialty(
+    specialty_id: str, specialty_update: SpecialtyUpdate, db: AsyncSession = Depends(get_async_db)
+):
     """Update a specialty."""
-    service = SpecialtyService(db)
-    specialty = service.update_specialty(specialty_id, specialty_update)
+    service = AsyncSpecialtyService(db)
+    specialty = await service.update_specialty(specialty_id, specialty_update)
     if not specialty:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=SPECIALTY_NOT_FOUND_MESSAGE)
     return specialty
 
 
 @router.delete("/{specialty_id}")
-def delete_specialty(specialty_id: str, db: Session = Depends(get_db)):
+async def delete_specialty(specialty_id: str, db: AsyncSession = Depends(get_async_db)):
     """Delete a specialty."""
-    service = SpecialtyService(db)
-    success = service.delete_specialty(specialty_id)
+    service = AsyncSpecialtyService(db)
+    success = await service.delete_specialty(specialty_id)
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=SPECIALTY_NOT_FOUND_MESSAGE)
     return {"message": "Specialty deleted successfully"}
@@ -2,46 +2,58 @@
 Therapeutic approach endpoints.
 """
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.schemas.therapeutic_approach import (
     TherapeuticApproachCreate,
     TherapeuticApproachResponse,
     TherapeuticApproachUpdate,
 )
-from app.services.therapeutic_approach_service import TherapeuticApproachService
+from app.services.catalog_cache import THERAPEUTIC_APPROACHES, get_catalog_cache
+from app.services.therapeutic_approach_service import AsyncTherapeuticApproachService
+from app.utils.http_cache import catalog_conditional_request
+from app.utils.pagination import NEXT_CURSOR_HEADER, Cursor, get_cursor, next_cursor
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(catalog_conditional_request(THERAPEUTIC_APPROACHES))])
 
 # Error messages
 THERAPEUTIC_APPROACH_NOT_FOUND_MESSAGE = "Therapeutic approach not found"
 
 
 @router.get("/", response_model=List[TherapeuticApproachResponse])
-def get_therapeutic_approaches(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def get_therapeutic_approaches(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    db: AsyncSession = Depends(get_async_db),
+):
     """Get all therapeutic approaches."""
-    service = TherapeuticApproachService(db)
-    approaches = service.get_therapeutic_approaches(skip=skip, limit=limit)
+    service = AsyncTherapeuticApproachService(db, catalog=get_catalog_cache())
+    approaches = await service.get_therapeutic_approaches(skip=skip, limit=limit, cursor=cursor)
+    token = next_cursor(approaches, limit)
+    if token:
+        response.headers[NEXT_CURSOR_HEADER] = token
     return approaches
 
 
 @router.get("/category/{category}", response_model=List[TherapeuticApproachResponse])
-def get_therapeutic_approaches_by_category(category: str, db: Session = Depends(get_db)):
+async def get_therapeutic_approaches_by_category(category: str, db: AsyncSession = Depends(get_async_db)):
     """Get therapeutic approaches by category."""
-    service = TherapeuticApproachService(db)
-    approaches = service.get_therapeutic_approaches_by_category(category)
+    service = AsyncTherapeuticApproachService(db, catalog=get_catalog_cache())
+    approaches = await service.get_therapeutic_approaches_by_category(category)
     return approaches
 
 
 @router.get("/{approach_id}", response_model=TherapeuticApproachResponse)
-def get_therapeutic_approach(approach_id: str, db: Session = Depends(get_db)):
+async def get_therapeutic_approach(approach_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get a therapeutic approach by ID."""
-    service = TherapeuticApproachService(db)
-    approach = service.get_therapeutic_approach(approach_id)
+    service = AsyncTherapeuticApproachService(db, catalog=get_catalog_cache())
+    approach = await service.get_therapeutic_approach(approach_id)
     if not approach:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -51,21 +63,21 @@ def get_therapeutic_approach(approach_id: str, db: Session = Depends(get_db)):
 
 
 @router.post("/", response_model=TherapeuticApproachResponse)
-def create_therapeutic_approach(approach: TherapeuticApproachCreate, db: Session = Depends(get_db)):
+async def create_therapeutic_approach(approach: TherapeuticApproachCreate, db: AsyncSession = Depends(get_async_db)):
     """Create a new therapeutic approach."""
-    service = TherapeuticApproachService(db)
-    return service.create_therapeutic_approach(approach)
+    service = AsyncTherapeuticApproachService(db)
+    return await service.create_therapeutic_approach(approach)
 
 
 @router.put("/{approach_id}", response_model=TherapeuticApproachResponse)
-def update_therapeutic_approach(
+async def update_therapeutic_approach(
     approach_id: str,
     approach_update: TherapeuticApproachUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Update a therapeutic approach."""
-    service = TherapeuticApproachService(db)
-    approach = service.update_therapeutic_approach(approach_id, approach_update)
+    service = AsyncTherapeuticApproachService(db)
+    approach = await service.update_therapeutic_approach(approach_id, approach_update)
     if not approach:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,10 +87,10 @@ def update_therapeutic_approach(
 
 
 @router.delete("/{approach_id}")
-def delete_therapeutic_approach(approach_id: str, db: Session = Depends(get_db)):
+async def delete_therapeutic_approach(approach_id: str, db: AsyncSession = Depends(get_async_db)):
     """Delete a therapeutic approach."""
-    service = TherapeuticApproachService(db)
-    success = service.delete_therapeutic_approach(approach_id)
+    service = AsyncTherapeuticApproachService(db)
+    success = await service.delete_therapeutic_approach(approach_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -2,14 +2,16 @@
 User endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.exc import StaleDataError
 
 from app.utils.auth import get_current_user_id
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.schemas.user import UserResponse, UserUpdate
-from app.services.auth_service import AuthService
+from app.services.auth_service import AsyncAuthService
+from app.utils.http_cache import PRECONDITION_FAILED_MESSAGE, check_if_match, version_etag
 
 router = APIRouter()
 
@@ -18,7 +20,7 @@ USER_NOT_FOUND_MESSAGE = "User not found"
 
 
 @router.get("/", response_model=list[UserResponse])
-async def get_users(_db: Session = Depends(get_db)):
+async def get_users(_db: AsyncSession = Depends(get_async_db)):
     """Get all users (admin only - for now returns 401)."""
     # For now, this endpoint requires authentication
     # In a real app, this would check for admin role
@@ -26,7 +28,7 @@ async def get_users(_db: Session = Depends(get_db)):
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user_by_id(user_id: str, _db: Session = Depends(get_db)):
+async def get_user_by_id(user_id: str, _db: AsyncSession = Depends(get_async_db)):
     """Get user by ID (admin only - for now returns 401)."""
     # For now, this endpoint requires authentication
     # In a real app, this would check for admin role
@@ -34,41 +36,61 @@ async def get_user_by_id(user_id: str, _db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user(current_user_id: str = Depends(get_current_user_id), db: Session = Depends(get_db)):
+async def get_current_user(
+    response: Response,
+    current_user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db),
+):
     """Get current user profile."""
-    auth_service = AuthService(db)
-    user = auth_service.get_user_by_id(current_user_id)
+    auth_service = AsyncAuthService(db)
+    user = await auth_service.get_user_by_id(current_user_id)
 
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=USER_NOT_FOUND_MESSAGE)
 
+    # Sent back in If-Match when saving, see update_current_user
+    response.headers["ETag"] = version_etag(user)
     return user
 
 
 @router.put("/me", response_model=UserResponse)
 async def update_current_user(
     update_data: UserUpdate,
+    request: Request,
+    response: Response,
     current_user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Update current user profile."""
-    auth_service = AuthService(db)
-    user = auth_service.get_user_by_id(current_user_id)
+    """Update current user profile.
+
+    With If-Match (the ETag of GET /me or of a previous save), the update only applies to that
+    version of the profile and fails with 412 otherwise, including when another save commits
+    in between.
+    """
+    auth_service = AsyncAuthService(db)
+    user = await auth_service.get_user_by_id(current_user_id)
 
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=USER_NOT_FOUND_MESSAGE)
+    check_if_match(request, version_etag(user))
 
     try:
         # Update fields
         for field, value in update_data.model_dump(exclude_unset=True).items():
             setattr(user, field, value)
 
-        db.commit()
-        db.refresh(user)
+        # The UPDATE checks the version read above and returns the new updated_at: no refresh needed
+        await db.commit()
+        response.headers["ETag"] = version_etag(user)
         return user
 
+    except StaleDataError as exc:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED, detail=PRECONDITION_FAILED_MESSAGE
+        ) from exc
     except SQLAlchemyError as exc:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update user",
@@ -76,10 +98,12 @@ async def update_current_user(
 
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_current_user(current_user_id: str = Depends(get_current_user_id), db: Session = Depends(get_db)):
+async def delete_current_user(
+    current_user_id: str = Depends(get_current_user_id), db: AsyncSession = Depends(get_async_db)
+):
     """Delete current user account."""
-    auth_service = AuthService(db)
-    user = auth_service.get_user_by_id(current_user_id)
+    auth_service = AsyncAuthService(db)
+    user = await auth_service.get_user_by_id(current_user_id)
 
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=USER_NOT_FOUND_MESSAGE)
@@ -87,11 +111,11 @@ async def delete_current_user(current_user_id: str = Depends(get_current_user_id
     try:
         # Soft delete - mark as inactive instead of hard delete
         user.is_active = False
-        db.commit()
+        await db.commit()
         return None
 
     except SQLAlchemyError as exc:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete user",
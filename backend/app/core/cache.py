@@ -0,0 +1,126 @@
+"""
+Pluggable key/value cache backends.
+
+Backends store bytes with a TTL and keep integer counters (used to version groups of
+keys). The interface is synchronous because invalidation runs from the session commit
+hooks; backends doing network I/O set ``blocking`` so that async request paths call them
+off the event loop.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Protocol, Tuple
+
+
+class CacheBackend(Protocol):
+    """Minimal key/value store used by the response caches."""
+
+    # Whether calls wait on the network and must not run on the event loop
+    blocking: bool
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the value stored under ``key``, or None if missing or expired."""
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        """Store ``value`` under ``key`` for ``ttl_seconds``."""
+
+    def delete(self, *keys: str) -> None:
+        """Remove the given keys."""
+
+    def incr(self, key: str) -> int:
+        """Atomically increment a counter (starting at 0) and return the new value."""
+
+
+class InMemoryCacheBackend:
+    """Process-local LRU cache with per-entry expiry. Thread-safe."""
+
+    blocking = False
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        # Counters version other keys, so they are never evicted
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the live value under ``key``, marking it recently used."""
+        with self._lock:
+            # Like Redis, a counter reads back as its decimal representation
+            if key in self._counters:
+                return str(self._counters[key]).encode()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        """Store ``value``, evicting the least recently used entries beyond ``max_entries``."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        """Remove entries and counters under these keys."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+                self._counters.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        """Increment a counter, which is never evicted."""
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def clear(self) -> None:
+        """Drop every entry and counter."""
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+
+class RedisCacheBackend:
+    """Backend over a Redis-compatible client (redis-py, fakeredis, or any local stand-in).
+
+    The client only needs ``get``, ``set(key, value, ex=...)``, ``delete`` and ``incr``.
+    """
+
+    blocking = True
+
+    def __init__(self, client):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        """Connect with redis-py, which is an optional dependency."""
+        try:
+            import redis  # pylint: disable=import-outside-toplevel
+        except ImportError as exc:
+            raise RuntimeError("The redis cache backend requires the 'redis' package") from exc
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> Optional[bytes]:
+        """GET ``key``."""
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        """SET ``key`` with an expiry."""
+        self.client.set(key, value, ex=ttl_seconds)
+
+    def delete(self, *keys: str) -> None:
+        """DEL the given keys."""
+        if keys:
+            self.client.delete(*keys)
+
+    def incr(self, key: str) -> int:
+        """INCR ``key``."""
+        return int(self.client.incr(key))
@@ -10,6 +10,16 @@ from pydantic import AnyHttpUrl, ConfigDict, field_validator
 from pydantic_settings import BaseSettings
 
 
+def to_async_database_url(url: str) -> str:
+    """Return the asyncpg flavour of a Postgres URL (other URLs are returned unchanged)."""
+    scheme, separator, rest = url.partition("://")
+    if not separator:
+        return url
+    if scheme.split("+", 1)[0] in ("postgres", "postgresql"):
+        return f"postgresql+asyncpg://{rest}"
+    return url
+
+
 class Settings(BaseSettings):
     """Application settings."""
 
@@ -67,6 +77,8 @@ class Settings(BaseSettings):
     DATABASE_USER: str = ""
     DATABASE_PASSWORD: str = ""
     DATABASE_URL: str = ""  # pylint: disable=invalid-name
+    # Async driver URL; derived from DATABASE_URL (asyncpg) when left empty
+    ASYNC_DATABASE_URL: str = ""  # pylint: disable=invalid-name
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -83,6 +95,40 @@ class Settings(BaseSettings):
                 f"@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}"
             )
             self.DATABASE_URL = url  # pylint: disable=invalid-name
+        # Derive the async driver URL from the sync one if not provided
+        if not self.ASYNC_DATABASE_URL:
+            self.ASYNC_DATABASE_URL = to_async_database_url(self.DATABASE_URL)  # pylint: disable=invalid-name
+
+    # In-process professional search index; disabled means every search goes to Postgres
+    PROFESSIONAL_INDEX_ENABLED: bool = False
+    # Full rebuild interval, bounding staleness from writes made by other workers
+    PROFESSIONAL_INDEX_TTL_SECONDS: int = 300
+
+    # Seconds between checks that the in-process catalog snapshot is current, bounding
+    # staleness from catalog writes made by other workers
+    CATALOG_CACHE_CHECK_SECONDS: int = 5
+    # Seconds browsers and shared caches may reuse catalog responses before revalidating them
+    CATALOG_HTTP_MAX_AGE_SECONDS: int = 300
+
+    # Response cache for public professional endpoints: "none", "memory" (per process) or "redis"
+    RESPONSE_CACHE_BACKEND: str = "none"
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    RESPONSE_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Encode JSON responses with orjson instead of the standard library encoder
+    ORJSON_RESPONSES_ENABLED: bool = True
+
+    # Threads hashing and verifying passwords (argon2) off the event loop, and jobs that may
+    # wait for one before logins and registrations are refused with 503
+    PASSWORD_HASHING_WORKERS: int = 2
+    PASSWORD_HASHING_MAX_QUEUE: int = 32
+
+    # argon2 password hashing cost, tuned per host with ``python -m app.core.password_calibration``.
+    # Hashes made with other values are upgraded on the next successful login.
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST_KIB: int = 65536
+    ARGON2_PARALLELISM: int = 4
 
     # JWT settings
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
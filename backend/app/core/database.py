@@ -3,10 +3,11 @@ Database configuration and session management.
 """
 
 from functools import lru_cache
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.core.config import get_settings
@@ -41,3 +42,32 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """Return a singleton AsyncEngine (asyncpg) built from settings."""
+    settings = get_settings()
+    return create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        echo=settings.DEBUG,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Return a singleton async session factory bound to the AsyncEngine.
+
+    ``expire_on_commit`` is disabled because expired attributes cannot be lazily
+    reloaded outside of an awaitable context.
+    """
+    return async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an async database session and ensure it is closed afterwards."""
+    session_factory = get_async_session_factory()
+    async with session_factory() as db:
+        yield db
@@ -0,0 +1,74 @@
+"""Pick argon2 parameters that make one password verification take about a target time on this host.
+
+Run with:
+  python -m app.core.password_calibration --target-ms 250
+
+The time cost is raised from 1 until a verification reaches the target; when even a time cost
+of 1 is too slow, the memory cost is halved instead. The result is printed as ARGON2_*
+settings for the .env file. Existing hashes keep working and are upgraded to the new
+parameters on the next successful login.
+"""
+
+import argparse
+import statistics
+import time
+from typing import Tuple
+
+from argon2 import PasswordHasher
+
+from app.core.config import get_settings
+
+CALIBRATION_PASSWORD = "calibration-password"
+# Lower bound of the memory cost, the OWASP minimum for argon2id
+MIN_MEMORY_COST_KIB = 19 * 1024
+
+
+def measure_verify_ms(time_cost: int, memory_cost: int, parallelism: int, rounds: int = 5) -> float:
+    """Median time, in milliseconds, of verifying a password hashed with the given parameters."""
+    hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    hashed_password = hasher.hash(CALIBRATION_PASSWORD)
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        hasher.verify(hashed_password, CALIBRATION_PASSWORD)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, memory_cost: int, parallelism: int, max_time_cost: int = 20) -> Tuple[int, int, float]:
+    """
+    Smallest time cost whose verification takes at least ``target_ms``.
+
+    Returns ``(time_cost, memory_cost, verify_ms)``; ``memory_cost`` is lower than requested when
+    even a time cost of 1 is slower than the target.
+    """
+    verify_ms = measure_verify_ms(1, memory_cost, parallelism)
+    while verify_ms > target_ms and memory_cost // 2 >= MIN_MEMORY_COST_KIB:
+        memory_cost //= 2
+        verify_ms = measure_verify_ms(1, memory_cost, parallelism)
+
+    time_cost = 1
+    while verify_ms < target_ms and time_cost < max_time_cost:
+        time_cost += 1
+        verify_ms = measure_verify_ms(time_cost, memory_cost, parallelism)
+    return time_cost, memory_cost, verify_ms
+
+
+def main() -> None:
+    """Entry point: calibrate and print the ARGON2_* settings."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target-ms", type=float, default=250.0, help="target verification time")
+    parser.add_argument("--memory-kib", type=int, default=settings.ARGON2_MEMORY_COST_KIB, help="starting memory cost")
+    parser.add_argument("--parallelism", type=int, default=settings.ARGON2_PARALLELISM)
+    args = parser.parse_args()
+
+    time_cost, memory_cost, verify_ms = calibrate(args.target_ms, args.memory_kib, args.parallelism)
+    print(f"# One verification takes {verify_ms:.0f} ms on this host")
+    print(f"ARGON2_TIME_COST={time_cost}")
+    print(f"ARGON2_MEMORY_COST_KIB={memory_cost}")
+    print(f"ARGON2_PARALLELISM={args.parallelism}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Bounded worker pool for password hashing.
+
+argon2 spends tens of milliseconds of CPU on every hash and verification. Run inline in an
+async endpoint it blocks the event loop, and with it every other request on the worker, so
+hashing runs on a small dedicated thread pool instead (argon2-cffi releases the GIL while
+hashing). Jobs beyond the pool size wait in a bounded queue; once it is full new jobs are
+rejected at once with PasswordHashingBusyError rather than piling up, so a burst of logins
+degrades into quick 503s while unrelated endpoints keep serving.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, TypeVar
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when the password hashing queue is full."""
+
+
+@dataclass(frozen=True)
+class PasswordHashingStats:
+    """Counters of a PasswordHashingPool since it was created."""
+
+    workers: int
+    max_queue: int
+    # Jobs running or waiting for a worker, now and at most
+    in_flight: int
+    peak_in_flight: int
+    completed: int
+    rejected: int
+    # Total time jobs waited for a worker, and spent hashing
+    queue_seconds: float
+    run_seconds: float
+
+
+class PasswordHashingPool:
+    """Runs password hashing functions on a bounded thread pool."""
+
+    def __init__(self, workers: int = 2, max_queue: int = 32) -> None:
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hashing")
+        # Counters are updated from the event loop and from the worker threads
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._queue_seconds = 0.0
+        self._run_seconds = 0.0
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """Run ``func(*args)`` on the pool; raise PasswordHashingBusyError when the queue is full."""
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_queue:
+                self._rejected += 1
+                logger.warning("Password hashing queue full (%d jobs), rejecting", self._in_flight)
+                raise PasswordHashingBusyError("Password hashing queue is full")
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+        future = self._executor.submit(self._timed, func, time.perf_counter(), args)
+        # Also called when the job is cancelled before it starts
+        future.add_done_callback(self._job_done)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> PasswordHashingStats:
+        """Current counters."""
+        with self._lock:
+            return PasswordHashingStats(
+                workers=self.workers,
+                max_queue=self.max_queue,
+                in_flight=self._in_flight,
+                peak_in_flight=self._peak_in_flight,
+                completed=self._completed,
+                rejected=self._rejected,
+                queue_seconds=self._queue_seconds,
+                run_seconds=self._run_seconds,
+            )
+
+    def _timed(self, func: Callable[..., T], submitted: float, args: tuple) -> T:
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self._completed += 1
+                self._queue_seconds += started - submitted
+                self._run_seconds += finished - started
+
+    def _job_done(self, _future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+
+@lru_cache(maxsize=1)
+def get_password_hashing_pool() -> PasswordHashingPool:
+    """Return the process-wide password hashing pool."""
+    settings = get_settings()
+    return PasswordHashingPool(workers=settings.PASSWORD_HASHING_WORKERS, max_queue=settings.PASSWORD_HASHING_MAX_QUEUE)
@@ -0,0 +1,20 @@
+"""
+Default response class for JSON endpoints.
+"""
+
+from typing import Type
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.core.config import get_settings
+
+
+def default_response_class() -> Type[JSONResponse]:
+    """orjson-backed responses unless ORJSON_RESPONSES_ENABLED is off.
+
+    orjson encodes UUIDs and datetimes natively and is several times faster than the
+    standard library encoder on large listings.
+    """
+    if get_settings().ORJSON_RESPONSES_ENABLED:
+        return ORJSONResponse
+    return JSONResponse
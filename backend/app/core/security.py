@@ -3,17 +3,26 @@ Security utilities for authentication and authorization.
 """
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 import jwt
 from argon2 import PasswordHasher
-from argon2.exceptions import VerificationError
+from argon2.exceptions import InvalidHashError, VerificationError
 
 
 from app.core.config import get_settings
 
-# Password hashing - using argon2 for modern, secure password hashing
-ph = PasswordHasher()
+
+@lru_cache(maxsize=1)
+def get_password_hasher() -> PasswordHasher:
+    """Return the argon2 hasher (modern, secure password hashing) configured by the ARGON2_* settings."""
+    settings = get_settings()
+    return PasswordHasher(
+        time_cost=settings.ARGON2_TIME_COST,
+        memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+        parallelism=settings.ARGON2_PARALLELISM,
+    )
 
 
 def create_access_token(subject: Union[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -55,7 +64,7 @@ def verify_token(token: str) -> Optional[str]:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hash."""
     try:
-        ph.verify(hashed_password, plain_password)
+        get_password_hasher().verify(hashed_password, plain_password)
     except VerificationError:
         return False
     return True
@@ -63,7 +72,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """Hash password."""
-    return ph.hash(password)
+    return get_password_hasher().hash(password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a hash was made with other argon2 parameters than the configured ones."""
+    try:
+        return get_password_hasher().check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        # Not an argon2 hash: verification cannot have succeeded either
+        return False
 
 
 def create_token_response(user_id: str) -> dict:
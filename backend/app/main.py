@@ -2,6 +2,9 @@
 Main FastAPI application for Miamente platform.
 """
 
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,12 +13,25 @@ from fastapi.responses import JSONResponse
 
 from app.api.v1.api import api_router
 from app.core.config import get_settings
-from app.core.database import Base, get_engine
+from app.core.database import Base, get_async_session_factory, get_engine
+from app.core.password_hashing import get_password_hashing_pool
+from app.core.responses import default_response_class
+from app.services.catalog_cache import get_catalog_cache
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 # Create database tables
 engine = get_engine()
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Load the catalog snapshot before serving requests."""
+    async with get_async_session_factory()() as db:
+        await get_catalog_cache().snapshot(db)
+    yield
+
+
 app = FastAPI(
     title=get_settings().PROJECT_NAME,
     version=get_settings().VERSION,
@@ -23,6 +39,8 @@ app = FastAPI(
     openapi_url=f"{get_settings().API_V1_STR}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=default_response_class(),
+    lifespan=lifespan,
 )
 
 # Set up CORS
@@ -32,6 +50,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # The browser app sends the profile ETag back in If-Match
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 # Add trusted host middleware
@@ -58,8 +78,8 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
-    return JSONResponse(content={"status": "healthy"})
+    """Health check endpoint, with the password hashing pool counters."""
+    return JSONResponse(content={"status": "healthy", "password_hashing": asdict(get_password_hashing_pool().stats())})
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 
 import uuid
 
-from sqlalchemy import Boolean, Column, Integer, String, Text
+from sqlalchemy import Boolean, Column, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.core.database import Base
@@ -13,6 +13,8 @@ class Modality(Base, TimestampMixin):
     """Modality model for intervention modalities."""
 
     __tablename__ = "modalities"
+    # Keyset pagination order
+    __table_args__ = (Index("ix_modalities_created_at_id", "created_at", "id"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False, unique=True)
@@ -4,18 +4,56 @@ Professional model for the Miamente platform.
 
 import uuid
 
-from sqlalchemy import ARRAY, Boolean, Column, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import DDL, Boolean, Column, Computed, Index, Integer, String, Text, event, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
 from app.models.mixins import TimestampMixin
 
+# Spanish text search configuration that also folds accents ("psicología" matches "psicologia").
+# Using a configuration keeps to_tsvector immutable, as a generated column requires.
+TEXT_SEARCH_CONFIG = "spanish_unaccent"
+
+# Names weigh more than bios when ranking
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(full_name, '')), 'A') || "
+    f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(bio, '')), 'B')"
+)
+
+CREATE_TEXT_SEARCH_CONFIG = f"""
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{TEXT_SEARCH_CONFIG}') THEN
+        CREATE TEXT SEARCH CONFIGURATION {TEXT_SEARCH_CONFIG} (COPY = spanish);
+        ALTER TEXT SEARCH CONFIGURATION {TEXT_SEARCH_CONFIG}
+            ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+    END IF;
+END
+$$
+"""
+
 
 class Professional(Base, TimestampMixin):
     """Professional model."""
 
     __tablename__ = "professionals"
+    # Keyset pagination order for the public listing, which only returns active professionals
+    __table_args__ = (
+        Index("ix_professionals_active_created_at_id", "created_at", "id", postgresql_where=text("is_active")),
+        Index("ix_professionals_search_vector", "search_vector", postgresql_using="gin"),
+        # Containment (@>) and overlap (&&) filters
+        Index("ix_professionals_specialty_ids", "specialty_ids", postgresql_using="gin"),
+        Index("ix_professionals_therapy_approaches_ids", "therapy_approaches_ids", postgresql_using="gin"),
+        Index("ix_professionals_languages", "languages", postgresql_using="gin"),
+        # Containment (@>) queries on certifications, e.g. by name
+        Index(
+            "ix_professionals_certifications",
+            "certifications",
+            postgresql_using="gin",
+            postgresql_ops={"certifications": "jsonb_path_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -35,12 +73,12 @@ class Professional(Base, TimestampMixin):
     custom_rate_cents = Column(Integer, nullable=True)  # Custom rate override
     currency = Column(String(3), default="COP")
     bio = Column(Text, nullable=True)
-    # JSON string for structured academic experience
-    academic_experience = Column(Text, nullable=True)
-    # JSON string for structured work experience
-    work_experience = Column(Text, nullable=True)
-    # JSON string for structured certifications
-    certifications = Column(Text, nullable=True)
+    # Structured academic experience
+    academic_experience = Column(JSONB, nullable=True)
+    # Structured work experience
+    work_experience = Column(JSONB, nullable=True)
+    # Structured certifications
+    certifications = Column(JSONB, nullable=True)
     languages = Column(ARRAY(String), nullable=True)
     # List of therapeutic approach IDs
     therapy_approaches_ids = Column(ARRAY(String), nullable=True)
@@ -49,13 +87,24 @@ class Professional(Base, TimestampMixin):
 
     # Availability settings
     timezone = Column(String(50), default="America/Bogota")
-    # JSON string
-    working_hours = Column(Text, nullable=True)
+    working_hours = Column(JSONB, nullable=True)
 
     # Contact information
     emergency_contact = Column(String(255), nullable=True)
     emergency_phone = Column(String(20), nullable=True)
 
+    # Optimistic concurrency: every UPDATE checks and bumps it, and RETURNs the server-side
+    # defaults (updated_at), so a saved profile needs no refresh
+    version = Column(Integer, nullable=False, server_default=text("1"))
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
+
+    # Full-text search document over full_name and bio, maintained by Postgres.
+    # Deferred: only used in WHERE/ORDER BY, never serialized.
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), nullable=True),
+        raiseload=True,
+    )
+
     # Relationships
     professional_specialties = relationship(
         "app.models.professional_specialty.ProfessionalSpecialty",
@@ -71,7 +120,17 @@ class Professional(Base, TimestampMixin):
     )
 
     def __repr__(self):
-        return (
-            f"<Professional(id={self.id}, email={self.email}, "
-            f"full_name={self.full_name}, specialty={self.specialty})>"
-        )
+        return f"<Professional(id={self.id}, email={self.email}, full_name={self.full_name})>"
+
+
+# The generated column needs unaccent and the text search configuration to exist
+event.listen(
+    Professional.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS unaccent").execute_if(dialect="postgresql"),
+)
+event.listen(
+    Professional.__table__,
+    "before_create",
+    DDL(CREATE_TEXT_SEARCH_CONFIG).execute_if(dialect="postgresql"),
+)
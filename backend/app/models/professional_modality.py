@@ -2,8 +2,8 @@
 
 import uuid
 
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, text
+from sqlalchemy.dialects.postgresql import UUID, ExcludeConstraint
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -14,6 +14,19 @@ class ProfessionalModality(Base, TimestampMixin):
     """Professional modality model for a professional's intervention modalities."""
 
     __tablename__ = "professional_modalities"
+    # At most one default per professional: a unique partial index on professional_id WHERE
+    # is_default, as an exclusion constraint so it can be checked at the end of each statement
+    # and a single UPDATE can move the default (see default_modality_update)
+    __table_args__ = (
+        ExcludeConstraint(
+            ("professional_id", "="),
+            name="ex_professional_modalities_one_default",
+            using="btree",
+            where=text("is_default"),
+            deferrable=True,
+            initially="IMMEDIATE",
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     professional_id = Column(UUID(as_uuid=True), ForeignKey("professionals.id"), nullable=False)
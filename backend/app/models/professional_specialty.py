@@ -4,7 +4,7 @@ Professional Specialty model for the Miamente platform.
 
 import uuid
 
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -16,6 +16,10 @@ class ProfessionalSpecialty(Base, TimestampMixin):
     """Professional–Specialty link: many-to-many relationship between professionals and specialties."""
 
     __tablename__ = "professional_specialties"
+    # One link per pair: lets the link sync insert with ON CONFLICT DO NOTHING
+    __table_args__ = (
+        UniqueConstraint("professional_id", "specialty_id", name="uq_professional_specialties_professional_specialty"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     professional_id = Column(UUID(as_uuid=True), ForeignKey("professionals.id"), nullable=False)
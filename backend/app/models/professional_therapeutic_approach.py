@@ -7,7 +7,7 @@ therapeutic approaches, allowing professionals to specialize in multiple approac
 
 import uuid
 
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -21,6 +21,14 @@ class ProfessionalTherapeuticApproach(Base, TimestampMixin):
     therapeutic approaches."""
 
     __tablename__ = "professional_therapeutic_approaches"
+    # One link per pair: lets the link sync insert with ON CONFLICT DO NOTHING
+    __table_args__ = (
+        UniqueConstraint(
+            "professional_id",
+            "therapeutic_approach_id",
+            name="uq_professional_therapeutic_approaches_professional_approach",
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     professional_id = Column(UUID(as_uuid=True), ForeignKey("professionals.id"), nullable=False)
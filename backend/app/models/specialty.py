@@ -4,7 +4,7 @@ Specialty model for the Miamente platform.
 
 import uuid
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.core.database import Base
@@ -15,6 +15,8 @@ class Specialty(Base, TimestampMixin):
     """Specialty model - Academic or regulated professional fields."""
 
     __tablename__ = "specialties"
+    # Keyset pagination order
+    __table_args__ = (Index("ix_specialties_created_at_id", "created_at", "id"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False, unique=True)
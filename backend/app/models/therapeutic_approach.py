@@ -7,7 +7,7 @@ such as Cognitive Behavioral Therapy, Psychoanalysis, etc.
 
 import uuid
 
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.core.database import Base
@@ -18,6 +18,8 @@ class TherapeuticApproach(Base, TimestampMixin):
     """Therapeutic Approach model - Theoretical and methodological currents."""
 
     __tablename__ = "therapeutic_approaches"
+    # Keyset pagination order
+    __table_args__ = (Index("ix_therapeutic_approaches_created_at_id", "created_at", "id"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False, unique=True)
@@ -4,8 +4,8 @@ User model for the Miamente platform.
 
 import uuid
 
-from sqlalchemy import Boolean, Column, DateTime, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from app.core.database import Base
 from app.models.mixins import TimestampMixin
@@ -27,7 +27,12 @@ class User(Base, TimestampMixin):
     date_of_birth = Column(DateTime, nullable=True)
     emergency_contact = Column(String(255), nullable=True)
     emergency_phone = Column(String(20), nullable=True)
-    preferences = Column(Text, nullable=True)  # JSON string for user preferences
+    preferences = Column(JSONB, nullable=True)  # User preferences
+
+    # Optimistic concurrency: every UPDATE checks and bumps it, and RETURNs the server-side
+    # defaults (updated_at), so a saved profile needs no refresh
+    version = Column(Integer, nullable=False, server_default=text("1"))
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
 
     # Relationships
 
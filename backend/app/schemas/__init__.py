@@ -3,9 +3,15 @@ Pydantic schemas for request/response validation.
 """
 
 from app.schemas.auth import Token, TokenData
+from app.schemas.catalog import CatalogNamesResponse
 from app.schemas.professional import (
+    ProfessionalBatchRequest,
+    ProfessionalBatchResponse,
+    ProfessionalCard,
     ProfessionalCreate,
     ProfessionalResponse,
+    ProfessionalSearchFilters,
+    ProfessionalSearchResponse,
     ProfessionalUpdate,
 )
 from app.schemas.user import UserCreate, UserLogin, UserResponse, UserUpdate
@@ -15,9 +21,15 @@ __all__ = [
     "UserUpdate",
     "UserResponse",
     "UserLogin",
+    "ProfessionalBatchRequest",
+    "ProfessionalBatchResponse",
+    "ProfessionalCard",
     "ProfessionalCreate",
     "ProfessionalUpdate",
     "ProfessionalResponse",
+    "ProfessionalSearchFilters",
+    "ProfessionalSearchResponse",
+    "CatalogNamesResponse",
     "Token",
     "TokenData",
 ]
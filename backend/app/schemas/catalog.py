@@ -0,0 +1,19 @@
+"""
+Catalog (specialties, therapeutic approaches, modalities) lookup schemas.
+"""
+
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+# Most IDs a single name lookup may resolve
+CATALOG_NAMES_LIMIT = 500
+
+
+class CatalogNamesResponse(BaseModel):
+    """Names of catalog entries by ID, per catalog, and the IDs found in none of them."""
+
+    specialties: Dict[str, str] = {}
+    therapeutic_approaches: Dict[str, str] = {}
+    modalities: Dict[str, str] = {}
+    missing_ids: List[str] = []
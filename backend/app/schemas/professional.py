@@ -5,9 +5,9 @@ Professional schemas.
 import json
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, create_model, field_validator
 
 
 class ProfessionalBase(BaseModel):
@@ -149,6 +149,125 @@ class ProfessionalResponse(ProfessionalBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+# ProfessionalResponse for a sparse fieldset (?fields=): every field is optional, with the
+# same validators, and only the requested ones are set (dump with exclude_unset=True).
+ProfessionalFieldsResponse = create_model(
+    "ProfessionalFieldsResponse",
+    __base__=ProfessionalResponse,
+    **{name: (Optional[field.annotation], None) for name, field in ProfessionalResponse.model_fields.items()},
+)
+
+
+# How the selected values of an array filter combine: "any" (overlap) or "all" (containment)
+ArrayMatch = Literal["any", "all"]
+
+
+class ProfessionalSearchFilters(BaseModel):
+    """Multi-valued professional search filters.
+
+    Values within a facet are OR-ed unless its match is "all", facets are AND-ed together.
+    """
+
+    text: Optional[str] = None  # Free text over full name and bio
+    specialty_ids: List[str] = []
+    specialty_ids_match: ArrayMatch = "any"
+    therapy_approaches_ids: List[str] = []
+    therapy_approaches_ids_match: ArrayMatch = "any"
+    languages: List[str] = []
+    languages_match: ArrayMatch = "any"
+    is_verified: Optional[bool] = None
+    modality_ids: List[uuid.UUID] = []
+    min_price_cents: Optional[int] = None
+    max_price_cents: Optional[int] = None
+
+
+class FacetCount(BaseModel):
+    """Number of matching professionals for a single facet value."""
+
+    value: str
+    count: int
+
+
+class ProfessionalSearchFacets(BaseModel):
+    """Per-facet value counts.
+
+    Each facet is counted with every filter applied except its own, so the counts show
+    how many results selecting an additional value would add. Facets matched with "all"
+    keep their own filter, so the counts show how many results would remain.
+    """
+
+    specialty_ids: List[FacetCount] = []
+    therapy_approaches_ids: List[FacetCount] = []
+    languages: List[FacetCount] = []
+    modality_ids: List[FacetCount] = []
+
+
+class ProfessionalSearchResponse(BaseModel):
+    """Professional search response: a page of results plus facet counts."""
+
+    items: List[ProfessionalResponse]
+    total: int
+    facets: ProfessionalSearchFacets
+
+
+class ProfessionalSearchFieldsResponse(ProfessionalSearchResponse):
+    """Professional search response whose items carry a sparse fieldset."""
+
+    items: List[ProfessionalFieldsResponse]
+
+
+# Most professionals a single batch lookup may ask for
+PROFESSIONAL_BATCH_LIMIT = 100
+
+
+class ProfessionalBatchRequest(BaseModel):
+    """IDs of the professionals to look up at once."""
+
+    ids: List[uuid.UUID] = Field(..., min_length=1, max_length=PROFESSIONAL_BATCH_LIMIT)
+
+
+class ProfessionalBatchResponse(BaseModel):
+    """Professionals found by a batch lookup, in request order, and the IDs not found."""
+
+    items: List[ProfessionalResponse]
+    missing_ids: List[uuid.UUID] = []  # Unknown or inactive professionals
+
+
+class ProfessionalBatchFieldsResponse(ProfessionalBatchResponse):
+    """Batch lookup response whose items carry a sparse fieldset."""
+
+    items: List[ProfessionalFieldsResponse]
+
+
+class ProfessionalCardSpecialty(BaseModel):
+    """Specialty shown on a professional card."""
+
+    id: uuid.UUID
+    name: str
+
+
+class ProfessionalCard(BaseModel):
+    """Compact professional projection for the directory grid."""
+
+    id: uuid.UUID
+    full_name: str
+    profile_picture: Optional[str] = None
+    is_verified: bool
+    specialties: List[ProfessionalCardSpecialty] = []  # Top specialties, in the professional's order
+    modalities: List[str] = []  # Active modality names, default first
+    starting_price_cents: int  # Lowest modality price, or the professional's rate
+    currency: str
+    languages: List[str] = []
+
+    @field_validator("specialties", "modalities", "languages", mode="before")
+    @classmethod
+    def parse_empty_list(cls, value):
+        """Aggregates and arrays over no rows are NULL."""
+        return value or []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class ProfessionalLogin(BaseModel):
     """Professional login schema."""
 
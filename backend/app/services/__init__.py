@@ -2,12 +2,15 @@
 Services for business logic.
 """
 
-from app.services.auth_service import AuthService
-from app.services.professional_service import ProfessionalService
-from app.services.user_service import UserService
+from app.services.auth_service import AsyncAuthService, AuthService
+from app.services.professional_service import AsyncProfessionalService, ProfessionalService
+from app.services.user_service import AsyncUserService, UserService
 
 __all__ = [
     "AuthService",
     "UserService",
     "ProfessionalService",
+    "AsyncAuthService",
+    "AsyncUserService",
+    "AsyncProfessionalService",
 ]
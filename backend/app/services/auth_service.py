@@ -6,13 +6,49 @@ import uuid
 from typing import Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import Update, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password, verify_token
+from app.core.password_hashing import PasswordHashingBusyError, get_password_hashing_pool
+from app.core.security import get_password_hash, password_needs_rehash, verify_password, verify_token
 from app.models.professional import Professional
 from app.models.user import User
 from app.schemas.professional import ProfessionalCreate
 from app.schemas.user import UserCreate
+from app.services.professional_service import professional_relationship_loaders
+
+EMAIL_ALREADY_REGISTERED_MESSAGE = "Email already registered"
+PASSWORD_HASHING_BUSY_MESSAGE = "Too many sign-in requests, please retry shortly"
+# Seconds clients are told to wait when the password hashing queue is full
+PASSWORD_HASHING_RETRY_AFTER_SECONDS = 1
+
+
+async def run_password_hashing(func, *args):
+    """Run a password hashing function off the event loop, answering 503 when the pool is saturated."""
+    try:
+        return await get_password_hashing_pool().run(func, *args)
+    except PasswordHashingBusyError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=PASSWORD_HASHING_BUSY_MESSAGE,
+            headers={"Retry-After": str(PASSWORD_HASHING_RETRY_AFTER_SECONDS)},
+        ) from exc
+
+
+def password_rehash_update(account, hashed_password: str) -> Update:
+    """Replace the password hash of a user or professional, unless it changed since it was verified.
+
+    A plain UPDATE: the hash is in no response, so the profile version, updated_at and the
+    change notifications are left alone.
+    """
+    model = type(account)
+    return (
+        update(model)
+        .where(model.id == account.id, model.hashed_password == account.hashed_password)
+        .values(hashed_password=hashed_password, updated_at=model.updated_at)
+        .execution_options(synchronize_session=False)
+    )
 
 
 class AuthService:
@@ -28,6 +64,7 @@ class AuthService:
             return None
         if not verify_password(password, user.hashed_password):
             return None
+        self._upgrade_password_hash(user, password)
         return user
 
     def authenticate_professional(self, email: str, password: str) -> Optional[Professional]:
@@ -37,8 +74,15 @@ class AuthService:
             return None
         if not verify_password(password, professional.hashed_password):
             return None
+        self._upgrade_password_hash(professional, password)
         return professional
 
+    def _upgrade_password_hash(self, account, password: str) -> None:
+        """Re-hash a just verified password whose hash was made with outdated argon2 parameters."""
+        if password_needs_rehash(account.hashed_password):
+            self.db.execute(password_rehash_update(account, get_password_hash(password)))
+            self.db.commit()
+
     def create_user(self, user_data: UserCreate) -> User:
         """Create new user."""
         # Check if user already exists
@@ -46,7 +90,7 @@ class AuthService:
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
+                detail=EMAIL_ALREADY_REGISTERED_MESSAGE,
             )
 
         # Create new user
@@ -75,7 +119,7 @@ class AuthService:
         if existing_professional:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
+                detail=EMAIL_ALREADY_REGISTERED_MESSAGE,
             )
 
         # Create new professional
@@ -132,3 +176,144 @@ class AuthService:
         if professional_id is None:
             return None
         return self.get_professional_by_id(professional_id)
+
+
+class AsyncAuthService:
+    """Async counterpart of AuthService for use with AsyncSession."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _get_user_by_email(self, email: str) -> Optional[User]:
+        result = await self.db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
+
+    async def _get_professional_by_email(self, email: str) -> Optional[Professional]:
+        result = await self.db.execute(
+            select(Professional).where(Professional.email == email).options(*professional_relationship_loaders())
+        )
+        return result.scalars().first()
+
+    async def authenticate_user(self, email: str, password: str) -> Optional[User]:
+        """Authenticate user with email and password."""
+        user = await self._get_user_by_email(email)
+        if not user:
+            return None
+        if not await run_password_hashing(verify_password, password, user.hashed_password):
+            return None
+        await self._upgrade_password_hash(user, password)
+        return user
+
+    async def authenticate_professional(self, email: str, password: str) -> Optional[Professional]:
+        """Authenticate professional with email and password."""
+        professional = await self._get_professional_by_email(email)
+        if not professional:
+            return None
+        if not await run_password_hashing(verify_password, password, professional.hashed_password):
+            return None
+        await self._upgrade_password_hash(professional, password)
+        return professional
+
+    async def _upgrade_password_hash(self, account, password: str) -> None:
+        """Re-hash a just verified password whose hash was made with outdated argon2 parameters."""
+        if password_needs_rehash(account.hashed_password):
+            hashed_password = await run_password_hashing(get_password_hash, password)
+            await self.db.execute(password_rehash_update(account, hashed_password))
+            await self.db.commit()
+
+    async def create_user(self, user_data: UserCreate) -> User:
+        """Create new user."""
+        # Check if user already exists
+        if await self._get_user_by_email(user_data.email):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=EMAIL_ALREADY_REGISTERED_MESSAGE,
+            )
+
+        # Create new user
+        hashed_password = await run_password_hashing(get_password_hash, user_data.password)
+        db_user = User(
+            email=user_data.email,
+            full_name=user_data.full_name,
+            phone=user_data.phone,
+            date_of_birth=user_data.date_of_birth,
+            emergency_contact=user_data.emergency_contact,
+            emergency_phone=user_data.emergency_phone,
+            hashed_password=hashed_password,
+        )
+
+        self.db.add(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
+        return db_user
+
+    async def create_professional(self, professional_data: ProfessionalCreate) -> Professional:
+        """Create new professional."""
+        # Check if professional already exists
+        existing = await self.db.execute(select(Professional.id).where(Professional.email == professional_data.email))
+        if existing.first():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=EMAIL_ALREADY_REGISTERED_MESSAGE,
+            )
+
+        # Create new professional
+        hashed_password = await run_password_hashing(get_password_hash, professional_data.password)
+        db_professional = Professional(
+            email=professional_data.email,
+            full_name=professional_data.full_name,
+            phone_country_code=professional_data.phone_country_code,
+            phone_number=professional_data.phone_number,
+            specialty_ids=professional_data.specialty_ids,
+            license_number=professional_data.license_number,
+            years_experience=professional_data.years_experience,
+            rate_cents=professional_data.rate_cents,
+            currency=professional_data.currency,
+            bio=professional_data.bio,
+            certifications=professional_data.certifications,
+            languages=professional_data.languages,
+            therapy_approaches_ids=professional_data.therapy_approaches_ids,
+            timezone=professional_data.timezone,
+            hashed_password=hashed_password,
+        )
+
+        self.db.add(db_professional)
+        await self.db.commit()
+        await self.db.refresh(db_professional)
+        return db_professional
+
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID."""
+        try:
+            user_uuid = uuid.UUID(user_id)
+        except ValueError:
+            return None
+        result = await self.db.execute(select(User).where(User.id == user_uuid))
+        return result.scalars().first()
+
+    async def get_professional_by_id(self, professional_id: str) -> Optional[Professional]:
+        """Get professional by ID, with the relationships needed for serialization."""
+        try:
+            professional_uuid = uuid.UUID(professional_id)
+        except ValueError:
+            return None
+        result = await self.db.execute(
+            select(Professional)
+            .where(Professional.id == professional_uuid)
+            .options(*professional_relationship_loaders())
+        )
+        return result.scalars().first()
+
+    async def get_current_user(self, token: str) -> Optional[User]:
+        """Get current user from token."""
+        user_id = verify_token(token)
+        if user_id is None:
+            return None
+        return await self.get_user_by_id(user_id)
+
+    async def get_current_professional(self, token: str) -> Optional[Professional]:
+        """Get current professional from token."""
+        professional_id = verify_token(token)
+        if professional_id is None:
+            return None
+        return await self.get_professional_by_id(professional_id)
@@ -0,0 +1,239 @@
+"""
+Process-local snapshot of the catalogs: specialties, therapeutic approaches and modalities.
+
+The catalogs are tiny and almost never edited, so each worker keeps an immutable snapshot
+of every row and serves catalog reads (and the specialty names of serialized professionals)
+from it instead of querying Postgres each time.
+
+Each snapshot records a fingerprint of the tables it was read from (row count and latest
+``updated_at`` per catalog) and gets a new ``version`` per load. A commit touching a catalog
+row in this worker invalidates the snapshot (see the session hooks below), so it is reloaded
+before the next read. Changes committed by other workers are picked up by comparing the
+fingerprint with the database at most once every CATALOG_CACHE_CHECK_SECONDS. Writes that
+bypass the unit of work (bulk UPDATE/DELETE statements) must call invalidate themselves.
+"""
+
+import hashlib
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from fastapi import Depends
+from sqlalchemy import Select, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import get_async_db
+from app.models.modality import Modality
+from app.models.specialty import Specialty
+from app.models.therapeutic_approach import TherapeuticApproach
+from app.schemas.catalog import CatalogNamesResponse
+from app.utils.pagination import Cursor
+
+SPECIALTIES = "specialties"
+THERAPEUTIC_APPROACHES = "therapeutic_approaches"
+MODALITIES = "modalities"
+
+# Catalog name (as in CatalogNamesResponse) -> model
+CATALOG_MODELS = {
+    SPECIALTIES: Specialty,
+    THERAPEUTIC_APPROACHES: TherapeuticApproach,
+    MODALITIES: Modality,
+}
+
+# Session.info key flagging a transaction that touched a catalog
+CATALOGS_CHANGED_KEY = "catalogs_changed"
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Immutable copy of a catalog row; columns a catalog does not have are None."""
+
+    id: uuid.UUID
+    name: str
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    category: Optional[str] = None
+    description: Optional[str] = None
+    currency: Optional[str] = None
+    default_price_cents: Optional[int] = None
+    is_active: bool = True
+
+
+# Per catalog: (row count, latest updated_at)
+CatalogFingerprint = Tuple[Tuple[int, Optional[datetime]], ...]
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Every catalog entry, per catalog in (created_at, id) order and by ID."""
+
+    version: int
+    fingerprint: CatalogFingerprint
+    entries: Mapping[str, Tuple[CatalogEntry, ...]]
+    by_id: Mapping[str, Mapping[str, CatalogEntry]] = field(init=False)
+    # Per catalog: strong ETag and Last-Modified, the same in every worker for the same rows
+    validators: Mapping[str, Tuple[str, Optional[datetime]]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        by_id = {catalog: {str(entry.id): entry for entry in entries} for catalog, entries in self.entries.items()}
+        object.__setattr__(self, "by_id", by_id)
+        validators = {
+            catalog: (_catalog_etag(catalog, count, updated_at), updated_at)
+            for catalog, (count, updated_at) in zip(CATALOG_MODELS, self.fingerprint)
+        }
+        object.__setattr__(self, "validators", validators)
+
+    def get(self, catalog: str, entry_id) -> Optional[CatalogEntry]:
+        """Entry of a catalog by ID (UUID or string), or None."""
+        return self.by_id[catalog].get(str(entry_id).strip().lower())
+
+    def page(
+        self,
+        catalog: str,
+        skip: int = 0,
+        limit: Optional[int] = None,
+        cursor: Optional[Cursor] = None,
+        where: Optional[Callable[[CatalogEntry], bool]] = None,
+    ) -> List[CatalogEntry]:
+        """Entries matching ``where``, paginated like app.utils.pagination.paginate."""
+        entries: Iterable[CatalogEntry] = self.entries[catalog]
+        if where is not None:
+            entries = [entry for entry in entries if where(entry)]
+        if cursor is not None:
+            entries = [entry for entry in entries if (entry.created_at, entry.id) > tuple(cursor)]
+        else:
+            entries = list(entries)[skip:]
+        return list(entries if limit is None else entries[:limit])
+
+    def resolve(self, ids: Iterable[str]) -> CatalogNamesResponse:
+        """Look every ID up in each catalog; IDs are UUIDs, so at most one catalog matches."""
+        resolved: Dict[str, Dict[str, str]] = {catalog: {} for catalog in self.entries}
+        missing_ids = []
+        for catalog_id in ids:
+            found = False
+            for catalog in self.entries:
+                entry = self.get(catalog, catalog_id)
+                if entry is not None:
+                    resolved[catalog][catalog_id] = entry.name
+                    found = True
+            if not found:
+                missing_ids.append(catalog_id)
+        return CatalogNamesResponse(**resolved, missing_ids=missing_ids)
+
+
+def _catalog_etag(catalog: str, count: int, updated_at: Optional[datetime]) -> str:
+    """ETag of a catalog's contents: any insert, update or delete changes its count or latest update."""
+    version = f"{catalog}|{count}|{updated_at.isoformat() if updated_at else ''}"
+    return f'"{hashlib.sha256(version.encode()).hexdigest()[:32]}"'
+
+
+def catalog_fingerprint_query() -> Select:
+    """Row count and latest update of every catalog, in one statement."""
+    columns = []
+    for catalog, model in CATALOG_MODELS.items():
+        columns.append(select(func.count()).select_from(model).scalar_subquery().label(f"{catalog}_count"))
+        columns.append(select(func.max(model.updated_at)).scalar_subquery().label(f"{catalog}_updated_at"))
+    return select(*columns)
+
+
+async def load_catalog_fingerprint(db: AsyncSession) -> CatalogFingerprint:
+    """Current fingerprint of the catalog tables."""
+    row = (await db.execute(catalog_fingerprint_query())).one()
+    return tuple(zip(row[::2], row[1::2]))
+
+
+async def load_catalog_entries(db: AsyncSession) -> Dict[str, Tuple[CatalogEntry, ...]]:
+    """Read every catalog row, one statement per catalog."""
+    entries = {}
+    for catalog, model in CATALOG_MODELS.items():
+        result = await db.execute(select(*model.__table__.columns).order_by(model.created_at, model.id))
+        entries[catalog] = tuple(CatalogEntry(**row._asdict()) for row in result.all())
+    return entries
+
+
+class CatalogCache:
+    """Holds the current catalog snapshot of this process and keeps it fresh."""
+
+    def __init__(self, check_interval_seconds: float = 5) -> None:
+        self.check_interval_seconds = check_interval_seconds
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._stale = False
+        self._checked_at = 0.0
+        self._version = 0
+
+    @property
+    def current(self) -> Optional[CatalogSnapshot]:
+        """The last loaded snapshot, without checking it is current; None before the first load."""
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        """Reload the snapshot before the next read. Safe to call from any thread."""
+        self._stale = True
+
+    def replace(self, snapshot: CatalogSnapshot) -> None:
+        """Serve the given snapshot until it is invalidated or found out of date."""
+        self._snapshot = snapshot
+        self._stale = False
+        self._checked_at = time.monotonic()
+
+    async def snapshot(self, db: AsyncSession) -> CatalogSnapshot:
+        """The current snapshot, reloaded if invalidated or changed by another worker."""
+        snapshot = self._snapshot
+        if snapshot is None or self._stale:
+            return await self._load(db)
+        if time.monotonic() - self._checked_at >= self.check_interval_seconds:
+            self._checked_at = time.monotonic()
+            fingerprint = await load_catalog_fingerprint(db)
+            if fingerprint != snapshot.fingerprint:
+                return await self._load(db, fingerprint)
+        return snapshot
+
+    async def _load(self, db: AsyncSession, fingerprint: Optional[CatalogFingerprint] = None) -> CatalogSnapshot:
+        # Cleared first, so an invalidation while loading triggers another load
+        self._stale = False
+        # Read before the rows: a change in between only causes an extra reload
+        if fingerprint is None:
+            fingerprint = await load_catalog_fingerprint(db)
+        entries = await load_catalog_entries(db)
+        self._version += 1
+        snapshot = CatalogSnapshot(self._version, fingerprint, entries)
+        self._snapshot = snapshot
+        self._checked_at = time.monotonic()
+        return snapshot
+
+
+@lru_cache(maxsize=1)
+def get_catalog_cache() -> CatalogCache:
+    """Return the process-wide catalog cache."""
+    return CatalogCache(check_interval_seconds=get_settings().CATALOG_CACHE_CHECK_SECONDS)
+
+
+async def get_catalog_snapshot(db: AsyncSession = Depends(get_async_db)) -> CatalogSnapshot:
+    """FastAPI dependency making sure the process-wide snapshot is current for this request."""
+    return await get_catalog_cache().snapshot(db)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_catalog_changes(session: Session, _flush_context) -> None:
+    """Remember that a flush touched a catalog row."""
+    catalog_models = tuple(CATALOG_MODELS.values())
+    if any(isinstance(instance, catalog_models) for instance in (*session.new, *session.dirty, *session.deleted)):
+        session.info[CATALOGS_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_catalogs(session: Session) -> None:
+    """Reload the snapshot once a transaction touching a catalog commits."""
+    if session.info.pop(CATALOGS_CHANGED_KEY, False):
+        get_catalog_cache().invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_catalog_changes(session: Session) -> None:
+    """Changes rolled back never invalidate the snapshot."""
+    session.info.pop(CATALOGS_CHANGED_KEY, None)
@@ -4,10 +4,14 @@ Modality service for managing intervention modalities.
 
 from typing import List, Optional
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.modality import Modality
 from app.schemas.modality import ModalityCreate, ModalityUpdate
+from app.services.catalog_cache import MODALITIES, CatalogCache, CatalogSnapshot
+from app.utils.pagination import Cursor, paginate
 
 
 class ModalityService:
@@ -59,3 +63,94 @@ class ModalityService:
         self.db.delete(db_modality)
         self.db.commit()
         return True
+
+
+class AsyncModalityService:
+    """Async counterpart of ModalityService for use with AsyncSession.
+
+    With a ``catalog`` cache, reads are answered from its snapshot (as CatalogEntry objects)
+    instead of the database. Writes always go to the database.
+    """
+
+    def __init__(self, db: AsyncSession, catalog: Optional[CatalogCache] = None):
+        self.db = db
+        self.catalog = catalog
+
+    async def _snapshot(self) -> Optional[CatalogSnapshot]:
+        return await self.catalog.snapshot(self.db) if self.catalog is not None else None
+
+    async def _get_modality_row(self, modality_id: str) -> Optional[Modality]:
+        result = await self.db.execute(select(Modality).where(Modality.id == modality_id))
+        return result.scalars().first()
+
+    async def get_modality(self, modality_id: str) -> Optional[Modality]:
+        """Get a modality by ID."""
+        snapshot = await self._snapshot()
+        if snapshot is not None:
+            return snapshot.get(MODALITIES, modality_id)
+        return await self._get_modality_row(modality_id)
+
+    async def get_modality_by_name(self, name: str) -> Optional[Modality]:
+        """Get a modality by its unique name."""
+        result = await self.db.execute(select(Modality).where(Modality.name == name))
+        return result.scalars().first()
+
+    async def get_modalities(self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None) -> List[Modality]:
+        """Get all modalities, ordered by (created_at, id); a cursor takes precedence over skip."""
+        snapshot = await self._snapshot()
+        if snapshot is not None:
+            return snapshot.page(MODALITIES, skip=skip, limit=limit, cursor=cursor)
+        result = await self.db.execute(paginate(select(Modality), Modality, skip=skip, limit=limit, cursor=cursor))
+        return list(result.scalars().all())
+
+    async def get_active_modalities(
+        self, limit: Optional[int] = None, cursor: Optional[Cursor] = None
+    ) -> List[Modality]:
+        """Get active modalities, ordered by (created_at, id). Without a limit every row is returned."""
+        snapshot = await self._snapshot()
+        if snapshot is not None:
+            return snapshot.page(MODALITIES, limit=limit, cursor=cursor, where=lambda modality: modality.is_active)
+        result = await self.db.execute(
+            paginate(select(Modality).where(Modality.is_active), Modality, limit=limit, cursor=cursor)
+        )
+        return list(result.scalars().all())
+
+    async def get_modalities_by_category(self, category: str) -> List[Modality]:
+        """Get modalities by category."""
+        snapshot = await self._snapshot()
+        if snapshot is not None:
+            return snapshot.page(MODALITIES, where=lambda modality: modality.category == category)
+        result = await self.db.execute(select(Modality).where(Modality.category == category))
+        return list(result.scalars().all())
+
+    async def create_modality(self, modality: ModalityCreate) -> Modality:
+        """Create a new modality."""
+        db_modality = Modality(**modality.dict())
+        self.db.add(db_modality)
+        await self.db.commit()
+        await self.db.refresh(db_modality)
+        return db_modality
+
+    async def update_modality(self, modality_id: str, modality_update: ModalityUpdate) -> Optional[Modality]:
+        """Update a modality."""
+        db_modality = await self._get_modality_row(modality_id)
+        if not db_modality:
+            return None
+
+        update_data = modality_update.dict(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_modality, field, value)
+
+        await self.db.commit()
+        await self.db.refresh(db_modality)
+        return db_modality
+
+    async def deactivate_modality(self, modality_id: str) -> bool:
+        """Soft delete a modality by setting is_active to False."""
+        db_modality = await self._get_modality_row(modality_id)
+        if not db_modality:
+            return False
+
+        db_modality.is_active = False
+        await self.db.commit()
+        return True
@@ -0,0 +1,163 @@
+"""
+Server-side response cache for the public professional endpoints.
+
+Entries are keyed by version rather than deleted: a professional's detail key embeds a
+per-professional counter and listing keys embed a global listing generation. A commit
+touching a professional bumps both (see professional_changes), so that professional's
+detail and every listing (which it may have entered or left) are invalidated, while other
+professionals' details stay cached. Since keys are resolved before the database read, a
+response computed concurrently with an invalidation is stored under a stale key and never
+served.
+
+Request paths go through the async methods, which call a blocking backend (Redis) off the
+event loop; invalidation runs synchronously from the session commit hooks.
+"""
+
+import hashlib
+import json
+import uuid
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import AbstractSet, Callable, Dict, Iterable, NamedTuple, Optional, Set, Tuple, TypeVar
+
+from fastapi import Request, Response, status
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from app.core.config import get_settings
+from app.services.professional_changes import subscribe_professional_changes
+from app.utils.http_cache import is_not_modified
+
+KEY_PREFIX = "miamente:professionals"
+LIST_GENERATION_KEY = f"{KEY_PREFIX}:list:generation"
+
+T = TypeVar("T")
+
+# Error messages
+UNKNOWN_CACHE_BACKEND_MESSAGE = "Unknown RESPONSE_CACHE_BACKEND: {backend}"
+
+
+class CachedResponse(NamedTuple):
+    """Serialized JSON body with its headers (validators, cache control, next cursor)."""
+
+    body: bytes
+    headers: Dict[str, str]
+
+    def encode(self) -> bytes:
+        """Encode for storage in a bytes backend."""
+        return json.dumps({"body": self.body.decode(), "headers": self.headers}).encode()
+
+    @classmethod
+    def decode(cls, raw: bytes) -> "CachedResponse":
+        """Inverse of encode."""
+        data = json.loads(raw)
+        return cls(data["body"].encode(), data["headers"])
+
+    def to_response(self, request: Request) -> Response:
+        """Answer the request from this entry, with a 304 if the client copy is current."""
+        last_modified = self.headers.get("Last-Modified")
+        if "ETag" in self.headers and is_not_modified(
+            request, self.headers["ETag"], parsedate_to_datetime(last_modified) if last_modified else None
+        ):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers)
+        return Response(content=self.body, media_type="application/json", headers=self.headers)
+
+
+class ProfessionalResponseCache:
+    """Versioned response cache for professional detail and listing responses."""
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: int = 60):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    def _counter(self, key: str) -> int:
+        value = self.backend.get(key)
+        return int(value) if value is not None else 0
+
+    def detail_key(self, professional_id: uuid.UUID, fields: Optional[AbstractSet[str]] = None) -> str:
+        """Key of a professional's detail response (or sparse fieldset of it) at its current version."""
+        version = self._counter(_version_key(professional_id))
+        key = f"{KEY_PREFIX}:detail:{professional_id}:{version}"
+        return key if fields is None else f"{key}:{','.join(sorted(fields))}"
+
+    def list_key(self, query_items: Iterable[Tuple[str, str]]) -> str:
+        """Key of a listing response for the given query parameters at the current generation."""
+        generation = self._counter(LIST_GENERATION_KEY)
+        query = hashlib.sha256(repr(sorted(query_items)).encode()).hexdigest()
+        return f"{KEY_PREFIX}:list:{generation}:{query}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response, if any."""
+        raw = self.backend.get(key)
+        return CachedResponse.decode(raw) if raw is not None else None
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Cache a response for the configured TTL."""
+        self.backend.set(key, entry.encode(), self.ttl_seconds)
+
+    async def cached_detail(
+        self, professional_id: uuid.UUID, fields: Optional[AbstractSet[str]] = None
+    ) -> Tuple[str, Optional[CachedResponse]]:
+        """Key of a professional's detail response and the response cached under it, if any."""
+        return await self._run(self._lookup, self.detail_key, professional_id, fields)
+
+    async def cached_list(self, query_items: Iterable[Tuple[str, str]]) -> Tuple[str, Optional[CachedResponse]]:
+        """Key of a listing response and the response cached under it, if any."""
+        return await self._run(self._lookup, self.list_key, query_items)
+
+    async def store(self, key: str, entry: CachedResponse) -> None:
+        """Cache a response, like set, from an async request path."""
+        await self._run(self.set, key, entry)
+
+    def _lookup(self, key_func: Callable[..., str], *args) -> Tuple[str, Optional[CachedResponse]]:
+        key = key_func(*args)
+        return key, self.get(key)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        # Both lookups of a key and its entry share a single trip to the threadpool
+        if self.backend.blocking:
+            return await run_in_threadpool(func, *args)
+        return func(*args)
+
+    def invalidate(self, professional_ids: Set[uuid.UUID]) -> None:
+        """Invalidate these professionals' details and every listing."""
+        for professional_id in professional_ids:
+            self.backend.incr(_version_key(professional_id))
+        self.backend.incr(LIST_GENERATION_KEY)
+
+
+def _version_key(professional_id: uuid.UUID) -> str:
+    return f"{KEY_PREFIX}:version:{professional_id}"
+
+
+def build_cache_backend(backend: str, max_entries: int, redis_url: str) -> Optional[CacheBackend]:
+    """Instantiate the configured backend; "none" disables caching."""
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return InMemoryCacheBackend(max_entries=max_entries)
+    if backend == "redis":
+        return RedisCacheBackend.from_url(redis_url)
+    raise ValueError(UNKNOWN_CACHE_BACKEND_MESSAGE.format(backend=backend))
+
+
+@lru_cache(maxsize=1)
+def get_professional_cache() -> Optional[ProfessionalResponseCache]:
+    """Return the process-wide professional response cache, or None when disabled."""
+    settings = get_settings()
+    backend = build_cache_backend(
+        settings.RESPONSE_CACHE_BACKEND, settings.RESPONSE_CACHE_MAX_ENTRIES, settings.RESPONSE_CACHE_REDIS_URL
+    )
+    if backend is None:
+        return None
+    return ProfessionalResponseCache(backend, ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+def _invalidate_cached_responses(professional_ids: Set[uuid.UUID]) -> None:
+    """Drop cached responses of committed professionals."""
+    cache = get_professional_cache()
+    if cache is not None:
+        cache.invalidate(professional_ids)
+
+
+subscribe_professional_changes(_invalidate_cached_responses)
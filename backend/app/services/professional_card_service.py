@@ -0,0 +1,110 @@
+"""
+Compact "card" projection of professionals for the directory grid.
+
+Cards are read with a single Core statement selecting only the columns a card shows. The
+top specialties (resolved to names) and the modalities with the starting price are
+aggregated per professional in correlated subqueries of that same statement, so no ORM
+objects or relationships are built.
+"""
+
+from typing import List, Optional, Sequence
+
+from sqlalchemy import ColumnElement, Lateral, Row, Select, String, case, cast, func, select, true
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.professional import Professional
+from app.models.professional_modality import ProfessionalModality
+from app.models.specialty import Specialty
+from app.services.professional_service import MAX_PAGE_SIZE, text_search_query
+from app.utils.pagination import Cursor, paginate
+
+# Specialties shown on a card, in the order the professional listed them
+CARD_SPECIALTY_LIMIT = 3
+
+
+def _card_specialties() -> ColumnElement:
+    """JSON array of the first CARD_SPECIALTY_LIMIT specialties ({id, name}) of each professional."""
+    positions = (
+        func.unnest(Professional.specialty_ids)
+        .table_valued("specialty_id", with_ordinality="position")
+        .render_derived()
+    )
+    specialty = func.json_build_object("id", Specialty.id, "name", Specialty.name)
+    return (
+        select(func.json_agg(aggregate_order_by(specialty, positions.c.position), type_=JSON))
+        .select_from(positions)
+        .join(Specialty, cast(Specialty.id, String) == positions.c.specialty_id)
+        .where(positions.c.position <= CARD_SPECIALTY_LIMIT)
+        .scalar_subquery()
+    )
+
+
+def _card_modalities() -> Lateral:
+    """Active modality names (default first) and the lowest price they are offered at."""
+    presencial_price = case((ProfessionalModality.offers_presencial, ProfessionalModality.presencial_price))
+    return (
+        select(
+            func.array_agg(
+                aggregate_order_by(
+                    ProfessionalModality.modality_name,
+                    ProfessionalModality.is_default.desc(),
+                    ProfessionalModality.modality_name,
+                ),
+                type_=ARRAY(String),
+            ).label("names"),
+            # LEAST ignores NULLs, i.e. modalities not offered in person
+            func.min(func.least(ProfessionalModality.virtual_price, presencial_price)).label("starting_price_cents"),
+        )
+        .where(ProfessionalModality.professional_id == Professional.id, ProfessionalModality.is_active)
+        .lateral("card_modalities")
+    )
+
+
+def professional_card_query(filters: Sequence[ColumnElement[bool]] = ()) -> Select:
+    """Card rows of the active professionals matching the filters, unordered and unpaginated."""
+    modalities = _card_modalities()
+    return (
+        select(
+            Professional.id,
+            Professional.created_at,
+            Professional.full_name,
+            Professional.profile_picture,
+            Professional.is_verified,
+            _card_specialties().label("specialties"),
+            modalities.c.names.label("modalities"),
+            func.coalesce(modalities.c.starting_price_cents, Professional.rate_cents).label("starting_price_cents"),
+            Professional.currency,
+            Professional.languages,
+        )
+        .select_from(Professional)
+        .join(modalities, true())
+        .where(Professional.is_active, *filters)
+    )
+
+
+class AsyncProfessionalCardService:
+    """Reads professional cards using AsyncSession."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_cards(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Sequence[ColumnElement[bool]] = (),
+        cursor: Optional[Cursor] = None,
+        text: Optional[str] = None,
+    ) -> List[Row]:
+        """Get a page of cards, ordered like AsyncProfessionalService.get_professionals."""
+        query = professional_card_query(filters)
+        if text:
+            ts_query = text_search_query(text)
+            query = query.where(Professional.search_vector.op("@@")(ts_query)).order_by(
+                func.ts_rank_cd(Professional.search_vector, ts_query).desc()
+            )
+        result = await self.db.execute(
+            paginate(query, Professional, skip=skip, limit=min(limit, MAX_PAGE_SIZE), cursor=cursor)
+        )
+        return list(result.all())
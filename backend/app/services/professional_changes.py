@@ -0,0 +1,76 @@
+"""
+Notifications of committed changes to professionals.
+
+Session hooks collect the professionals touched by a flush, directly or through one of
+their junction tables (modalities, specialties, therapeutic approaches), and publish their
+IDs to the subscribers once the transaction commits. Rolled back changes are dropped.
+Hooks apply to every Session, including the ones behind AsyncSession, so services need no
+explicit calls; writes that bypass the unit of work (bulk UPDATE/DELETE statements) must
+call publish_professional_changes themselves.
+"""
+
+import logging
+import uuid
+from typing import Callable, Iterable, List, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.professional import Professional
+from app.models.professional_modality import ProfessionalModality
+from app.models.professional_specialty import ProfessionalSpecialty
+from app.models.professional_therapeutic_approach import ProfessionalTherapeuticApproach
+
+logger = logging.getLogger(__name__)
+
+ProfessionalChangeSubscriber = Callable[[Set[uuid.UUID]], None]
+
+# Session.info key collecting the professionals touched by a transaction
+CHANGED_PROFESSIONALS_KEY = "changed_professionals"
+
+JUNCTION_MODELS = (ProfessionalModality, ProfessionalSpecialty, ProfessionalTherapeuticApproach)
+
+_subscribers: List[ProfessionalChangeSubscriber] = []
+
+
+def subscribe_professional_changes(subscriber: ProfessionalChangeSubscriber) -> None:
+    """Call ``subscriber`` with the IDs of the professionals changed by each commit."""
+    _subscribers.append(subscriber)
+
+
+def publish_professional_changes(professional_ids: Iterable) -> None:
+    """Notify the subscribers that these professionals changed. Safe to call from any thread."""
+    ids = {uuid.UUID(str(professional_id)) for professional_id in professional_ids if professional_id}
+    if not ids:
+        return
+    for subscriber in _subscribers:
+        try:
+            subscriber(ids)
+        except Exception:  # pylint: disable=broad-except
+            # A failing cache must not fail the request whose write already committed
+            logger.exception("Professional change subscriber %r failed", subscriber)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_professionals(session: Session, _flush_context) -> None:
+    """Remember which professionals a flush touched, directly or through a junction table."""
+    changed = session.info.setdefault(CHANGED_PROFESSIONALS_KEY, set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, Professional):
+            changed.add(instance.id)
+        elif isinstance(instance, JUNCTION_MODELS):
+            changed.add(instance.professional_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changed_professionals(session: Session) -> None:
+    """Hand the professionals touched by a committed transaction to the subscribers."""
+    changed = session.info.pop(CHANGED_PROFESSIONALS_KEY, None)
+    if changed:
+        publish_professional_changes(changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_professionals(session: Session) -> None:
+    """Changes rolled back are never published."""
+    session.info.pop(CHANGED_PROFESSIONALS_KEY, None)
@@ -0,0 +1,123 @@
+"""
+Streaming export of the professional directory as NDJSON or CSV.
+
+Rows are read with a server-side cursor (``yield_per``) and encoded one partition at a
+time, so memory stays constant whatever the size of the directory. Specialty, therapeutic
+approach and modality names are resolved in the same statement.
+"""
+
+import csv
+import io
+from typing import AsyncIterator, List, Literal, Optional, Sequence
+
+import orjson
+from sqlalchemy import ColumnElement, Row, Select, String, cast, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.professional import Professional
+from app.models.professional_modality import ProfessionalModality
+from app.models.specialty import Specialty
+from app.models.therapeutic_approach import TherapeuticApproach
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+# Rows fetched per round trip from the server-side cursor, and encoded per chunk
+EXPORT_BATCH_SIZE = 500
+
+# Separator for list values in CSV cells
+CSV_LIST_SEPARATOR = "; "
+
+
+def catalog_names(ids_column, model) -> ColumnElement:
+    """Names of the catalog rows whose IDs an array column lists, in the same order."""
+    positions = func.unnest(ids_column).table_valued("catalog_id", with_ordinality="position").render_derived()
+    return (
+        select(func.array_agg(aggregate_order_by(model.name, positions.c.position), type_=ARRAY(String)))
+        .select_from(positions)
+        .join(model, cast(model.id, String) == positions.c.catalog_id)
+        .scalar_subquery()
+    )
+
+
+def _modality_names() -> ColumnElement:
+    return (
+        select(
+            func.array_agg(
+                aggregate_order_by(ProfessionalModality.modality_name, ProfessionalModality.modality_name),
+                type_=ARRAY(String),
+            )
+        )
+        .where(ProfessionalModality.professional_id == Professional.id, ProfessionalModality.is_active)
+        .scalar_subquery()
+    )
+
+
+def professional_export_query(filters: Sequence[ColumnElement[bool]] = ()) -> Select:
+    """Exported columns of the active professionals matching the filters, in keyset order."""
+    return (
+        select(
+            Professional.id,
+            Professional.full_name,
+            Professional.is_verified,
+            Professional.license_number,
+            Professional.years_experience,
+            Professional.rate_cents,
+            Professional.currency,
+            Professional.languages,
+            catalog_names(Professional.specialty_ids, Specialty).label("specialties"),
+            catalog_names(Professional.therapy_approaches_ids, TherapeuticApproach).label("therapeutic_approaches"),
+            _modality_names().label("modalities"),
+            Professional.timezone,
+            Professional.profile_picture,
+            Professional.created_at,
+            Professional.updated_at,
+        )
+        .where(Professional.is_active, *filters)
+        .order_by(Professional.created_at, Professional.id)
+    )
+
+
+def ndjson_chunk(rows: Sequence[Row]) -> bytes:
+    """One JSON document per line.
+
+    asyncpg returns IDs as its own UUID subclass, which orjson does not serialize natively.
+    """
+    return b"".join(orjson.dumps(row._asdict(), default=str) + b"\n" for row in rows)
+
+
+def _csv_value(value):
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(str(item) for item in value)
+    return "" if value is None else value
+
+
+def csv_chunk(rows: Sequence[Row], columns: Optional[List[str]] = None) -> bytes:
+    """CSV lines for the rows, preceded by a header line when ``columns`` are given."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if columns:
+        writer.writerow(columns)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+class AsyncProfessionalExportService:
+    """Streams the professional directory using AsyncSession."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def export(
+        self, export_format: ExportFormat = "ndjson", filters: Sequence[ColumnElement[bool]] = ()
+    ) -> AsyncIterator[bytes]:
+        """Yield the encoded export, one chunk per EXPORT_BATCH_SIZE rows."""
+        query = professional_export_query(filters).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        result = await self.db.stream(query)
+        if export_format == "csv":
+            # The header is sent even when nothing matches
+            yield csv_chunk([], list(result.keys()))
+        async for rows in result.partitions():
+            yield csv_chunk(rows) if export_format == "csv" else ndjson_chunk(rows)
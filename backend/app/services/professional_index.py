@@ -0,0 +1,360 @@
+"""
+In-process inverted index of active professionals for directory filtering.
+
+Each professional gets a bit position, assigned in (created_at, id) order. Every filterable
+value (specialty, therapeutic approach, language, modality, verified flag, price bucket)
+maps to an integer used as a bitset of the positions having it, so a filter is a handful of
+AND/OR operations and a facet count is a popcount.
+
+The index is optional (PROFESSIONAL_INDEX_ENABLED). Committed changes to professionals
+(see professional_changes) mark them dirty; they are reloaded before the next lookup, and the
+whole index is rebuilt once older than PROFESSIONAL_INDEX_TTL_SECONDS so changes made by
+other workers are picked up too.
+"""
+
+import threading
+import time
+import uuid
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from typing import Collection, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.professional import Professional
+from app.models.professional_modality import ProfessionalModality
+from app.schemas.professional import FacetCount, ProfessionalSearchFacets, ProfessionalSearchFilters
+from app.services.professional_changes import subscribe_professional_changes
+from app.services.professional_search_service import (
+    ARRAY_FACET_COLUMNS,
+    LANGUAGE_FACET,
+    MODALITY_FACET,
+    PRICE_FILTER,
+    SPECIALTY_FACET,
+    THERAPY_APPROACH_FACET,
+    VERIFIED_FILTER,
+)
+from app.services.professional_service import MAX_PAGE_SIZE
+from app.utils.pagination import Cursor
+
+# Width of a price bucket in cents. Ranges are answered from whole buckets, and only the
+# professionals in the partially covered edge buckets have their prices compared.
+PRICE_BUCKET_CENTS = 10000
+
+FACETS = (SPECIALTY_FACET, THERAPY_APPROACH_FACET, LANGUAGE_FACET, MODALITY_FACET)
+
+
+@dataclass(frozen=True)
+class IndexedProfessional:
+    """The filterable attributes of an active professional."""
+
+    id: uuid.UUID
+    created_at: datetime
+    is_verified: bool
+    values: Dict[str, FrozenSet[str]]  # facet -> values
+    prices: FrozenSet[int] = field(default_factory=frozenset)  # bookable prices in cents
+
+    @property
+    def key(self) -> Tuple[datetime, uuid.UUID]:
+        """Keyset position of the professional."""
+        return (self.created_at, self.id)
+
+
+class IndexSearchResult(NamedTuple):
+    """Page of matching IDs, in keyset order, with the total and the facet counts."""
+
+    ids: List[uuid.UUID]
+    total: int
+    facets: ProfessionalSearchFacets
+
+
+def iter_positions(bits: int) -> Iterator[int]:
+    """Yield the set bit positions of a bitset in increasing order."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class _IndexData:
+    """Bitsets over a fixed assignment of positions; positions are never reused."""
+
+    def __init__(self) -> None:
+        self.documents: List[Optional[IndexedProfessional]] = []
+        self.keys: List[Tuple[datetime, uuid.UUID]] = []
+        self.positions: Dict[uuid.UUID, int] = {}
+        self.live = 0
+        self.verified = 0
+        self.values: Dict[str, Dict[str, int]] = {facet: defaultdict(int) for facet in FACETS}
+        self.price_buckets: Dict[int, int] = defaultdict(int)
+        self.built_at = time.monotonic()
+
+    def append(self, document: IndexedProfessional) -> bool:
+        """Add a new professional after the last position. False if that would break keyset order."""
+        if self.keys and document.key <= self.keys[-1]:
+            return False
+        position = len(self.documents)
+        self.documents.append(None)
+        self.keys.append(document.key)
+        self.positions[document.id] = position
+        self._set(position, document)
+        return True
+
+    def replace(self, professional_id: uuid.UUID, document: Optional[IndexedProfessional]) -> bool:
+        """Re-index a known professional (None removes it). False if the professional is unknown."""
+        position = self.positions.get(professional_id)
+        if position is None:
+            return False
+        self._clear(position)
+        if document is not None:
+            self._set(position, document)
+        return True
+
+    def _set(self, position: int, document: IndexedProfessional) -> None:
+        bit = 1 << position
+        self.documents[position] = document
+        self.live |= bit
+        if document.is_verified:
+            self.verified |= bit
+        for facet, values in document.values.items():
+            for value in values:
+                self.values[facet][value] |= bit
+        for bucket in {price // PRICE_BUCKET_CENTS for price in document.prices}:
+            self.price_buckets[bucket] |= bit
+
+    def _clear(self, position: int) -> None:
+        document = self.documents[position]
+        if document is None:
+            return
+        mask = ~(1 << position)
+        self.documents[position] = None
+        self.live &= mask
+        self.verified &= mask
+        for facet, values in document.values.items():
+            for value in values:
+                self.values[facet][value] &= mask
+        for bucket in {price // PRICE_BUCKET_CENTS for price in document.prices}:
+            self.price_buckets[bucket] &= mask
+
+    def price_bits(self, min_price_cents: Optional[int], max_price_cents: Optional[int]) -> int:
+        """Positions with at least one bookable price within the bounds."""
+        low = min_price_cents if min_price_cents is not None else 0
+        high = max_price_cents if max_price_cents is not None else float("inf")
+        matches = 0
+        for bucket, bits in self.price_buckets.items():
+            bucket_low, bucket_high = bucket * PRICE_BUCKET_CENTS, (bucket + 1) * PRICE_BUCKET_CENTS - 1
+            if bucket_high < low or bucket_low > high:
+                continue
+            if low <= bucket_low and bucket_high <= high:
+                matches |= bits
+                continue
+            # Edge bucket: compare the actual prices
+            for position in iter_positions(bits & ~matches):
+                if any(low <= price <= high for price in self.documents[position].prices):
+                    matches |= 1 << position
+        return matches
+
+    def value_bits(self, facet: str, values: Iterable[str], match: str = "any") -> int:
+        """Positions having any (or all) of the values of a facet."""
+        facet_values = self.values[facet]
+        if match == "all":
+            bits = self.live
+            for value in values:
+                bits &= facet_values.get(value, 0)
+            return bits
+        bits = 0
+        for value in values:
+            bits |= facet_values.get(value, 0)
+        return bits
+
+
+def _filter_bits(data: _IndexData, filters: ProfessionalSearchFilters) -> Dict[str, int]:
+    """One bitset per active filter, keyed like build_search_criteria."""
+    bitsets: Dict[str, int] = {}
+    for facet in ARRAY_FACET_COLUMNS:
+        values = getattr(filters, facet)
+        if values:
+            bitsets[facet] = data.value_bits(facet, values, getattr(filters, f"{facet}_match"))
+    if filters.modality_ids:
+        bitsets[MODALITY_FACET] = data.value_bits(MODALITY_FACET, [str(value) for value in filters.modality_ids])
+    if filters.is_verified is not None:
+        bitsets[VERIFIED_FILTER] = data.verified if filters.is_verified else data.live & ~data.verified
+    if filters.min_price_cents is not None or filters.max_price_cents is not None:
+        bitsets[PRICE_FILTER] = data.price_bits(filters.min_price_cents, filters.max_price_cents)
+    return bitsets
+
+
+def _intersect(base: int, bitsets: Iterable[int]) -> int:
+    for bits in bitsets:
+        base &= bits
+    return base
+
+
+class ProfessionalIndex:
+    """Process-local inverted index answering professional filter and facet queries."""
+
+    def __init__(self, ttl_seconds: float = 300) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._data: Optional[_IndexData] = None
+        self._dirty: Set[uuid.UUID] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def supports(filters: ProfessionalSearchFilters) -> bool:
+        """Free text is only answered by Postgres."""
+        return not filters.text
+
+    def mark_dirty(self, professional_ids: Iterable[uuid.UUID]) -> None:
+        """Reload these professionals before the next lookup. Safe to call from any thread."""
+        ids = {uuid.UUID(str(professional_id)) for professional_id in professional_ids if professional_id}
+        with self._lock:
+            self._dirty.update(ids)
+
+    def invalidate(self) -> None:
+        """Rebuild the whole index before the next lookup."""
+        self._data = None
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        """Build the index if missing or expired, otherwise reload the dirty professionals."""
+        data = self._data
+        if data is None or time.monotonic() - data.built_at > self.ttl_seconds:
+            with self._lock:
+                self._dirty.clear()
+            self._data = await self._build(db)
+            return
+
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return
+        documents = await _load_documents(db, list(dirty))
+        for professional_id in dirty:
+            document = documents.get(professional_id)
+            if data.replace(professional_id, document):
+                continue
+            if document is not None and not data.append(document):
+                # A new professional sorting before existing ones: positions must be reassigned
+                self._data = await self._build(db)
+                return
+
+    async def _build(self, db: AsyncSession) -> _IndexData:
+        data = _IndexData()
+        documents = await _load_documents(db)
+        for document in sorted(documents.values(), key=lambda document: document.key):
+            data.append(document)
+        return data
+
+    def search(
+        self,
+        filters: ProfessionalSearchFilters,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+        conjunctive: Collection[str] = (),
+    ) -> IndexSearchResult:
+        """Return a page of matching IDs in (created_at, id) order, the total and the facet counts.
+
+        Mirrors AsyncProfessionalSearchService's SQL semantics; call ensure_fresh first.
+        """
+        data = self._data
+        if data is None:
+            raise RuntimeError("Professional index has not been built")
+
+        bitsets = _filter_bits(data, filters)
+        matches = _intersect(data.live, bitsets.values())
+
+        counts: Dict[str, List[FacetCount]] = {}
+        for facet in FACETS:
+            # Same rule as the SQL facet query: only "all" facets are counted within their own filter
+            keep_own = facet in conjunctive
+            base = _intersect(data.live, (bits for name, bits in bitsets.items() if keep_own or name != facet))
+            facet_counts = [
+                FacetCount(value=value, count=count)
+                for value, bits in data.values[facet].items()
+                if (count := (bits & base).bit_count())
+            ]
+            facet_counts.sort(key=lambda facet_count: (-facet_count.count, facet_count.value))
+            counts[facet] = facet_counts
+
+        page_bits, offset = matches, skip
+        if cursor is not None:
+            start = bisect_right(data.keys, (cursor.created_at, cursor.id))
+            page_bits, offset = page_bits >> start << start, 0
+        page = islice(iter_positions(page_bits), offset, offset + min(limit, MAX_PAGE_SIZE))
+        ids = [data.documents[position].id for position in page]
+
+        return IndexSearchResult(ids, matches.bit_count(), ProfessionalSearchFacets(**counts))
+
+
+async def _load_documents(
+    db: AsyncSession, professional_ids: Optional[List[uuid.UUID]] = None
+) -> Dict[uuid.UUID, IndexedProfessional]:
+    """Load the indexed attributes of active professionals (all, or only the given IDs)."""
+    professionals = select(
+        Professional.id,
+        Professional.created_at,
+        Professional.is_verified,
+        *ARRAY_FACET_COLUMNS.values(),
+    ).where(Professional.is_active)
+    modalities = (
+        select(
+            ProfessionalModality.professional_id,
+            ProfessionalModality.modality_id,
+            ProfessionalModality.virtual_price,
+            ProfessionalModality.presencial_price,
+            ProfessionalModality.offers_presencial,
+        )
+        .join(Professional, Professional.id == ProfessionalModality.professional_id)
+        .where(ProfessionalModality.is_active, Professional.is_active)
+    )
+    if professional_ids is not None:
+        professionals = professionals.where(Professional.id.in_(professional_ids))
+        modalities = modalities.where(ProfessionalModality.professional_id.in_(professional_ids))
+
+    modality_ids: Dict[uuid.UUID, Set[str]] = defaultdict(set)
+    prices: Dict[uuid.UUID, Set[int]] = defaultdict(set)
+    for professional_id, modality_id, virtual_price, presencial_price, offers_presencial in (
+        await db.execute(modalities)
+    ).all():
+        modality_ids[professional_id].add(str(modality_id))
+        prices[professional_id].add(virtual_price)
+        if offers_presencial:
+            prices[professional_id].add(presencial_price)
+
+    documents = {}
+    for row in (await db.execute(professionals)).all():
+        values = {facet: frozenset(getattr(row, facet) or ()) for facet in ARRAY_FACET_COLUMNS}
+        values[MODALITY_FACET] = frozenset(modality_ids[row.id])
+        documents[row.id] = IndexedProfessional(
+            id=row.id,
+            created_at=row.created_at,
+            is_verified=bool(row.is_verified),
+            values=values,
+            prices=frozenset(prices[row.id]),
+        )
+    return documents
+
+
+@lru_cache(maxsize=1)
+def get_professional_index() -> Optional[ProfessionalIndex]:
+    """Return the process-wide index, or None when disabled (queries then go to Postgres)."""
+    settings = get_settings()
+    if not settings.PROFESSIONAL_INDEX_ENABLED:
+        return None
+    return ProfessionalIndex(ttl_seconds=settings.PROFESSIONAL_INDEX_TTL_SECONDS)
+
+
+def _mark_index_dirty(professional_ids: Set[uuid.UUID]) -> None:
+    """Reload committed professionals before the next lookup."""
+    index = get_professional_index()
+    if index is not None:
+        index.mark_dirty(professional_ids)
+
+
+subscribe_professional_changes(_mark_index_dirty)
@@ -0,0 +1,55 @@
+"""
+Set-based sync of a professional's links in a junction table (specialties, therapeutic approaches).
+
+Only the difference with the stored links is written: one bulk DELETE for the removed IDs and
+one INSERT ... ON CONFLICT DO NOTHING for the added ones, relying on the unique
+(professional_id, target) constraint of the junction table. Unchanged links are left alone.
+"""
+
+from typing import Iterable, List, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.services.professional_changes import publish_professional_changes
+
+
+def link_ids_difference(current_ids: Iterable, target_ids: Iterable) -> Tuple[List[str], List[str]]:
+    """IDs to add and to remove to go from ``current_ids`` to ``target_ids``, in request order."""
+    target = list(dict.fromkeys(str(target_id).strip().lower() for target_id in target_ids))
+    current = {str(current_id).lower() for current_id in current_ids}
+    target_set = set(target)
+    added = [target_id for target_id in target if target_id not in current]
+    removed = sorted(current - target_set)
+    return added, removed
+
+
+def sync_professional_links(db: Session, model, column, professional_id: str, target_ids: Iterable) -> bool:
+    """
+    Make ``column`` of the professional's ``model`` rows exactly ``target_ids`` and commit.
+
+    Returns whether anything changed. Bulk statements bypass the session hooks, so the change
+    is published here.
+    """
+    current_ids = db.scalars(select(column).where(model.professional_id == professional_id)).all()
+    added, removed = link_ids_difference(current_ids, target_ids)
+
+    if removed:
+        db.execute(
+            delete(model)
+            .where(model.professional_id == professional_id, column.in_(removed))
+            .execution_options(synchronize_session=False)
+        )
+    if added:
+        db.execute(
+            insert(model)
+            .values([{"professional_id": professional_id, column.key: target_id} for target_id in added])
+            .on_conflict_do_nothing(index_elements=[model.professional_id, column])
+        )
+    db.commit()
+
+    changed = bool(added or removed)
+    if changed:
+        publish_professional_changes([professional_id])
+    return changed
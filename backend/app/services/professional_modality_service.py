@@ -2,15 +2,41 @@
 Professional modality service for managing professional modalities.
 """
 
+import uuid
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Update, or_, select, update
+from sqlalchemy.orm import Session, aliased
 
 from app.models.professional_modality import ProfessionalModality
 from app.schemas.professional_modality import (
     ProfessionalModalityCreate,
     ProfessionalModalityUpdate,
 )
+from app.services.professional_changes import publish_professional_changes
+
+
+def default_modality_update(professional_id, modality_id) -> Update:
+    """UPDATE making a modality the only default of its professional, in one statement.
+
+    The current default and the new one are updated together, and the one-default constraint is
+    checked at the end of the statement, so no reader or concurrent switch ever sees zero or two
+    defaults. Nothing changes when the modality is not the professional's.
+
+    A bulk statement bypasses the session hooks: callers publish the professional's change.
+    """
+    target = aliased(ProfessionalModality)
+    is_target = ProfessionalModality.id == modality_id
+    return (
+        update(ProfessionalModality)
+        .where(
+            ProfessionalModality.professional_id == professional_id,
+            or_(ProfessionalModality.is_default, is_target),
+            select(target.id).where(target.id == modality_id, target.professional_id == professional_id).exists(),
+        )
+        .values(is_default=is_target)
+        .execution_options(synchronize_session=False)
+    )
 
 
 class ProfessionalModalityService:
@@ -48,15 +74,16 @@ class ProfessionalModalityService:
 
     def create_professional_modality(self, modality: ProfessionalModalityCreate) -> ProfessionalModality:
         """Create a new professional modality."""
-        # If this is being marked as default, remove default flag from other modalities
-        if modality.is_default:
-            self.db.query(ProfessionalModality).filter(
-                ProfessionalModality.professional_id == modality.professional_id,
-                ProfessionalModality.is_default,
-            ).update({"is_default": False})
-
-        db_modality = ProfessionalModality(**modality.dict())
+        data = modality.dict()
+        # Inserted as non-default; becoming the default is a single switch statement
+        is_default = data.pop("is_default", False)
+        modality_id = uuid.uuid4()
+        db_modality = ProfessionalModality(id=modality_id, **data)
         self.db.add(db_modality)
+        if is_default:
+            self.db.flush()
+            self.db.execute(default_modality_update(modality.professional_id, modality_id))
+
         self.db.commit()
         self.db.refresh(db_modality)
         return db_modality
@@ -69,19 +96,19 @@ class ProfessionalModalityService:
         if not db_modality:
             return None
 
-        # If this is being marked as default, remove default flag from other modalities
-        if modality_update.is_default:
-            self.db.query(ProfessionalModality).filter(
-                ProfessionalModality.professional_id == db_modality.professional_id,
-                ProfessionalModality.id != modality_id,
-                ProfessionalModality.is_default,
-            ).update({"is_default": False})
-
         update_data = modality_update.dict(exclude_unset=True)
+        # Becoming the default is a single switch statement, which also clears the previous default
+        make_default = update_data.get("is_default") is True
+        if make_default:
+            del update_data["is_default"]
         for field, value in update_data.items():
             setattr(db_modality, field, value)
+        if make_default:
+            self.db.execute(default_modality_update(db_modality.professional_id, db_modality.id))
 
         self.db.commit()
+        if make_default:
+            publish_professional_changes([db_modality.professional_id])
         self.db.refresh(db_modality)
         return db_modality
 
@@ -91,21 +118,20 @@ class ProfessionalModalityService:
         if not db_modality:
             return False
 
-        # If this was the default modality, we need to set another one as default
+        # If this was the default modality, another one becomes the default before it goes
         if db_modality.is_default:
-            other_modalities = (
+            other_modality = (
                 self.db.query(ProfessionalModality)
                 .filter(
                     ProfessionalModality.professional_id == db_modality.professional_id,
                     ProfessionalModality.id != modality_id,
                     ProfessionalModality.is_active,
                 )
-                .all()
+                .first()
             )
 
-            if other_modalities:
-                other_modalities[0].is_default = True
-                self.db.commit()
+            if other_modality:
+                self.db.execute(default_modality_update(db_modality.professional_id, other_modality.id))
 
         self.db.delete(db_modality)
         self.db.commit()
@@ -113,21 +139,9 @@ class ProfessionalModalityService:
 
     def set_default_modality(self, professional_id: str, modality_id: str) -> bool:
         """Set a modality as default for a professional."""
-        # Remove default flag from all modalities for this professional
-        self.db.query(ProfessionalModality).filter(
-            ProfessionalModality.professional_id == professional_id,
-            ProfessionalModality.is_default,
-        ).update({"is_default": False})
-
-        # Set the specified modality as default
-        result = (
-            self.db.query(ProfessionalModality)
-            .filter(
-                ProfessionalModality.id == modality_id,
-                ProfessionalModality.professional_id == professional_id,
-            )
-            .update({"is_default": True})
-        )
-
+        result = self.db.execute(default_modality_update(professional_id, modality_id))
         self.db.commit()
-        return result > 0
+        switched = result.rowcount > 0
+        if switched:
+            publish_professional_changes([professional_id])
+        return switched
@@ -0,0 +1,224 @@
+"""
+Faceted professional search service.
+"""
+
+from typing import TYPE_CHECKING, AbstractSet, Collection, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    String,
+    and_,
+    cast,
+    distinct,
+    func,
+    literal,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.models.professional import Professional
+from app.models.professional_modality import ProfessionalModality
+from app.schemas.professional import ArrayMatch, FacetCount, ProfessionalSearchFacets, ProfessionalSearchFilters
+from app.services.professional_service import AsyncProfessionalService, text_search_criterion
+from app.utils.pagination import Cursor
+
+if TYPE_CHECKING:
+    from app.services.professional_index import ProfessionalIndex
+
+# Facet names, matching the ProfessionalSearchFacets fields
+SPECIALTY_FACET = "specialty_ids"
+THERAPY_APPROACH_FACET = "therapy_approaches_ids"
+LANGUAGE_FACET = "languages"
+MODALITY_FACET = "modality_ids"
+# Not facets: these narrow every facet but are not counted themselves
+PRICE_FILTER = "price"
+TEXT_FILTER = "text"
+VERIFIED_FILTER = "is_verified"
+# Pseudo facet carrying the total number of matches in the facet statement
+TOTAL_FACET = "total"
+
+ARRAY_FACET_COLUMNS = {
+    SPECIALTY_FACET: Professional.specialty_ids,
+    THERAPY_APPROACH_FACET: Professional.therapy_approaches_ids,
+    LANGUAGE_FACET: Professional.languages,
+}
+
+
+class ProfessionalSearchResult(NamedTuple):
+    """A page of matching professionals with the total and the facet counts."""
+
+    items: List[Professional]
+    total: int
+    facets: ProfessionalSearchFacets
+
+
+def _price_in_range(price, min_price_cents: Optional[int], max_price_cents: Optional[int]) -> ColumnElement[bool]:
+    """Compare a modality price column against the optional bounds."""
+    bounds = []
+    if min_price_cents is not None:
+        bounds.append(price >= min_price_cents)
+    if max_price_cents is not None:
+        bounds.append(price <= max_price_cents)
+    return and_(*bounds)
+
+
+def array_criterion(column, values: List[str], match: ArrayMatch = "any") -> ColumnElement[bool]:
+    """Match an array column against several values with a GIN-indexable operator.
+
+    "any" keeps rows sharing at least one value (&&), "all" rows containing every value (@>).
+    """
+    if match == "all":
+        return column.contains(values)
+    return column.overlap(values)
+
+
+def build_search_criteria(filters: ProfessionalSearchFilters) -> Dict[str, ColumnElement[bool]]:
+    """Build one criterion per active filter, keyed by facet name.
+
+    Values within a facet are OR-ed (array overlap / IN) unless matched with "all" (array
+    containment); the criteria are AND-ed by the caller.
+    """
+    criteria: Dict[str, ColumnElement[bool]] = {}
+    if filters.text:
+        criteria[TEXT_FILTER] = text_search_criterion(filters.text)
+
+    for facet, column in ARRAY_FACET_COLUMNS.items():
+        values = getattr(filters, facet)
+        if values:
+            criteria[facet] = array_criterion(column, values, getattr(filters, f"{facet}_match"))
+
+    if filters.is_verified is not None:
+        criteria[VERIFIED_FILTER] = Professional.is_verified.is_(filters.is_verified)
+
+    if filters.modality_ids:
+        criteria[MODALITY_FACET] = Professional.professional_modalities.any(
+            and_(ProfessionalModality.is_active, ProfessionalModality.modality_id.in_(filters.modality_ids))
+        )
+
+    if filters.min_price_cents is not None or filters.max_price_cents is not None:
+        bounds = (filters.min_price_cents, filters.max_price_cents)
+        presencial_in_range = and_(
+            ProfessionalModality.offers_presencial,
+            _price_in_range(ProfessionalModality.presencial_price, *bounds),
+        )
+        criteria[PRICE_FILTER] = Professional.professional_modalities.any(
+            and_(
+                ProfessionalModality.is_active,
+                or_(_price_in_range(ProfessionalModality.virtual_price, *bounds), presencial_in_range),
+            )
+        )
+    return criteria
+
+
+def _criteria_except(criteria: Dict[str, ColumnElement[bool]], facet: str) -> List[ColumnElement[bool]]:
+    """Criteria for counting a facet: every filter but the facet's own."""
+    return [criterion for name, criterion in criteria.items() if name != facet]
+
+
+def _facet_criteria(
+    criteria: Dict[str, ColumnElement[bool]], facet: str, conjunctive: Collection[str]
+) -> List[ColumnElement[bool]]:
+    """Criteria for counting a facet: conjunctive ("all") facets keep their own filter."""
+    if facet in conjunctive:
+        return list(criteria.values())
+    return _criteria_except(criteria, facet)
+
+
+def _array_facet_query(facet: str, column, criteria: List[ColumnElement[bool]]) -> Select:
+    """Count active professionals per element of an array column."""
+    value = func.unnest(column).label("value")
+    rows = select(Professional.id, value).where(Professional.is_active, *criteria).distinct().subquery()
+    label = literal(facet, String).label("facet")
+    return select(label, rows.c.value, func.count().label("count")).group_by(rows.c.value)
+
+
+def _modality_facet_query(criteria: List[ColumnElement[bool]]) -> Select:
+    """Count active professionals per active modality."""
+    return (
+        select(
+            literal(MODALITY_FACET, String).label("facet"),
+            cast(ProfessionalModality.modality_id, String).label("value"),
+            func.count(distinct(ProfessionalModality.professional_id)).label("count"),
+        )
+        .join(Professional, Professional.id == ProfessionalModality.professional_id)
+        .where(ProfessionalModality.is_active, Professional.is_active, *criteria)
+        .group_by(ProfessionalModality.modality_id)
+    )
+
+
+def build_facet_query(criteria: Dict[str, ColumnElement[bool]], conjunctive: Collection[str] = ()) -> CompoundSelect:
+    """Build a single statement returning (facet, value, count) rows for every facet plus the total."""
+    total = (
+        select(
+            literal(TOTAL_FACET, String).label("facet"),
+            literal("", String).label("value"),
+            func.count().label("count"),
+        )
+        .select_from(Professional)
+        .where(Professional.is_active, *criteria.values())
+    )
+    facets = [
+        _array_facet_query(facet, column, _facet_criteria(criteria, facet, conjunctive))
+        for facet, column in ARRAY_FACET_COLUMNS.items()
+    ]
+    facets.append(_modality_facet_query(_criteria_except(criteria, MODALITY_FACET)))
+    return union_all(total, *facets)
+
+
+class AsyncProfessionalSearchService:
+    """Faceted search over active professionals using AsyncSession."""
+
+    def __init__(self, db: AsyncSession, index: Optional["ProfessionalIndex"] = None):
+        self.db = db
+        self.index = index
+
+    async def search(
+        self,
+        filters: ProfessionalSearchFilters,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> ProfessionalSearchResult:
+        """Return a page of professionals matching the filters plus per-facet counts.
+
+        With an in-process index, filtering and counting happen in memory and only the page
+        rows are read from Postgres. Otherwise facet counts and the total come from one
+        UNION ALL statement, independent of the number of facets or selected values. With
+        free text the page is ranked by relevance (always answered by Postgres). ``fields``
+        restricts the columns loaded for the page (see professional_field_loaders()).
+        """
+        conjunctive = [facet for facet in ARRAY_FACET_COLUMNS if getattr(filters, f"{facet}_match") == "all"]
+        if self.index is not None and self.index.supports(filters):
+            await self.index.ensure_fresh(self.db)
+            hit = self.index.search(filters, skip=skip, limit=limit, cursor=cursor, conjunctive=conjunctive)
+            professionals = await AsyncProfessionalService(self.db).get_active_professionals_by_ids(hit.ids, fields)
+            return ProfessionalSearchResult(professionals, hit.total, hit.facets)
+
+        criteria = build_search_criteria(filters)
+        professionals = await AsyncProfessionalService(self.db).get_professionals(
+            skip=skip,
+            limit=limit,
+            filters=_criteria_except(criteria, TEXT_FILTER),
+            cursor=cursor,
+            text=filters.text,
+            fields=fields,
+        )
+
+        facet_rows = (await self.db.execute(build_facet_query(criteria, conjunctive))).all()
+
+        total = 0
+        counts: Dict[str, List[FacetCount]] = {facet: [] for facet in ProfessionalSearchFacets.model_fields}
+        for facet, value, count in facet_rows:
+            if facet == TOTAL_FACET:
+                total = count
+            elif value is not None:
+                counts[facet].append(FacetCount(value=value, count=count))
+        for values in counts.values():
+            values.sort(key=lambda facet_count: (-facet_count.count, facet_count.value))
+
+        return ProfessionalSearchResult(professionals, total, ProfessionalSearchFacets(**counts))
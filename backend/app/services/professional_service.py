@@ -2,19 +2,88 @@
 Professional service for business logic.
 """
 
-from typing import List, Optional
+import uuid
+from typing import AbstractSet, List, Optional, Sequence
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, cast, func, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only, raiseload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.models.professional import Professional
+from app.models.professional import TEXT_SEARCH_CONFIG, Professional
 from app.schemas.professional import ProfessionalUpdate
 from app.services.professional_modality_service import ProfessionalModalityService
 from app.services.professional_specialty_service import ProfessionalSpecialtyService
 from app.services.professional_therapeutic_approach_service import (
     ProfessionalTherapeuticApproachService,
 )
+from app.utils.pagination import Cursor, paginate
+
+
+# Largest page served by the professional listings. It stays below the selectin IN batch
+# size (500) so every eager load below is a single statement whatever the page size.
+MAX_PAGE_SIZE = 100
+
+# Statements needed to read a page of professionals: the page itself plus one per
+# eagerly loaded relationship (specialty links, modalities), plus the periodic check that
+# the catalog snapshot, which supplies the specialties, is current.
+PROFESSIONAL_PAGE_QUERY_COUNT = 4
+
+
+# Columns always loaded with a sparse fieldset: the keyset and the response validators
+SPARSE_FIELDSET_COLUMNS = ("id", "created_at", "updated_at")
+
+
+def professional_relationship_loaders() -> tuple[LoaderOption, ...]:
+    """Loader options for the relationships read by parse_professional_data.
+
+    AsyncSession cannot lazy load, so every query whose rows end up serialized must
+    load these relationships eagerly. Any other relationship raises instead of
+    silently issuing one query per row. Linked specialties are read from the catalog
+    snapshot, not loaded.
+    """
+    return (
+        selectinload(Professional.professional_specialties),
+        selectinload(Professional.professional_modalities),
+        raiseload("*"),
+    )
+
+
+def professional_field_loaders(fields: Optional[AbstractSet[str]] = None) -> tuple[LoaderOption, ...]:
+    """Loader options for a sparse fieldset of serialized professional fields.
+
+    Only the requested columns, plus the keyset and version columns (id, created_at,
+    updated_at), are selected, and modalities are only loaded when requested. Reading
+    any other attribute raises. Without ``fields``, everything parse_professional_data
+    reads is loaded.
+    """
+    if fields is None:
+        return professional_relationship_loaders()
+    column_names = Professional.__mapper__.column_attrs.keys()
+    columns = [
+        getattr(Professional, name) for name in column_names if name in fields or name in SPARSE_FIELDSET_COLUMNS
+    ]
+    options = [load_only(*columns, raiseload=True)]
+    if "modalities" in fields:
+        options.append(selectinload(Professional.professional_modalities))
+    options.append(raiseload("*"))
+    return tuple(options)
+
+
+def text_search_query(text: str) -> ColumnElement:
+    """Parse free text ("terapia de pareja", "ansiedad -niños") into a tsquery.
+
+    Uses the same accent-folding configuration as Professional.search_vector so the GIN index applies.
+    """
+    return func.websearch_to_tsquery(cast(TEXT_SEARCH_CONFIG, REGCONFIG), text)
+
+
+def text_search_criterion(text: str) -> ColumnElement[bool]:
+    """Match professionals whose name or bio matches the free text."""
+    return Professional.search_vector.op("@@")(text_search_query(text))
 
 
 class ProfessionalService:
@@ -43,7 +112,7 @@ class ProfessionalService:
         return (
             self.db.query(Professional)
             .filter(
-                Professional.specialty_ids.any(specialty),
+                Professional.specialty_ids.contains([specialty]),
                 Professional.is_active,
             )
             .all()
@@ -97,3 +166,110 @@ class ProfessionalService:
         except SQLAlchemyError:
             self.db.rollback()
             return False
+
+
+class AsyncProfessionalService:
+    """Async counterpart of ProfessionalService for use with AsyncSession."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_professional_by_id(self, professional_id: str) -> Optional[Professional]:
+        """Get professional by ID, with the relationships needed for serialization."""
+        try:
+            professional_uuid = uuid.UUID(str(professional_id))
+        except ValueError:
+            return None
+        result = await self.db.execute(
+            select(Professional)
+            .where(Professional.id == professional_uuid)
+            .options(*professional_relationship_loaders())
+        )
+        return result.scalars().first()
+
+    async def get_active_professional_by_id(
+        self, professional_id: uuid.UUID, fields: Optional[AbstractSet[str]] = None
+    ) -> Optional[Professional]:
+        """Get an active professional by ID, loading what serializing ``fields`` (default: all) needs."""
+        result = await self.db.execute(
+            select(Professional)
+            .where(Professional.id == professional_id, Professional.is_active)
+            .options(*professional_field_loaders(fields))
+        )
+        return result.scalars().first()
+
+    async def get_professional_by_email(self, email: str) -> Optional[Professional]:
+        """Get professional by email."""
+        result = await self.db.execute(select(Professional).where(Professional.email == email))
+        return result.scalars().first()
+
+    async def get_active_professionals_by_ids(
+        self, professional_ids: Sequence[uuid.UUID], fields: Optional[AbstractSet[str]] = None
+    ) -> List[Professional]:
+        """Get active professionals by ID, in the order of the given IDs; missing IDs are skipped."""
+        if not professional_ids:
+            return []
+        result = await self.db.execute(
+            select(Professional)
+            .where(Professional.id.in_(professional_ids), Professional.is_active)
+            .options(*professional_field_loaders(fields))
+        )
+        by_id = {professional.id: professional for professional in result.scalars().all()}
+        return [by_id[professional_id] for professional_id in professional_ids if professional_id in by_id]
+
+    async def get_professionals(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Sequence[ColumnElement[bool]] = (),
+        cursor: Optional[Cursor] = None,
+        text: Optional[str] = None,
+        fields: Optional[AbstractSet[str]] = None,
+    ) -> List[Professional]:
+        """Get a page of active professionals matching the given filters.
+
+        Rows are ordered by (created_at, id); a cursor takes precedence over skip. With a
+        free-text query, only matches are returned, best ranked first, and the cursor must
+        not be used since it does not encode the rank. Loads the page in
+        PROFESSIONAL_PAGE_QUERY_COUNT statements for any limit up to MAX_PAGE_SIZE, or fewer
+        with a sparse fieldset (``fields``).
+        """
+        query = (
+            select(Professional).where(Professional.is_active, *filters).options(*professional_field_loaders(fields))
+        )
+        if text:
+            ts_query = text_search_query(text)
+            query = query.where(Professional.search_vector.op("@@")(ts_query)).order_by(
+                func.ts_rank_cd(Professional.search_vector, ts_query).desc()
+            )
+        result = await self.db.execute(
+            paginate(query, Professional, skip=skip, limit=min(limit, MAX_PAGE_SIZE), cursor=cursor)
+        )
+        return list(result.scalars().all())
+
+    async def get_professionals_by_specialty(self, specialty: str) -> List[Professional]:
+        """Get professionals by specialty."""
+        result = await self.db.execute(
+            select(Professional)
+            .where(
+                Professional.specialty_ids.contains([specialty]),
+                Professional.is_active,
+            )
+            .options(*professional_relationship_loaders())
+        )
+        return list(result.scalars().all())
+
+    async def deactivate_professional(self, professional_id: str) -> bool:
+        """Deactivate professional."""
+        professional = await self.get_professional_by_id(professional_id)
+        if not professional:
+            return False
+
+        try:
+            professional.is_active = False
+            await self.db.commit()
+            return True
+
+        except SQLAlchemyError:
+            await self.db.rollback()
+            return False
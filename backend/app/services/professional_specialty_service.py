@@ -11,6 +11,7 @@ from app.schemas.professional_specialty import (
     ProfessionalSpecialtyCreate,
     ProfessionalSpecialtyUpdate,
 )
+from app.services.professional_links import sync_professional_links
 
 
 class ProfessionalSpecialtyService:
@@ -66,20 +67,8 @@ class ProfessionalSpecialtyService:
     def add_specialties_to_professional(
         self, professional_id: str, specialty_ids: List[str]
     ) -> List[ProfessionalSpecialty]:
-        """Add multiple specialties to a professional."""
-        # Remove existing specialties for this professional
-        self.db.query(ProfessionalSpecialty).filter(ProfessionalSpecialty.professional_id == professional_id).delete()
-
-        # Add new specialties
-        new_specialties = []
-        for specialty_id in specialty_ids:
-            specialty = ProfessionalSpecialtyCreate(professional_id=professional_id, specialty_id=specialty_id)
-            db_specialty = ProfessionalSpecialty(**specialty.dict())
-            self.db.add(db_specialty)
-            new_specialties.append(db_specialty)
-
-        self.db.commit()
-        for specialty in new_specialties:
-            self.db.refresh(specialty)
-
-        return new_specialties
+        """Set the specialties of a professional, writing only the added and removed links."""
+        sync_professional_links(
+            self.db, ProfessionalSpecialty, ProfessionalSpecialty.specialty_id, professional_id, specialty_ids
+        )
+        return self.get_professional_specialties(professional_id)
@@ -12,6 +12,7 @@ from app.schemas.professional_therapeutic_approach import (
     ProfessionalTherapeuticApproachCreate,
     ProfessionalTherapeuticApproachUpdate,
 )
+from app.services.professional_links import sync_professional_links
 
 
 class ProfessionalTherapeuticApproachService:
@@ -75,24 +76,12 @@ class ProfessionalTherapeuticApproachService:
     def add_therapeutic_approaches_to_professional(
         self, professional_id: str, approach_ids: List[str]
     ) -> List[ProfessionalTherapeuticApproach]:
-        """Add multiple therapeutic approaches to a professional."""
-        # Remove existing therapeutic approaches for this professional
-        self.db.query(ProfessionalTherapeuticApproach).filter(
-            ProfessionalTherapeuticApproach.professional_id == professional_id
-        ).delete()
-
-        # Add new therapeutic approaches
-        new_approaches = []
-        for approach_id in approach_ids:
-            approach = ProfessionalTherapeuticApproachCreate(
-                professional_id=professional_id, therapeutic_approach_id=approach_id
-            )
-            db_approach = ProfessionalTherapeuticApproach(**approach.dict())
-            self.db.add(db_approach)
-            new_approaches.append(db_approach)
-
-        self.db.commit()
-        for approach in new_approaches:
-            self.db.refresh(approach)
-
-        return new_approaches
+        """Set the therapeutic approaches of a professional, writing only the added and removed links."""
+        sync_professional_links(
+            self.db,
+            ProfessionalTherapeuticApproach,
+            ProfessionalTherapeuticApproach.therapeutic_approach_id,
+            professional_id,
+            approach_ids,
+        )
+        return self.get_professional_therapeutic_approaches(professional_id)
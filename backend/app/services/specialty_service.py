@@ -4,10 +4,14 @@ Specialty service for managing specialties (new version without price/descriptio
 
 from typing import List, Optional
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.specialty import Specialty
 from app.schemas.specialty import SpecialtyCreate, SpecialtyUpdate
+from app.services.catalog_cache import SPECIALTIES, CatalogCache, CatalogSnapshot
+from app.utils.pagination import Cursor, paginate
 
 
 class SpecialtyService:
@@ -59,3 +63,79 @@ class SpecialtyService:
         self.db.delete(db_specialty)
         self.db.commit()
         return True
+
+
+class AsyncSpecialtyService:
+    """Async counterpart of SpecialtyService for use with AsyncSession.
+
+    With a ``catalog`` cache, reads are answered from its snapshot (as CatalogEntry objects)
+    instead of the database. Writes always go to the database.
+    """
+
+    def __init__(self, db: AsyncSession, catalog: Optional[CatalogCache] = None):
+        self.db = db
+        self.catalog = catalog
+
+    async def _snapshot(self) -> Optional[CatalogSnapshot]:
+        return await self.catalog.snapshot(self.db) if self.catalog is not None else None
+
+    async def _get_specialty_row(self, specialty_id: str) -> Optional[Specialty]:
+        result = await self.db.execute(select(Specialty).where(Specialty.id == specialty_id))
+        return result.scalars().first()
+
+    async def get_specialty(self, specialty_id: str) -> Optional[Specialty]:
+        """Get a specialty by ID."""
+        snapshot = await self._snapshot()
+        if snapshot is not None:
+            return snapshot.get(SPECIALTIES, specialty_id)
+        return await self._get_specialty_row(specialty_id)
+
+    async def get_specialties(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
+    ) -> List[Specialty]:
+        """Get all specialties, ordered by (created_at, id); a cursor takes precedence over skip."""
+        snapshot = await self._snapshot()
+        if snapshot is not None:
+            return snapshot.page(SPECIALTIES, skip=skip, limit=limit, cursor=cursor)
+        result = await self.db.execute(paginate(select(Specialty), Specialty, skip=skip, limit=limit, cursor=cursor))
+        return list(result.scalars().all())
+
+    async def get_specialties_by_category(self, category: str) -> List[Specialty]:
+        """Get specialties by category."""
+        snapshot = await self._snapshot()
+        if snapshot is not None:
+            return snapshot.page(SPECIALTIES, where=lambda specialty: specialty.category == category)
+        result = await self.db.execute(select(Specialty).where(Specialty.category == category))
+        return list(result.scalars().all())
+
+    async def create_specialty(self, specialty: SpecialtyCreate) -> Specialty:
+        """Create a new specialty."""
+        db_specialty = Specialty(**specialty.dict())
+        self.db.add(db_specialty)
+        await self.db.commit()
+        await self.db.refresh(db_specialty)
+        return db_specialty
+
+    async def update_specialty(self, specialty_id: str, specialty_update: SpecialtyUpdate) -> Optional[Specialty]:
+        """Update a specialty."""
+        db_specialty = await self._get_specialty_row(specialty_id)
+        if not db_specialty:
+            return None
+
+        update_data = specialty_update.dict(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_specialty, field, value)
+
+        await self.db.commit()
+        await self.db.refresh(db_specialty)
+        return db_specialty
+
+    async def delete_specialty(self, specialty_id: str) -> bool:
+        """Delete a specialty."""
+        db_specialty = await self._get_specialty_row(specialty_id)
+        if not db_specialty:
+            return False
+
+        await self.db.delete(db_specialty)
+        await self.db.commit()
+        return True
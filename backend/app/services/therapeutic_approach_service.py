@@ -4,6 +4,8 @@ Therapeutic approach service for managing therapeutic approaches.
 
 from typing import List, Optional
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.therapeutic_approach import TherapeuticApproach
@@ -11,6 +13,8 @@ from app.schemas.therapeutic_approach import (
     TherapeuticApproachCreate,
     TherapeuticApproachUpdate,
 )
+from app.services.catalog_cache import THERAPEUTIC_APPROACHES, CatalogCache, CatalogSnapshot
+from app.utils.pagination import Cursor, paginate
 
 
 class TherapeuticApproachService:
@@ -64,3 +68,83 @@ class TherapeuticApproachService:
         self.db.delete(db_approach)
         self.db.commit()
         return True
+
+
+class AsyncTherapeuticApproachService:
+    """Async counterpart of TherapeuticApproachService for use with AsyncSession.
+
+    With a ``catalog`` cache, reads are answered from its snapshot (as CatalogEntry objects)
+    instead of the database. Writes always go to the database.
+    """
+
+    def __init__(self, db: AsyncSession, catalog: Optional[CatalogCache] = None):
+        self.db = db
+        self.catalog = catalog
+
+    async def _snapshot(self) -> Optional[CatalogSnapshot]:
+        return await self.catalog.snapshot(self.db) if self.catalog is not None else None
+
+    async def _get_therapeutic_approach_row(self, approach_id: str) -> Optional[TherapeuticApproach]:
+        result = await self.db.execute(select(TherapeuticApproach).where(TherapeuticApproach.id == approach_id))
+        return result.scalars().first()
+
+    async def get_therapeutic_approach(self, approach_id: str) -> Optional[TherapeuticApproach]:
+        """Get a therapeutic approach by ID."""
+        snapshot = await self._snapshot()
+        if snapshot is not None:
+            return snapshot.get(THERAPEUTIC_APPROACHES, approach_id)
+        return await self._get_therapeutic_approach_row(approach_id)
+
+    async def get_therapeutic_approaches(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
+    ) -> List[TherapeuticApproach]:
+        """Get all therapeutic approaches, ordered by (created_at, id); a cursor takes precedence over skip."""
+        snapshot = await self._snapshot()
+        if snapshot is not None:
+            return snapshot.page(THERAPEUTIC_APPROACHES, skip=skip, limit=limit, cursor=cursor)
+        result = await self.db.execute(
+            paginate(select(TherapeuticApproach), TherapeuticApproach, skip=skip, limit=limit, cursor=cursor)
+        )
+        return list(result.scalars().all())
+
+    async def get_therapeutic_approaches_by_category(self, category: str) -> List[TherapeuticApproach]:
+        """Get therapeutic approaches by category."""
+        snapshot = await self._snapshot()
+        if snapshot is not None:
+            return snapshot.page(THERAPEUTIC_APPROACHES, where=lambda approach: approach.category == category)
+        result = await self.db.execute(select(TherapeuticApproach).where(TherapeuticApproach.category == category))
+        return list(result.scalars().all())
+
+    async def create_therapeutic_approach(self, approach: TherapeuticApproachCreate) -> TherapeuticApproach:
+        """Create a new therapeutic approach."""
+        db_approach = TherapeuticApproach(**approach.dict())
+        self.db.add(db_approach)
+        await self.db.commit()
+        await self.db.refresh(db_approach)
+        return db_approach
+
+    async def update_therapeutic_approach(
+        self, approach_id: str, approach_update: TherapeuticApproachUpdate
+    ) -> Optional[TherapeuticApproach]:
+        """Update a therapeutic approach."""
+        db_approach = await self._get_therapeutic_approach_row(approach_id)
+        if not db_approach:
+            return None
+
+        update_data = approach_update.dict(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_approach, field, value)
+
+        await self.db.commit()
+        await self.db.refresh(db_approach)
+        return db_approach
+
+    async def delete_therapeutic_approach(self, approach_id: str) -> bool:
+        """Delete a therapeutic approach."""
+        db_approach = await self._get_therapeutic_approach_row(approach_id)
+        if not db_approach:
+            return False
+
+        await self.db.delete(db_approach)
+        await self.db.commit()
+        return True
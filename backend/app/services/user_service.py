@@ -5,6 +5,8 @@ User service for business logic.
 from typing import List, Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -66,3 +68,62 @@ class UserService:
         except SQLAlchemyError:
             self.db.rollback()
             return False
+
+
+class AsyncUserService:
+    """Async counterpart of UserService for use with AsyncSession."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID."""
+        result = await self.db.execute(select(User).where(User.id == user_id))
+        return result.scalars().first()
+
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        """Get user by email."""
+        result = await self.db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
+
+    async def get_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+        """Get all users."""
+        result = await self.db.execute(select(User).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def update_user(self, user_id: str, update_data: UserUpdate) -> Optional[User]:
+        """Update user."""
+        user = await self.get_user_by_id(user_id)
+        if not user:
+            return None
+
+        try:
+            # Update fields
+            for field, value in update_data.dict(exclude_unset=True).items():
+                setattr(user, field, value)
+
+            await self.db.commit()
+            await self.db.refresh(user)
+            return user
+
+        except SQLAlchemyError as exc:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to update user",
+            ) from exc
+
+    async def deactivate_user(self, user_id: str) -> bool:
+        """Deactivate user."""
+        user = await self.get_user_by_id(user_id)
+        if not user:
+            return False
+
+        try:
+            user.is_active = False
+            await self.db.commit()
+            return True
+
+        except SQLAlchemyError:
+            await self.db.rollback()
+            return False
@@ -0,0 +1,199 @@
+"""
+HTTP validators (ETag / Last-Modified) and conditional request handling.
+
+ETags are strong: they hash the versions (id + updated_at) of every row a response is
+built from, so equal ETags mean byte-identical representations.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import AbstractSet, Callable, Iterable, Optional, Sequence
+
+from fastapi import Depends, HTTPException, Request, Response, status
+
+from app.core.config import get_settings
+from app.models.professional import Professional
+from app.services.catalog_cache import SPECIALTIES, CatalogSnapshot, get_catalog_cache, get_catalog_snapshot
+
+# Public data that may be stored by browsers and shared caches but must be revalidated
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+PRECONDITION_FAILED_MESSAGE = "The resource was modified since it was read; fetch it again and retry"
+
+
+def _linked_specialties(professional: Professional) -> list:
+    """(link, catalog specialty or None) pairs, as parse_professional_data resolves them."""
+    snapshot = get_catalog_cache().current
+    return [
+        (link, snapshot.get(SPECIALTIES, link.specialty_id) if snapshot else None)
+        for link in professional.professional_specialties
+    ]
+
+
+def professional_versions(professional: Professional, fields: Optional[AbstractSet[str]] = None) -> list:
+    """Row versions a serialized professional (or a sparse fieldset of it) depends on.
+
+    See parse_professional_data; a sparse fieldset only loads the modalities when requested.
+    """
+    versions = [professional.id, professional.updated_at]
+    if fields is None:
+        for link, specialty in _linked_specialties(professional):
+            versions.extend((link.id, link.updated_at))
+            if specialty:
+                versions.extend((specialty.id, specialty.updated_at))
+    if fields is None or "modalities" in fields:
+        for modality in professional.professional_modalities:
+            versions.extend((modality.id, modality.updated_at, modality.is_active))
+    return versions
+
+
+def professional_timestamps(
+    professional: Professional, fields: Optional[AbstractSet[str]] = None
+) -> Iterable[Optional[datetime]]:
+    """Modification timestamps a serialized professional (or a sparse fieldset of it) depends on."""
+    yield professional.updated_at
+    if fields is None:
+        for link, specialty in _linked_specialties(professional):
+            yield link.updated_at
+            if specialty:
+                yield specialty.updated_at
+    if fields is None or "modalities" in fields:
+        for modality in professional.professional_modalities:
+            yield modality.updated_at
+
+
+def make_etag(versions: Iterable) -> str:
+    """Strong ETag hashing an ordered sequence of row versions."""
+    digest = hashlib.sha256("|".join(str(version) for version in versions).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def latest(timestamps: Iterable[Optional[datetime]]) -> Optional[datetime]:
+    """Most recent of the given timestamps, ignoring missing ones."""
+    return max((timestamp for timestamp in timestamps if timestamp is not None), default=None)
+
+
+def professionals_etag(professionals: Sequence[Professional], fields: Optional[AbstractSet[str]] = None) -> str:
+    """ETag of a response built from these professionals, in order.
+
+    Collection responses (listings, searches, batches) are validated by this ETag alone: a row
+    leaving the result set changes it, but not the latest modification time of the rows left,
+    so a Last-Modified would confirm stale pages. Each sparse fieldset is a distinct
+    representation, so its field names are part of the ETag.
+    """
+    versions = [version for professional in professionals for version in professional_versions(professional, fields)]
+    if fields is not None:
+        versions.extend(sorted(fields))
+    return make_etag(versions)
+
+
+def professional_validators(
+    professional: Professional, fields: Optional[AbstractSet[str]] = None
+) -> tuple[str, Optional[datetime]]:
+    """ETag and Last-Modified of a professional's detail response (or a sparse fieldset of it)."""
+    return professionals_etag([professional], fields), latest(professional_timestamps(professional, fields))
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 9110 13.1.2)."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag.removeprefix("W/") for candidate in candidates)
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have second precision
+    return last_modified.replace(microsecond=0) <= since
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when no ETag was sent."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        return _not_modified_since(if_modified_since, last_modified)
+    return False
+
+
+def version_etag(row) -> str:
+    """Strong ETag of an editable row (a profile), from its optimistic concurrency version."""
+    return make_etag([row.id, row.version])
+
+
+def if_match_fails(request: Request, etag: str) -> bool:
+    """Evaluate If-Match with strong comparison (RFC 9110 13.1.1); no header always passes."""
+    if_match = request.headers.get("if-match")
+    if if_match is None or if_match.strip() == "*":
+        return False
+    return all(candidate.strip() != etag for candidate in if_match.split(","))
+
+
+def check_if_match(request: Request, etag: str) -> None:
+    """Refuse a write with 412 Precondition Failed when If-Match names another version."""
+    if if_match_fails(request, etag):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=PRECONDITION_FAILED_MESSAGE,
+            headers={"ETag": etag},
+        )
+
+
+def validator_headers(
+    etag: str, last_modified: Optional[datetime] = None, cache_control: str = REVALIDATE_CACHE_CONTROL
+) -> dict[str, str]:
+    """Headers advertising the validators of a representation."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+) -> Optional[Response]:
+    """Set the validators on the response; return a 304 response if the client copy is current."""
+    headers = validator_headers(etag, last_modified, cache_control)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def catalog_cache_control() -> str:
+    """Catalogs are public and change rarely, so they may be reused for a while without revalidation."""
+    return f"public, max-age={get_settings().CATALOG_HTTP_MAX_AGE_SECONDS}"
+
+
+def catalog_conditional_request(catalog: str) -> Callable:
+    """Router dependency adding a catalog's validators to its GET responses and answering 304s.
+
+    The validators are precomputed with the catalog snapshot, so a current client copy is
+    confirmed before the endpoint runs.
+    """
+
+    async def dependency(
+        request: Request, response: Response, snapshot: CatalogSnapshot = Depends(get_catalog_snapshot)
+    ) -> None:
+        if request.method not in ("GET", "HEAD") or catalog not in snapshot.validators:
+            return
+        etag, last_modified = snapshot.validators[catalog]
+        headers = validator_headers(etag, last_modified, catalog_cache_control())
+        if is_not_modified(request, etag, last_modified):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    return dependency
@@ -0,0 +1,79 @@
+"""
+Keyset (cursor) pagination utilities.
+
+Listings are ordered by ``(created_at, id)``. The cursor handed to clients is an opaque
+token encoding that key for the last row of a page; the next page starts strictly after it.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import NamedTuple, Optional, Sequence
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import Select, tuple_
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Error messages
+INVALID_CURSOR_MESSAGE = "Invalid cursor"
+
+
+class Cursor(NamedTuple):
+    """Decoded keyset position."""
+
+    created_at: datetime
+    id: uuid.UUID
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Encode a keyset position as an opaque URL-safe token."""
+    payload = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decode a token produced by encode_cursor. Raises ValueError if it is malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return Cursor(datetime.fromisoformat(created_at), uuid.UUID(row_id))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise ValueError(INVALID_CURSOR_MESSAGE) from exc
+
+
+def get_cursor(
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+) -> Optional[Cursor]:
+    """FastAPI dependency decoding the optional ``cursor`` query parameter."""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=INVALID_CURSOR_MESSAGE) from exc
+
+
+def paginate(
+    query: Select, model, *, skip: int = 0, limit: Optional[int] = None, cursor: Optional[Cursor] = None
+) -> Select:
+    """Order a query by the keyset and apply either cursor or offset pagination."""
+    query = query.order_by(model.created_at, model.id)
+    if cursor is not None:
+        query = query.where(tuple_(model.created_at, model.id) > tuple_(cursor.created_at, cursor.id))
+    elif skip:
+        query = query.offset(skip)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def next_cursor(rows: Sequence, limit: Optional[int]) -> Optional[str]:
+    """Return the cursor for the page after ``rows``, or None if this was the last page."""
+    if not rows or limit is None or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.created_at, last.id)
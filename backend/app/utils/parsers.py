@@ -2,74 +2,138 @@
 Data parsing utilities for API responses.
 """
 
-import json
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Sequence
+
+from pydantic import TypeAdapter
+
 from app.models.professional import Professional
 from app.models.user import User
+from app.schemas.professional import ProfessionalFieldsResponse, ProfessionalResponse
+from app.services.catalog_cache import SPECIALTIES, get_catalog_cache
+
+
+def _parse_professional_specialties(professional: Professional) -> list:
+    # Specialties come from the catalog snapshot, made current for the request by get_catalog_snapshot
+    snapshot = get_catalog_cache().current
+    parsed = []
+    for ps in professional.professional_specialties:
+        specialty = snapshot.get(SPECIALTIES, ps.specialty_id) if snapshot else None
+        if specialty:
+            parsed.append(
+                {
+                    "id": str(ps.id),
+                    "name": specialty.name,
+                    "description": specialty.category,
+                    "price_cents": professional.rate_cents,  # Use professional's rate
+                    "currency": professional.currency,
+                    "is_default": False,  # Determined by business logic
+                    "is_active": True,  # All specialties are considered active
+                }
+            )
+    return parsed
+
+
+def _parse_modalities(professional: Professional) -> list:
+    return [
+        {
+            "id": str(pmod.id),
+            "modalityId": str(pmod.modality_id),
+            "modalityName": pmod.modality_name,
+            "virtualPrice": pmod.virtual_price,
+            "presencialPrice": pmod.presencial_price,
+            "offersPresencial": pmod.offers_presencial,
+            "description": pmod.description,
+            "isDefault": pmod.is_default,
+        }
+        for pmod in professional.professional_modalities
+        if pmod.is_active
+    ]
+
+
+# Serialized professional fields, in output order. Fields without a parser below are
+# read as is from the column of the same name.
+PROFESSIONAL_DATA_FIELDS = (
+    "id",
+    "email",
+    "full_name",
+    "phone_country_code",
+    "phone_number",
+    "license_number",
+    "years_experience",
+    "rate_cents",
+    "currency",
+    "professional_specialties",
+    "bio",
+    "academic_experience",
+    "work_experience",
+    "certifications",
+    "languages",
+    "therapy_approaches_ids",
+    "specialty_ids",
+    "modalities",
+    "timezone",
+    "working_hours",
+    "profile_picture",
+    "is_active",
+    "is_verified",
+    "created_at",
+    "updated_at",
+)
+
+PROFESSIONAL_FIELD_PARSERS: Dict[str, Callable[[Professional], Any]] = {
+    "professional_specialties": _parse_professional_specialties,
+    "modalities": _parse_modalities,
+}
 
 
-def parse_professional_data(professional: Professional) -> dict:
-    """Parse professional data including JSON fields."""
-    print(f"DEBUG: Parsing professional data for {professional.id}")
-    modalities_count = len(professional.professional_modalities) if professional.professional_modalities else 0
-    print(f"DEBUG: Professional modalities count: {modalities_count}")
-    if professional.professional_modalities:
-        for pmod in professional.professional_modalities:
-            print(f"DEBUG: Modality: {pmod.modality_name}, Active: {pmod.is_active}")
+def parse_professional_data(professional: Professional, fields: Optional[AbstractSet[str]] = None) -> dict:
+    """Parse professional data including relationships.
 
+    Only reads relationships covered by professional_relationship_loaders() and the catalog
+    snapshot, so a page of professionals is serialized without any further queries. With ``fields`` (a sparse
+    fieldset, see professional_field_loaders()), only those fields are read and returned.
+    """
+    names = PROFESSIONAL_DATA_FIELDS
+    if fields is not None:
+        names = [name for name in PROFESSIONAL_DATA_FIELDS if name in fields]
     return {
-        "id": professional.id,
-        "email": professional.email,
-        "full_name": professional.full_name,
-        "phone_country_code": professional.phone_country_code,
-        "phone_number": professional.phone_number,
-        "license_number": professional.license_number,
-        "years_experience": professional.years_experience,
-        "rate_cents": professional.rate_cents,
-        "currency": professional.currency,
-        "professional_specialties": [
-            {
-                "id": str(ps.id),
-                "name": ps.specialty.name if ps.specialty else "Unknown Specialty",
-                "description": (ps.specialty.category if ps.specialty else "No description available"),
-                "price_cents": professional.rate_cents,  # Use professional's rate
-                "currency": professional.currency,
-                "is_default": False,  # Determined by business logic
-                "is_active": True,  # All specialties are considered active
-            }
-            for ps in professional.professional_specialties
-            if ps.specialty
-        ],
-        "bio": professional.bio,
-        "academic_experience": professional.academic_experience,
-        "work_experience": professional.work_experience,
-        "certifications": professional.certifications,
-        "languages": professional.languages,
-        "therapy_approaches_ids": professional.therapy_approaches_ids,
-        "specialty_ids": professional.specialty_ids,
-        "modalities": [
-            {
-                "id": str(pmod.id),
-                "modalityId": str(pmod.modality_id),
-                "modalityName": pmod.modality_name,
-                "virtualPrice": pmod.virtual_price,
-                "presencialPrice": pmod.presencial_price,
-                "offersPresencial": pmod.offers_presencial,
-                "description": pmod.description,
-                "isDefault": pmod.is_default,
-            }
-            for pmod in professional.professional_modalities
-            if pmod.is_active
-        ],
-        "timezone": professional.timezone,
-        "working_hours": (json.loads(professional.working_hours) if professional.working_hours else None),
-        "profile_picture": professional.profile_picture,
-        "is_active": professional.is_active,
-        "is_verified": professional.is_verified,
-        "created_at": professional.created_at,
-        "updated_at": professional.updated_at,
+        name: (
+            PROFESSIONAL_FIELD_PARSERS[name](professional)
+            if name in PROFESSIONAL_FIELD_PARSERS
+            else getattr(professional, name)
+        )
+        for name in names
     }
 
 
+# Precompiled serializers for professional responses
+PROFESSIONAL_ADAPTER = TypeAdapter(ProfessionalResponse)
+PROFESSIONAL_LIST_ADAPTER = TypeAdapter(List[ProfessionalResponse])
+PROFESSIONAL_FIELDS_ADAPTER = TypeAdapter(ProfessionalFieldsResponse)
+PROFESSIONAL_FIELDS_LIST_ADAPTER = TypeAdapter(List[ProfessionalFieldsResponse])
+
+
+def _dump_json(adapter: TypeAdapter, data, fields: Optional[AbstractSet[str]]) -> bytes:
+    return adapter.dump_json(adapter.validate_python(data), exclude_unset=fields is not None)
+
+
+def professional_json(professional: Professional, fields: Optional[AbstractSet[str]] = None) -> bytes:
+    """Serialize a professional (or a sparse fieldset of it) straight to JSON.
+
+    The parsed data is validated once by a precompiled adapter and dumped to bytes, instead
+    of being validated, converted back to Python and encoded by the response machinery.
+    """
+    adapter = PROFESSIONAL_ADAPTER if fields is None else PROFESSIONAL_FIELDS_ADAPTER
+    return _dump_json(adapter, parse_professional_data(professional, fields), fields)
+
+
+def professionals_json(professionals: Sequence[Professional], fields: Optional[AbstractSet[str]] = None) -> bytes:
+    """Serialize a page of professionals straight to JSON, like professional_json."""
+    adapter = PROFESSIONAL_LIST_ADAPTER if fields is None else PROFESSIONAL_FIELDS_LIST_ADAPTER
+    data = [parse_professional_data(professional, fields) for professional in professionals]
+    return _dump_json(adapter, data, fields)
+
+
 def parse_user_data(user: User) -> dict:
     """Parse user data for API responses."""
     return {
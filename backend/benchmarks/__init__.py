@@ -0,0 +1,3 @@
+"""
+Serialization micro-benchmarks. Run from backend/, e.g. ``python -m benchmarks.json_responses``.
+"""
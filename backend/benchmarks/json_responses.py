@@ -0,0 +1,37 @@
+"""
+Encoding a page of 100 professionals with JSONResponse vs ORJSONResponse.
+
+Run from backend/: ``python -m benchmarks.json_responses``
+"""
+
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.schemas.professional import ProfessionalResponse
+from app.utils.parsers import parse_professional_data
+from benchmarks.common import PAGE_SIZE, professional_page, report
+
+
+def main() -> None:
+    page = [parse_professional_data(professional) for professional in professional_page()]
+    adapter = TypeAdapter(List[ProfessionalResponse])
+    # What FastAPI hands the response class on a route with a response_model
+    content = adapter.dump_python(adapter.validate_python(page), mode="json")
+
+    print(f"Rendering a page of {PAGE_SIZE} professionals")
+    report(
+        {
+            "JSONResponse (response_model)": lambda: JSONResponse(content),
+            "ORJSONResponse (response_model)": lambda: ORJSONResponse(content),
+            # Routes without a response_model also pay for jsonable_encoder, which orjson does not need
+            "JSONResponse + jsonable_encoder": lambda: JSONResponse(jsonable_encoder(page)),
+            "ORJSONResponse (native types)": lambda: ORJSONResponse(page),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
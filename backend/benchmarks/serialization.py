@@ -0,0 +1,41 @@
+"""
+Per-row cost of serializing professionals: response model round trip vs precompiled adapters.
+
+Run from backend/: ``python -m benchmarks.serialization``
+"""
+
+from typing import List
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.schemas.professional import ProfessionalResponse
+from app.utils.parsers import parse_professional_data, professionals_json
+from benchmarks.common import PAGE_SIZE, professional_page, report
+
+RESPONSE_ADAPTER = TypeAdapter(List[ProfessionalResponse])
+
+
+def response_model_round_trip(page) -> bytes:
+    """What FastAPI does with a list of dicts returned from a route with a response_model."""
+    value = RESPONSE_ADAPTER.validate_python([parse_professional_data(professional) for professional in page])
+    return ORJSONResponse(RESPONSE_ADAPTER.dump_python(value, mode="json")).body
+
+
+def main() -> None:
+    page = professional_page()
+    # Both paths produce the same document
+    assert orjson.loads(response_model_round_trip(page)) == orjson.loads(professionals_json(page))
+
+    print(f"Serializing a page of {PAGE_SIZE} professionals")
+    report(
+        {
+            "response_model round trip": lambda: response_model_round_trip(page),
+            "professionals_json": lambda: professionals_json(page),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
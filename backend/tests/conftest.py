@@ -4,7 +4,7 @@ Integration tests have their own Postgres-backed setup in tests/integration/conf
 """
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 
 @pytest.fixture(scope="function")
@@ -21,6 +21,20 @@ def db_session() -> MagicMock:
     return session
 
 
+@pytest.fixture(scope="function")
+def async_db_session() -> MagicMock:
+    """Provide a mocked SQLAlchemy AsyncSession for unit tests."""
+    session = MagicMock(name="AsyncSession")
+    for method in ("execute", "commit", "refresh", "rollback", "flush", "delete"):
+        setattr(session, method, AsyncMock(name=f"AsyncSession.{method}"))
+    # Common pattern used in async services: (await execute(stmt)).scalars().first()/all()
+    result = MagicMock(name="Result")
+    result.scalars.return_value.first.return_value = None
+    result.scalars.return_value.all.return_value = []
+    session.execute.return_value = result
+    return session
+
+
 @pytest.fixture
 def test_user_data():
     return {
@@ -0,0 +1,50 @@
+"""
+Integration tests for the catalog endpoints: name resolution and HTTP caching.
+"""
+
+import uuid
+
+from fastapi.testclient import TestClient
+
+
+class TestCatalogNames:
+    """Catalog IDs of any kind are resolved in one request."""
+
+    def test_resolve_names(self, client: TestClient):
+        """Specialty IDs are resolved and unknown IDs are reported."""
+        name = f"Catalog names {uuid.uuid4().hex[:8]}"
+        specialty = client.post("/api/v1/specialties/", json={"name": name})
+        assert specialty.status_code == 200
+        specialty_id = specialty.json()["id"]
+        unknown = str(uuid.uuid4())
+
+        response = client.get(f"/api/v1/catalog/names?ids={specialty_id},{unknown}")
+
+        assert response.status_code == 200
+        assert response.json()["specialties"] == {specialty_id: name}
+        assert response.json()["missing_ids"] == [unknown]
+
+    def test_too_many_ids(self, client: TestClient):
+        """Oversized lookups are rejected."""
+        ids = ",".join(str(uuid.uuid4()) for _ in range(501))
+
+        assert client.get(f"/api/v1/catalog/names?ids={ids}").status_code == 400
+
+
+class TestCatalogHttpCaching:
+    """Catalog routers send validators and answer conditional requests."""
+
+    def test_specialties_not_modified(self, client: TestClient):
+        """A listing revalidated with its ETag is answered with a 304 until the catalog changes."""
+        response = client.get("/api/v1/specialties/")
+        assert response.status_code == 200
+        assert "max-age" in response.headers["cache-control"]
+
+        revalidated = client.get("/api/v1/specialties/", headers={"If-None-Match": response.headers["etag"]})
+        assert revalidated.status_code == 304
+
+        created = client.post("/api/v1/specialties/", json={"name": f"Catalog etag {uuid.uuid4().hex[:8]}"})
+        assert created.status_code == 200
+        changed = client.get("/api/v1/specialties/", headers={"If-None-Match": response.headers["etag"]})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != response.headers["etag"]
@@ -9,12 +9,13 @@ import pytest
 from datetime import datetime
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from app.api.v1.api import api_router
 from app.core.config import get_settings
-from app.core.database import Base, get_db
+from app.core.database import Base, get_async_db, get_async_session_factory, get_db
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -125,17 +126,7 @@ def _cleanup_test_data(session_factory):
         )
         deleted_users = result.rowcount
 
-        # Clean test professionals
-        result = session.execute(
-            text(
-                f"""
-            DELETE FROM professionals WHERE {where_clause}
-        """
-            )
-        )
-        deleted_professionals = result.rowcount
-
-        # Clean related data only for test professionals
+        # Clean related data only for test professionals, before the rows it references
         if test_professional_ids:
             professional_id_list = [str(row[0]) for row in test_professional_ids]
             professional_ids_str = "', '".join(professional_id_list)
@@ -168,6 +159,16 @@ def _cleanup_test_data(session_factory):
                 )
             )
 
+        # Clean test professionals
+        result = session.execute(
+            text(
+                f"""
+            DELETE FROM professionals WHERE {where_clause}
+        """
+            )
+        )
+        deleted_professionals = result.rowcount
+
         # Clean test data from reference tables (only test-specific data)
         session.execute(
             text(
@@ -239,8 +240,15 @@ def db_session(engine_and_session_factory, setup_test_db):
         _cleanup_test_data(session_factory)
 
 
+@pytest.fixture(scope="session")
+def async_engine():
+    # TestClient runs every request on its own event loop, so async connections must not be pooled
+    engine = create_async_engine(get_settings().ASYNC_DATABASE_URL, poolclass=NullPool)
+    yield engine
+
+
 @pytest.fixture
-def client(engine_and_session_factory):
+def client(engine_and_session_factory, async_engine):
     _, session_factory = engine_and_session_factory
     app = _build_app()
 
@@ -251,7 +259,16 @@ def client(engine_and_session_factory):
         finally:
             db.close()
 
+    async_session_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with async_session_factory() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # Streaming endpoints open their own session from the factory
+    app.dependency_overrides[get_async_session_factory] = lambda: async_session_factory
     return TestClient(app)
 
 
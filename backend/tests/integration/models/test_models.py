@@ -54,3 +54,19 @@ class TestUserModel:
         assert user.is_verified is False  # Default value
         assert user.phone is None
         assert user.profile_picture is None
+
+    def test_user_preferences_round_trip(self, db_session):
+        """Test that preferences are stored as JSONB and read back as structures."""
+        preferences = {"language": "es", "notifications": {"email": True}}
+        user = UserModel(
+            full_name="Test User",
+            email="test4@example.com",
+            hashed_password="hashed_password",
+            preferences=preferences,
+        )
+
+        db_session.add(user)
+        db_session.commit()
+        db_session.refresh(user)
+
+        assert user.preferences == preferences
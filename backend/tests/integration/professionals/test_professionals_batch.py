@@ -0,0 +1,55 @@
+"""
+Integration tests for looking up many professionals by ID at once.
+"""
+
+import uuid
+
+from fastapi.testclient import TestClient
+
+
+def _register(client: TestClient, test_data_factory, suffix: str) -> str:
+    register = client.post("/api/v1/auth/register/professional", json=test_data_factory["professional"](suffix))
+    assert register.status_code == 201
+    return register.json()["id"]
+
+
+class TestProfessionalsBatch:
+    """Batch lookups keep the request order and report missing IDs."""
+
+    def test_get_batch(self, client: TestClient, test_data_factory):
+        """Items follow the requested order and unknown IDs are reported."""
+        first = _register(client, test_data_factory, "batch_get_1")
+        second = _register(client, test_data_factory, "batch_get_2")
+        unknown = str(uuid.uuid4())
+
+        response = client.get(f"/api/v1/professionals/batch?ids={second},{unknown}&ids={first}")
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [second, first]
+        assert response.json()["missing_ids"] == [unknown]
+
+        revalidated = client.get(
+            f"/api/v1/professionals/batch?ids={second},{unknown}&ids={first}",
+            headers={"If-None-Match": response.headers["etag"]},
+        )
+        assert revalidated.status_code == 304
+
+    def test_post_batch_fields(self, client: TestClient, test_data_factory):
+        """The POST variant takes the IDs in the body and supports sparse fieldsets."""
+        first = _register(client, test_data_factory, "batch_post_1")
+        second = _register(client, test_data_factory, "batch_post_2")
+
+        response = client.post("/api/v1/professionals/batch?fields=full_name", json={"ids": [first, second, first]})
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [first, second]
+        assert all(set(item) == {"id", "full_name"} for item in response.json()["items"])
+        assert response.json()["missing_ids"] == []
+
+    def test_invalid_batch(self, client: TestClient):
+        """Malformed IDs and oversized batches are rejected."""
+        assert client.get("/api/v1/professionals/batch?ids=not-a-uuid").status_code == 400
+
+        ids = ",".join(str(uuid.uuid4()) for _ in range(101))
+        assert client.get(f"/api/v1/professionals/batch?ids={ids}").status_code == 400
+        assert client.post("/api/v1/professionals/batch", json={"ids": ids.split(",")}).status_code == 422
@@ -0,0 +1,53 @@
+"""
+Integration tests for the compact professional card listing.
+"""
+
+import uuid
+
+from fastapi.testclient import TestClient
+
+CARD_FIELDS = {
+    "id",
+    "full_name",
+    "profile_picture",
+    "is_verified",
+    "specialties",
+    "modalities",
+    "starting_price_cents",
+    "currency",
+    "languages",
+}
+
+
+class TestProfessionalsCards:
+    """Directory cards carry only what a card shows."""
+
+    def test_cards_are_filtered_and_compact(self, client: TestClient, test_data_factory):
+        """Cards take the listing filters; without modalities the starting price is the rate."""
+        language = f"lang-{uuid.uuid4()}"
+        payload = {**test_data_factory["professional"]("cards"), "languages": [language]}
+        register = client.post("/api/v1/auth/register/professional", json=payload)
+        assert register.status_code == 201
+
+        response = client.get("/api/v1/professionals/cards", params={"languages": [language]})
+
+        assert response.status_code == 200
+        cards = response.json()
+        assert [card["id"] for card in cards] == [register.json()["id"]]
+        card = cards[0]
+        assert set(card) == CARD_FIELDS
+        assert card["full_name"] == payload["full_name"]
+        assert card["starting_price_cents"] == payload["rate_cents"]
+        assert card["modalities"] == []
+        # Specialty IDs missing from the catalog are not shown
+        assert card["specialties"] == []
+
+    def test_cards_cursor_pagination(self, client: TestClient):
+        """Cards page with the same cursor as the listing."""
+        first = client.get("/api/v1/professionals/cards?limit=1")
+        assert first.status_code == 200
+
+        if "x-next-cursor" in first.headers:
+            second = client.get(f"/api/v1/professionals/cards?limit=1&cursor={first.headers['x-next-cursor']}")
+            assert second.status_code == 200
+            assert second.json()[0]["id"] != first.json()[0]["id"]
@@ -0,0 +1,85 @@
+"""
+Integration tests for conditional GET (ETag / Last-Modified) on professional endpoints.
+"""
+
+from fastapi.testclient import TestClient
+
+
+class TestProfessionalsConditionalRequests:
+    """304 Not Modified for professional detail and listing."""
+
+    def test_detail_revalidation(self, client: TestClient, test_data_factory):
+        """A matching If-None-Match returns 304 until the profile changes."""
+        professional_data = test_data_factory["professional"]("conditional_detail")
+        register = client.post("/api/v1/auth/register/professional", json=professional_data)
+        assert register.status_code == 201
+        professional_id = register.json()["id"]
+
+        first = client.get(f"/api/v1/professionals/{professional_id}")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert "last-modified" in first.headers
+
+        revalidated = client.get(f"/api/v1/professionals/{professional_id}", headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+
+        login = client.post(
+            "/api/v1/auth/login/professional",
+            json={"email": professional_data["email"], "password": professional_data["password"]},
+        )
+        token = login.json()["access_token"]
+        update = client.put(
+            "/api/v1/professionals/me",
+            json={"bio": "Test bio updated"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert update.status_code == 200
+
+        changed = client.get(f"/api/v1/professionals/{professional_id}", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    def test_listing_revalidation(self, client: TestClient):
+        """The listing ETag covers the whole page; without a Last-Modified, dates never confirm it."""
+        first = client.get("/api/v1/professionals/?limit=5")
+        assert first.status_code == 200
+        assert "last-modified" not in first.headers
+
+        revalidated = client.get("/api/v1/professionals/?limit=5", headers={"If-None-Match": first.headers["etag"]})
+        by_date = client.get(
+            "/api/v1/professionals/?limit=5", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+        )
+
+        assert revalidated.status_code == 304
+        assert by_date.status_code == 200
+
+    def test_update_precondition(self, client: TestClient, test_data_factory):
+        """A save with a stale If-Match is refused with 412; the current ETag is accepted."""
+        professional_data = test_data_factory["professional"]("conditional_update")
+        register = client.post("/api/v1/auth/register/professional", json=professional_data)
+        assert register.status_code == 201
+        login = client.post(
+            "/api/v1/auth/login/professional",
+            json={"email": professional_data["email"], "password": professional_data["password"]},
+        )
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        etag = client.get("/api/v1/professionals/me/profile", headers=headers).headers["etag"]
+
+        first = client.put("/api/v1/professionals/me", json={"bio": "First tab"}, headers={**headers, "If-Match": etag})
+        assert first.status_code == 200
+        assert first.headers["etag"] != etag
+
+        stale = client.put(
+            "/api/v1/professionals/me", json={"bio": "Second tab"}, headers={**headers, "If-Match": etag}
+        )
+        assert stale.status_code == 412
+
+        retried = client.put(
+            "/api/v1/professionals/me",
+            json={"bio": "Second tab"},
+            headers={**headers, "If-Match": first.headers["etag"]},
+        )
+        assert retried.status_code == 200
+        assert retried.json()["bio"] == "Second tab"
@@ -0,0 +1,45 @@
+"""
+Integration tests for the streaming professional directory export.
+"""
+
+import csv
+import io
+
+import orjson
+from fastapi.testclient import TestClient
+
+
+class TestProfessionalsExport:
+    """The directory is exported as NDJSON or CSV."""
+
+    def test_ndjson_export(self, client: TestClient, test_data_factory):
+        """Each line is a professional with catalog names resolved."""
+        register = client.post(
+            "/api/v1/auth/register/professional", json=test_data_factory["professional"]("export_ndjson")
+        )
+        assert register.status_code == 201
+
+        response = client.get("/api/v1/professionals/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "professionals.ndjson" in response.headers["content-disposition"]
+        rows = {row["id"]: row for row in map(orjson.loads, response.content.splitlines())}
+        exported = rows[register.json()["id"]]
+        assert exported["full_name"] == register.json()["full_name"]
+        assert "bio" not in exported
+
+    def test_csv_export(self, client: TestClient, test_data_factory):
+        """The CSV export has a header line and honours the search filters."""
+        register = client.post(
+            "/api/v1/auth/register/professional", json=test_data_factory["professional"]("export_csv")
+        )
+        assert register.status_code == 201
+
+        response = client.get("/api/v1/professionals/export?format=csv&specialty_ids=psychology")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert register.json()["id"] in {row["id"] for row in rows}
+        assert "rate_cents" in rows[0]
@@ -0,0 +1,73 @@
+"""
+Integration tests for sparse fieldsets (?fields=) on professional endpoints.
+"""
+
+from fastapi.testclient import TestClient
+
+
+class TestProfessionalsSparseFieldsets:
+    """Only the requested fields are returned."""
+
+    def test_detail_fields(self, client: TestClient, test_data_factory):
+        """The detail returns the requested fields plus id, with its own ETag."""
+        register = client.post(
+            "/api/v1/auth/register/professional", json=test_data_factory["professional"]("fields_detail")
+        )
+        assert register.status_code == 201
+        professional_id = register.json()["id"]
+
+        full = client.get(f"/api/v1/professionals/{professional_id}")
+        sparse = client.get(f"/api/v1/professionals/{professional_id}?fields=full_name,rate_cents")
+
+        assert sparse.status_code == 200
+        assert set(sparse.json()) == {"id", "full_name", "rate_cents"}
+        assert sparse.json()["full_name"] == full.json()["full_name"]
+        assert sparse.headers["etag"] != full.headers["etag"]
+
+        revalidated = client.get(
+            f"/api/v1/professionals/{professional_id}?fields=full_name,rate_cents",
+            headers={"If-None-Match": sparse.headers["etag"]},
+        )
+        assert revalidated.status_code == 304
+
+    def test_listing_fields(self, client: TestClient, test_data_factory):
+        """Listing items only carry the requested fields, including relationships."""
+        register = client.post(
+            "/api/v1/auth/register/professional", json=test_data_factory["professional"]("fields_listing")
+        )
+        assert register.status_code == 201
+
+        response = client.get("/api/v1/professionals/?limit=5&fields=full_name,modalities")
+
+        assert response.status_code == 200
+        assert response.json()
+        for item in response.json():
+            assert set(item) == {"id", "full_name", "modalities"}
+
+    def test_structured_fields(self, client: TestClient, test_data_factory):
+        """Structured fields are stored as JSONB and returned as structures."""
+        professional_data = test_data_factory["professional"]("fields_structured")
+        register = client.post("/api/v1/auth/register/professional", json=professional_data)
+        assert register.status_code == 201
+        login = client.post(
+            "/api/v1/auth/login/professional",
+            json={"email": professional_data["email"], "password": professional_data["password"]},
+        )
+        certifications = [{"name": "CBT", "document_url": "/uploads/certifications/cbt.pdf"}]
+        update = client.put(
+            "/api/v1/professionals/me",
+            json={"certifications": certifications},
+            headers={"Authorization": f"Bearer {login.json()['access_token']}"},
+        )
+        assert update.status_code == 200
+
+        response = client.get(f"/api/v1/professionals/{register.json()['id']}?fields=certifications")
+
+        assert response.json()["certifications"] == certifications
+
+    def test_unknown_field(self, client: TestClient):
+        """Unknown field names are rejected."""
+        response = client.get("/api/v1/professionals/?fields=full_name,hashed_password")
+
+        assert response.status_code == 400
+        assert "hashed_password" in response.json()["detail"]
@@ -0,0 +1,109 @@
+"""
+Integration tests for updating modalities through PUT /professionals/me.
+"""
+
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.core.cache import InMemoryCacheBackend
+from app.services.professional_cache import ProfessionalResponseCache
+
+
+def _modality(modality_id: str, name: str, virtual_price: int = 80000, **fields) -> dict:
+    return {"modalityId": modality_id, "modalityName": name, "virtualPrice": virtual_price, **fields}
+
+
+def _professional_with_modalities(client: TestClient, professional_data: dict, names: list) -> tuple:
+    """Register and log in a professional with these modalities, the first one the default."""
+    register = client.post("/api/v1/auth/register/professional", json=professional_data)
+    assert register.status_code == 201
+    login = client.post(
+        "/api/v1/auth/login/professional",
+        json={"email": professional_data["email"], "password": professional_data["password"]},
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    modalities = []
+    for index, name in enumerate(names):
+        created = client.post(
+            "/api/v1/modalities/", json={"name": f"Test modality {uuid.uuid4().hex[:8]}"}, headers=headers
+        )
+        assert created.status_code == 200, created.text
+        modalities.append(_modality(created.json()["id"], name, isDefault=index == 0))
+    update = client.put("/api/v1/professionals/me", json={"modalities": modalities}, headers=headers)
+    assert update.status_code == 200
+    return register.json()["id"], headers
+
+
+class TestProfessionalsModalityUpdate:
+    """Modalities are matched by modalityId and only the difference is written."""
+
+    def test_modalities_keep_their_ids(self, client: TestClient, test_data_factory):
+        """Unchanged and updated modalities keep their row IDs; removed ones disappear."""
+        professional_data = test_data_factory["professional"]("modality_diff")
+        register = client.post("/api/v1/auth/register/professional", json=professional_data)
+        assert register.status_code == 201
+        login = client.post(
+            "/api/v1/auth/login/professional",
+            json={"email": professional_data["email"], "password": professional_data["password"]},
+        )
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        modality_ids = []
+        for _ in range(2):
+            created = client.post(
+                "/api/v1/modalities/", json={"name": f"Test modality {uuid.uuid4().hex[:8]}"}, headers=headers
+            )
+            assert created.status_code == 200, created.text
+            modality_ids.append(created.json()["id"])
+        online, in_person = modality_ids
+
+        first = client.put(
+            "/api/v1/professionals/me",
+            json={"modalities": [_modality(online, "Online", isDefault=True), _modality(in_person, "In person")]},
+            headers=headers,
+        )
+        assert first.status_code == 200
+        row_ids = {modality["modalityId"]: modality["id"] for modality in first.json()["modalities"]}
+
+        # Other fields only: the modalities are left alone
+        bio_only = client.put("/api/v1/professionals/me", json={"bio": "Updated bio"}, headers=headers)
+        assert {modality["id"] for modality in bio_only.json()["modalities"]} == set(row_ids.values())
+
+        # One price changed, one modality removed
+        second = client.put(
+            "/api/v1/professionals/me",
+            json={"modalities": [_modality(online, "Online", virtual_price=90000, isDefault=True)]},
+            headers=headers,
+        )
+        assert second.status_code == 200
+        (modality,) = second.json()["modalities"]
+        assert modality["id"] == row_ids[online]
+        assert modality["virtualPrice"] == 90000
+
+
+class TestProfessionalsDefaultModalitySwitch:
+    """Switching the default modality invalidates cached professional responses."""
+
+    def test_cached_detail_follows_the_default(self, client: TestClient, test_data_factory, monkeypatch):
+        """The detail served from the response cache shows the new default after a switch."""
+        cache = ProfessionalResponseCache(InMemoryCacheBackend(max_entries=64))
+        monkeypatch.setattr("app.services.professional_cache.get_professional_cache", lambda: cache)
+        monkeypatch.setattr("app.api.v1.endpoints.professionals.get_professional_cache", lambda: cache)
+        professional_id, _headers = _professional_with_modalities(
+            client, test_data_factory["professional"]("default_switch"), ["Online", "In person"]
+        )
+
+        before = client.get(f"/api/v1/professionals/{professional_id}")
+        assert before.status_code == 200
+        defaults = {modality["modalityName"]: modality["isDefault"] for modality in before.json()["modalities"]}
+        assert defaults == {"Online": True, "In person": False}
+        in_person = next(row for row in before.json()["modalities"] if row["modalityName"] == "In person")
+
+        switched = client.put(f"/api/v1/professional-modalities/{in_person['id']}/set-default")
+        assert switched.status_code == 200
+
+        after = client.get(f"/api/v1/professionals/{professional_id}")
+        assert after.status_code == 200
+        defaults = {modality["modalityName"]: modality["isDefault"] for modality in after.json()["modalities"]}
+        assert defaults == {"Online": False, "In person": True}
+        assert after.headers["etag"] != before.headers["etag"]
@@ -0,0 +1,74 @@
+"""
+Integration tests guaranteeing a bounded number of SQL statements on the professional read path.
+"""
+
+from contextlib import contextmanager
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.services.professional_service import PROFESSIONAL_PAGE_QUERY_COUNT
+
+
+@contextmanager
+def count_statements(async_engine):
+    """Count the statements executed on the async engine inside the block."""
+    statements = []
+
+    def before_cursor_execute(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+class TestProfessionalsQueryCount:
+    """Statement count for professional listing and detail endpoints."""
+
+    def _register_professionals(self, client: TestClient, test_data_factory, count: int) -> list[str]:
+        ids = []
+        for index in range(count):
+            response = client.post(
+                "/api/v1/auth/register/professional",
+                json=test_data_factory["professional"](f"query_count_{index}"),
+            )
+            assert response.status_code == 201
+            ids.append(response.json()["id"])
+        return ids
+
+    def test_listing_query_count_independent_of_page_size(self, client: TestClient, async_engine, test_data_factory):
+        """Listing one or many professionals costs the same number of statements."""
+        self._register_professionals(client, test_data_factory, 3)
+        # Warm up: first connection runs dialect initialization statements
+        client.get("/api/v1/professionals/?limit=1")
+
+        with count_statements(async_engine) as single_page:
+            response = client.get("/api/v1/professionals/?limit=1")
+        assert response.status_code == 200
+
+        with count_statements(async_engine) as full_page:
+            response = client.get("/api/v1/professionals/?limit=100")
+        assert response.status_code == 200
+        assert len(response.json()) >= 3
+
+        assert len(single_page) <= PROFESSIONAL_PAGE_QUERY_COUNT
+        assert len(full_page) <= PROFESSIONAL_PAGE_QUERY_COUNT
+
+    def test_detail_query_count(self, client: TestClient, async_engine, test_data_factory):
+        """Fetching a single professional never lazy loads relationships."""
+        [professional_id] = self._register_professionals(client, test_data_factory, 1)
+        client.get(f"/api/v1/professionals/{professional_id}")
+
+        with count_statements(async_engine) as statements:
+            response = client.get(f"/api/v1/professionals/{professional_id}")
+
+        assert response.status_code == 200
+        assert len(statements) <= PROFESSIONAL_PAGE_QUERY_COUNT
+
+    def test_listing_rejects_page_size_above_maximum(self, client: TestClient):
+        """Page size is capped so eager loads stay within a single IN batch."""
+        response = client.get("/api/v1/professionals/?limit=1000")
+        assert response.status_code == 422
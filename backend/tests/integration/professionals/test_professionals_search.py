@@ -0,0 +1,122 @@
+"""
+Integration tests for the faceted professional search endpoint.
+"""
+
+import uuid
+
+from fastapi.testclient import TestClient
+
+
+def _facet(data: dict, facet: str) -> dict:
+    return {item["value"]: item["count"] for item in data["facets"][facet]}
+
+
+class TestProfessionalsSearch:
+    """Faceted search over specialty, approach and language arrays."""
+
+    def _register(self, client: TestClient, test_data_factory, suffix: str, **fields) -> str:
+        payload = {**test_data_factory["professional"](suffix), **fields}
+        response = client.post("/api/v1/auth/register/professional", json=payload)
+        assert response.status_code == 201
+        return response.json()["id"]
+
+    def test_search_returns_results_and_facet_counts(self, client: TestClient, test_data_factory):
+        """Filtering a facet narrows results but keeps counts for its other values."""
+        first_specialty, second_specialty = str(uuid.uuid4()), str(uuid.uuid4())
+        language = f"lang-{uuid.uuid4()}"
+        first_id = self._register(
+            client, test_data_factory, "search_first", specialty_ids=[first_specialty], languages=[language]
+        )
+        self._register(
+            client, test_data_factory, "search_second", specialty_ids=[second_specialty], languages=[language]
+        )
+
+        response = client.get(
+            "/api/v1/professionals/search",
+            params={"specialty_ids": [first_specialty], "languages": [language]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert [item["id"] for item in data["items"]] == [first_id]
+        # Specialty counts ignore the specialty filter itself
+        specialties = _facet(data, "specialty_ids")
+        assert specialties[first_specialty] == 1
+        assert specialties[second_specialty] == 1
+        # Other facets are narrowed by the specialty filter
+        assert _facet(data, "languages")[language] == 1
+
+    def test_search_values_within_facet_are_ored(self, client: TestClient, test_data_factory):
+        """Selecting several values of one facet matches any of them."""
+        first_specialty, second_specialty = str(uuid.uuid4()), str(uuid.uuid4())
+        self._register(client, test_data_factory, "search_or_first", specialty_ids=[first_specialty])
+        self._register(client, test_data_factory, "search_or_second", specialty_ids=[second_specialty])
+
+        response = client.get(
+            "/api/v1/professionals/search",
+            params={"specialty_ids": [first_specialty, second_specialty]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
+
+    def test_listing_array_filters_match_all(self, client: TestClient, test_data_factory):
+        """With match=all, every selected value must be present."""
+        marker = uuid.uuid4().hex[:8]
+        spanish, english = f"es-{marker}", f"en-{marker}"
+        bilingual = self._register(client, test_data_factory, "search_all_both", languages=[spanish, english])
+        self._register(client, test_data_factory, "search_all_one", languages=[spanish])
+
+        any_response = client.get("/api/v1/professionals/", params={"languages": [spanish, english]})
+        all_response = client.get(
+            "/api/v1/professionals/", params={"languages": [spanish, english], "languages_match": "all"}
+        )
+
+        assert any_response.status_code == 200
+        assert len(any_response.json()) == 2
+        assert all_response.status_code == 200
+        assert [item["id"] for item in all_response.json()] == [bilingual]
+
+    def test_search_rejects_invalid_modality_id(self, client: TestClient):
+        """Modality filters must be UUIDs."""
+        response = client.get("/api/v1/professionals/search", params={"modality_ids": ["not-a-uuid"]})
+
+        assert response.status_code == 422
+
+    def test_text_search_is_accent_insensitive_and_ranked(self, client: TestClient, test_data_factory):
+        """Free text matches stems without accents, name matches rank above bio matches."""
+        marker = uuid.uuid4().hex[:12]
+        bio_match = self._register(
+            client, test_data_factory, "search_text_bio", bio=f"Atención de ansiedad y terapia de pareja {marker}"
+        )
+        name_match = self._register(
+            client, test_data_factory, "search_text_name", full_name=f"Test Psicóloga {marker}", bio="Test bio"
+        )
+
+        response = client.get("/api/v1/professionals/", params={"q": f"{marker} atencion"})
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == [bio_match]
+
+        response = client.get("/api/v1/professionals/", params={"q": marker})
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == [name_match, bio_match]
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_text_search_rejects_cursor(self, client: TestClient):
+        """Ranked results cannot be paged with a keyset cursor."""
+        first_page = client.get("/api/v1/professionals/", params={"limit": 1})
+        cursor = first_page.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return
+
+        response = client.get("/api/v1/professionals/", params={"q": "ansiedad", "cursor": cursor})
+
+        assert response.status_code == 400
+
+    def test_listing_specialty_filter(self, client: TestClient):
+        """The legacy specialty filter matches specialty names instead of failing."""
+        response = client.get("/api/v1/professionals/", params={"specialty": "no-such-specialty"})
+
+        assert response.status_code == 200
+        assert response.json() == []
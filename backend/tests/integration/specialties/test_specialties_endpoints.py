@@ -4,8 +4,8 @@ Integration tests for specialties endpoints.
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
-from sqlalchemy.orm import Session
+from unittest.mock import AsyncMock, Mock, patch
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
 from app.models.specialty import Specialty
@@ -24,7 +24,7 @@ class TestSpecialtiesEndpoints:
     @pytest.fixture
     def mock_db(self):
         """Mock database session."""
-        return Mock(spec=Session)
+        return Mock(spec=AsyncSession)
 
     @pytest.fixture
     def sample_specialty(self):
@@ -35,15 +35,15 @@ class TestSpecialtiesEndpoints:
         specialty.category = "therapy"
         return specialty
 
-    @patch("app.api.v1.endpoints.specialties.get_db")
+    @patch("app.api.v1.endpoints.specialties.get_async_db")
     def test_get_specialties_success(self, mock_get_db, client, mock_db, sample_specialty):
         """Test getting all specialties successfully."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the SpecialtyService
-        with patch("app.api.v1.endpoints.specialties.SpecialtyService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncSpecialtyService
+        with patch("app.api.v1.endpoints.specialties.AsyncSpecialtyService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.get_specialties.return_value = [sample_specialty]
             mock_service_class.return_value = mock_service
 
@@ -56,15 +56,15 @@ class TestSpecialtiesEndpoints:
             assert len(data) == 1
             assert data[0]["name"] == "Cognitive Behavioral Therapy"
 
-    @patch("app.api.v1.endpoints.specialties.get_db")
+    @patch("app.api.v1.endpoints.specialties.get_async_db")
     def test_get_specialties_with_pagination(self, mock_get_db, client, mock_db, sample_specialty):
         """Test getting specialties with pagination."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the SpecialtyService
-        with patch("app.api.v1.endpoints.specialties.SpecialtyService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncSpecialtyService
+        with patch("app.api.v1.endpoints.specialties.AsyncSpecialtyService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.get_specialties.return_value = [sample_specialty]
             mock_service_class.return_value = mock_service
 
@@ -75,17 +75,17 @@ class TestSpecialtiesEndpoints:
             assert response.status_code == 200
             data = response.json()
             assert len(data) == 1
-            mock_service.get_specialties.assert_called_once_with(skip=10, limit=5)
+            mock_service.get_specialties.assert_called_once_with(skip=10, limit=5, cursor=None)
 
-    @patch("app.api.v1.endpoints.specialties.get_db")
+    @patch("app.api.v1.endpoints.specialties.get_async_db")
     def test_get_specialties_by_category_success(self, mock_get_db, client, mock_db, sample_specialty):
         """Test getting specialties by category successfully."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the SpecialtyService
-        with patch("app.api.v1.endpoints.specialties.SpecialtyService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncSpecialtyService
+        with patch("app.api.v1.endpoints.specialties.AsyncSpecialtyService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.get_specialties_by_category.return_value = [sample_specialty]
             mock_service_class.return_value = mock_service
 
@@ -99,15 +99,15 @@ class TestSpecialtiesEndpoints:
             assert data[0]["name"] == "Cognitive Behavioral Therapy"
             mock_service.get_specialties_by_category.assert_called_once_with("therapy")
 
-    @patch("app.api.v1.endpoints.specialties.get_db")
+    @patch("app.api.v1.endpoints.specialties.get_async_db")
     def test_get_specialty_success(self, mock_get_db, client, mock_db, sample_specialty):
         """Test getting a specific specialty successfully."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the SpecialtyService
-        with patch("app.api.v1.endpoints.specialties.SpecialtyService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncSpecialtyService
+        with patch("app.api.v1.endpoints.specialties.AsyncSpecialtyService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.get_specialty.return_value = sample_specialty
             mock_service_class.return_value = mock_service
 
@@ -122,15 +122,15 @@ class TestSpecialtiesEndpoints:
             assert data["name"] == "Cognitive Behavioral Therapy"
             assert data["id"] == "550e8400-e29b-41d4-a716-446655440000"
 
-    @patch("app.api.v1.endpoints.specialties.get_db")
+    @patch("app.api.v1.endpoints.specialties.get_async_db")
     def test_get_specialty_not_found(self, mock_get_db, client, mock_db):
         """Test getting a specialty that doesn't exist."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the SpecialtyService
-        with patch("app.api.v1.endpoints.specialties.SpecialtyService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncSpecialtyService
+        with patch("app.api.v1.endpoints.specialties.AsyncSpecialtyService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.get_specialty.return_value = None
             mock_service_class.return_value = mock_service
 
@@ -142,15 +142,15 @@ class TestSpecialtiesEndpoints:
             data = response.json()
             assert data["detail"] == "Specialty not found"
 
-    @patch("app.api.v1.endpoints.specialties.get_db")
+    @patch("app.api.v1.endpoints.specialties.get_async_db")
     def test_create_specialty_success(self, mock_get_db, client, mock_db, sample_specialty):
         """Test creating a specialty successfully."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the SpecialtyService
-        with patch("app.api.v1.endpoints.specialties.SpecialtyService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncSpecialtyService
+        with patch("app.api.v1.endpoints.specialties.AsyncSpecialtyService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.create_specialty.return_value = sample_specialty
             mock_service_class.return_value = mock_service
 
@@ -166,15 +166,15 @@ class TestSpecialtiesEndpoints:
             data = response.json()
             assert data["name"] == "Cognitive Behavioral Therapy"
 
-    @patch("app.api.v1.endpoints.specialties.get_db")
+    @patch("app.api.v1.endpoints.specialties.get_async_db")
     def test_update_specialty_success(self, mock_get_db, client, mock_db, sample_specialty):
         """Test updating a specialty successfully."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the SpecialtyService
-        with patch("app.api.v1.endpoints.specialties.SpecialtyService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncSpecialtyService
+        with patch("app.api.v1.endpoints.specialties.AsyncSpecialtyService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.update_specialty.return_value = sample_specialty
             mock_service_class.return_value = mock_service
 
@@ -190,15 +190,15 @@ class TestSpecialtiesEndpoints:
             data = response.json()
             assert data["name"] == "Cognitive Behavioral Therapy"
 
-    @patch("app.api.v1.endpoints.specialties.get_db")
+    @patch("app.api.v1.endpoints.specialties.get_async_db")
     def test_update_specialty_not_found(self, mock_get_db, client, mock_db):
         """Test updating a specialty that doesn't exist."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the SpecialtyService
-        with patch("app.api.v1.endpoints.specialties.SpecialtyService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncSpecialtyService
+        with patch("app.api.v1.endpoints.specialties.AsyncSpecialtyService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.update_specialty.return_value = None
             mock_service_class.return_value = mock_service
 
@@ -212,15 +212,15 @@ class TestSpecialtiesEndpoints:
             data = response.json()
             assert data["detail"] == "Specialty not found"
 
-    @patch("app.api.v1.endpoints.specialties.get_db")
+    @patch("app.api.v1.endpoints.specialties.get_async_db")
     def test_delete_specialty_success(self, mock_get_db, client, mock_db):
         """Test deleting a specialty successfully."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the SpecialtyService
-        with patch("app.api.v1.endpoints.specialties.SpecialtyService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncSpecialtyService
+        with patch("app.api.v1.endpoints.specialties.AsyncSpecialtyService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.delete_specialty.return_value = True
             mock_service_class.return_value = mock_service
 
@@ -232,15 +232,15 @@ class TestSpecialtiesEndpoints:
             data = response.json()
             assert data["message"] == "Specialty deleted successfully"
 
-    @patch("app.api.v1.endpoints.specialties.get_db")
+    @patch("app.api.v1.endpoints.specialties.get_async_db")
     def test_delete_specialty_not_found(self, mock_get_db, client, mock_db):
         """Test deleting a specialty that doesn't exist."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the SpecialtyService
-        with patch("app.api.v1.endpoints.specialties.SpecialtyService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncSpecialtyService
+        with patch("app.api.v1.endpoints.specialties.AsyncSpecialtyService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.delete_specialty.return_value = False
             mock_service_class.return_value = mock_service
 
@@ -4,8 +4,8 @@ Integration tests for therapeutic approaches endpoints.
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
-from sqlalchemy.orm import Session
+from unittest.mock import AsyncMock, Mock, patch
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
 from app.models.therapeutic_approach import TherapeuticApproach
@@ -24,7 +24,7 @@ class TestTherapeuticApproachesEndpoints:
     @pytest.fixture
     def mock_db(self):
         """Mock database session."""
-        return Mock(spec=Session)
+        return Mock(spec=AsyncSession)
 
     @pytest.fixture
     def sample_therapeutic_approach(self):
@@ -36,15 +36,15 @@ class TestTherapeuticApproachesEndpoints:
         approach.category = "psychotherapy"
         return approach
 
-    @patch("app.api.v1.endpoints.therapeutic_approaches.get_db")
+    @patch("app.api.v1.endpoints.therapeutic_approaches.get_async_db")
     def test_get_therapeutic_approaches_success(self, mock_get_db, client, mock_db, sample_therapeutic_approach):
         """Test getting all therapeutic approaches successfully."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the TherapeuticApproachService
-        with patch("app.api.v1.endpoints.therapeutic_approaches.TherapeuticApproachService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncTherapeuticApproachService
+        with patch("app.api.v1.endpoints.therapeutic_approaches.AsyncTherapeuticApproachService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.get_therapeutic_approaches.return_value = [sample_therapeutic_approach]
             mock_service_class.return_value = mock_service
 
@@ -58,7 +58,7 @@ class TestTherapeuticApproachesEndpoints:
             assert data[0]["name"] == "Cognitive Behavioral Therapy"
             assert data[0]["id"] == "550e8400-e29b-41d4-a716-446655440001"
 
-    @patch("app.api.v1.endpoints.therapeutic_approaches.get_db")
+    @patch("app.api.v1.endpoints.therapeutic_approaches.get_async_db")
     def test_get_therapeutic_approaches_with_pagination(
         self, mock_get_db, client, mock_db, sample_therapeutic_approach
     ):
@@ -66,9 +66,9 @@ class TestTherapeuticApproachesEndpoints:
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the TherapeuticApproachService
-        with patch("app.api.v1.endpoints.therapeutic_approaches.TherapeuticApproachService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncTherapeuticApproachService
+        with patch("app.api.v1.endpoints.therapeutic_approaches.AsyncTherapeuticApproachService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.get_therapeutic_approaches.return_value = [sample_therapeutic_approach]
             mock_service_class.return_value = mock_service
 
@@ -79,9 +79,9 @@ class TestTherapeuticApproachesEndpoints:
             assert response.status_code == 200
             data = response.json()
             assert len(data) == 1
-            mock_service.get_therapeutic_approaches.assert_called_once_with(skip=10, limit=5)
+            mock_service.get_therapeutic_approaches.assert_called_once_with(skip=10, limit=5, cursor=None)
 
-    @patch("app.api.v1.endpoints.therapeutic_approaches.get_db")
+    @patch("app.api.v1.endpoints.therapeutic_approaches.get_async_db")
     def test_get_therapeutic_approaches_by_category_success(
         self, mock_get_db, client, mock_db, sample_therapeutic_approach
     ):
@@ -89,9 +89,9 @@ class TestTherapeuticApproachesEndpoints:
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the TherapeuticApproachService
-        with patch("app.api.v1.endpoints.therapeutic_approaches.TherapeuticApproachService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncTherapeuticApproachService
+        with patch("app.api.v1.endpoints.therapeutic_approaches.AsyncTherapeuticApproachService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.get_therapeutic_approaches_by_category.return_value = [sample_therapeutic_approach]
             mock_service_class.return_value = mock_service
 
@@ -108,15 +108,15 @@ class TestTherapeuticApproachesEndpoints:
             assert data[0]["category"] == "psychotherapy"
             mock_service.get_therapeutic_approaches_by_category.assert_called_once_with("psychotherapy")
 
-    @patch("app.api.v1.endpoints.therapeutic_approaches.get_db")
+    @patch("app.api.v1.endpoints.therapeutic_approaches.get_async_db")
     def test_get_therapeutic_approach_success(self, mock_get_db, client, mock_db, sample_therapeutic_approach):
         """Test getting a specific therapeutic approach successfully."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the TherapeuticApproachService
-        with patch("app.api.v1.endpoints.therapeutic_approaches.TherapeuticApproachService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncTherapeuticApproachService
+        with patch("app.api.v1.endpoints.therapeutic_approaches.AsyncTherapeuticApproachService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.get_therapeutic_approach.return_value = sample_therapeutic_approach
             mock_service_class.return_value = mock_service
 
@@ -131,15 +131,15 @@ class TestTherapeuticApproachesEndpoints:
             assert data["name"] == "Cognitive Behavioral Therapy"
             assert data["id"] == "550e8400-e29b-41d4-a716-446655440001"
 
-    @patch("app.api.v1.endpoints.therapeutic_approaches.get_db")
+    @patch("app.api.v1.endpoints.therapeutic_approaches.get_async_db")
     def test_get_therapeutic_approach_not_found(self, mock_get_db, client, mock_db):
         """Test getting a therapeutic approach that doesn't exist."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the TherapeuticApproachService
-        with patch("app.api.v1.endpoints.therapeutic_approaches.TherapeuticApproachService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncTherapeuticApproachService
+        with patch("app.api.v1.endpoints.therapeutic_approaches.AsyncTherapeuticApproachService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.get_therapeutic_approach.return_value = None
             mock_service_class.return_value = mock_service
 
@@ -151,15 +151,15 @@ class TestTherapeuticApproachesEndpoints:
             data = response.json()
             assert data["detail"] == "Therapeutic approach not found"
 
-    @patch("app.api.v1.endpoints.therapeutic_approaches.get_db")
+    @patch("app.api.v1.endpoints.therapeutic_approaches.get_async_db")
     def test_create_therapeutic_approach_success(self, mock_get_db, client, mock_db, sample_therapeutic_approach):
         """Test creating a therapeutic approach successfully."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the TherapeuticApproachService
-        with patch("app.api.v1.endpoints.therapeutic_approaches.TherapeuticApproachService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncTherapeuticApproachService
+        with patch("app.api.v1.endpoints.therapeutic_approaches.AsyncTherapeuticApproachService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.create_therapeutic_approach.return_value = sample_therapeutic_approach
             mock_service_class.return_value = mock_service
 
@@ -179,15 +179,15 @@ class TestTherapeuticApproachesEndpoints:
             data = response.json()
             assert data["name"] == "Cognitive Behavioral Therapy"
 
-    @patch("app.api.v1.endpoints.therapeutic_approaches.get_db")
+    @patch("app.api.v1.endpoints.therapeutic_approaches.get_async_db")
     def test_update_therapeutic_approach_success(self, mock_get_db, client, mock_db, sample_therapeutic_approach):
         """Test updating a therapeutic approach successfully."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the TherapeuticApproachService
-        with patch("app.api.v1.endpoints.therapeutic_approaches.TherapeuticApproachService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncTherapeuticApproachService
+        with patch("app.api.v1.endpoints.therapeutic_approaches.AsyncTherapeuticApproachService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.update_therapeutic_approach.return_value = sample_therapeutic_approach
             mock_service_class.return_value = mock_service
 
@@ -203,15 +203,15 @@ class TestTherapeuticApproachesEndpoints:
             data = response.json()
             assert data["name"] == "Cognitive Behavioral Therapy"
 
-    @patch("app.api.v1.endpoints.therapeutic_approaches.get_db")
+    @patch("app.api.v1.endpoints.therapeutic_approaches.get_async_db")
     def test_update_therapeutic_approach_not_found(self, mock_get_db, client, mock_db):
         """Test updating a therapeutic approach that doesn't exist."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the TherapeuticApproachService
-        with patch("app.api.v1.endpoints.therapeutic_approaches.TherapeuticApproachService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncTherapeuticApproachService
+        with patch("app.api.v1.endpoints.therapeutic_approaches.AsyncTherapeuticApproachService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.update_therapeutic_approach.return_value = None
             mock_service_class.return_value = mock_service
 
@@ -227,15 +227,15 @@ class TestTherapeuticApproachesEndpoints:
             data = response.json()
             assert data["detail"] == "Therapeutic approach not found"
 
-    @patch("app.api.v1.endpoints.therapeutic_approaches.get_db")
+    @patch("app.api.v1.endpoints.therapeutic_approaches.get_async_db")
     def test_delete_therapeutic_approach_success(self, mock_get_db, client, mock_db):
         """Test deleting a therapeutic approach successfully."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the TherapeuticApproachService
-        with patch("app.api.v1.endpoints.therapeutic_approaches.TherapeuticApproachService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncTherapeuticApproachService
+        with patch("app.api.v1.endpoints.therapeutic_approaches.AsyncTherapeuticApproachService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.delete_therapeutic_approach.return_value = True
             mock_service_class.return_value = mock_service
 
@@ -249,15 +249,15 @@ class TestTherapeuticApproachesEndpoints:
             data = response.json()
             assert data["message"] == "Therapeutic approach deleted successfully"
 
-    @patch("app.api.v1.endpoints.therapeutic_approaches.get_db")
+    @patch("app.api.v1.endpoints.therapeutic_approaches.get_async_db")
     def test_delete_therapeutic_approach_not_found(self, mock_get_db, client, mock_db):
         """Test deleting a therapeutic approach that doesn't exist."""
         # Arrange
         mock_get_db.return_value = mock_db
 
-        # Mock the TherapeuticApproachService
-        with patch("app.api.v1.endpoints.therapeutic_approaches.TherapeuticApproachService") as mock_service_class:
-            mock_service = Mock()
+        # Mock the AsyncTherapeuticApproachService
+        with patch("app.api.v1.endpoints.therapeutic_approaches.AsyncTherapeuticApproachService") as mock_service_class:
+            mock_service = AsyncMock()
             mock_service.delete_therapeutic_approach.return_value = False
             mock_service_class.return_value = mock_service
 
@@ -4,8 +4,8 @@ Integration tests for users endpoints.
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
-from sqlalchemy.orm import Session
+from unittest.mock import AsyncMock, Mock, patch
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
 from app.models.user import User
@@ -24,7 +24,7 @@ class TestUsersEndpoints:
     @pytest.fixture
     def mock_db(self):
         """Mock database session."""
-        return Mock(spec=Session)
+        return Mock(spec=AsyncSession)
 
     @pytest.fixture
     def sample_user(self):
@@ -45,7 +45,7 @@ class TestUsersEndpoints:
         user.updated_at = "2024-01-01T00:00:00"
         return user
 
-    @patch("app.api.v1.endpoints.users.get_db")
+    @patch("app.api.v1.endpoints.users.get_async_db")
     def test_get_users_unauthorized(self, mock_get_db, client, mock_db):
         """Test getting all users without authentication."""
         # Arrange
@@ -59,7 +59,7 @@ class TestUsersEndpoints:
         data = response.json()
         assert data["detail"] == "Authentication required"
 
-    @patch("app.api.v1.endpoints.users.get_db")
+    @patch("app.api.v1.endpoints.users.get_async_db")
     def test_get_user_by_id_unauthorized(self, mock_get_db, client, mock_db):
         """Test getting user by ID without authentication."""
         # Arrange
@@ -90,22 +90,22 @@ class TestUsersEndpoints:
     def test_update_current_user_success(self, client, mock_db, sample_user):
         """Test updating current user profile successfully."""
         # Arrange
-        # Mock the AuthService
-        mock_service = Mock()
+        # Mock the AsyncAuthService
+        mock_service = AsyncMock()
         mock_service.get_user_by_id.return_value = sample_user
 
         # Override the dependencies
-        from app.core.database import get_db
+        from app.core.database import get_async_db
         from app.api.v1.endpoints.auth import get_current_user_id
 
-        client.app.dependency_overrides[get_db] = lambda: mock_db
+        client.app.dependency_overrides[get_async_db] = lambda: mock_db
         client.app.dependency_overrides[get_current_user_id] = lambda: "550e8400-e29b-41d4-a716-446655440002"
 
         # Mock database operations
-        mock_db.commit = Mock()
-        mock_db.refresh = Mock()
+        mock_db.commit = AsyncMock()
+        mock_db.refresh = AsyncMock()
 
-        with patch("app.api.v1.endpoints.users.AuthService") as mock_service_class:
+        with patch("app.api.v1.endpoints.users.AsyncAuthService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             # Act
@@ -121,7 +121,8 @@ class TestUsersEndpoints:
             assert data["full_name"] == "Updated Name"
             assert data["phone"] == "+9876543210"
             mock_db.commit.assert_called_once()
-            mock_db.refresh.assert_called_once()
+            # The UPDATE returns the new row state
+            mock_db.refresh.assert_not_called()
 
         # Clean up
         client.app.dependency_overrides.clear()
@@ -129,18 +130,18 @@ class TestUsersEndpoints:
     def test_update_current_user_not_found(self, client, mock_db):
         """Test updating current user when user doesn't exist."""
         # Arrange
-        # Mock the AuthService
-        mock_service = Mock()
+        # Mock the AsyncAuthService
+        mock_service = AsyncMock()
         mock_service.get_user_by_id.return_value = None
 
         # Override the dependencies
-        from app.core.database import get_db
+        from app.core.database import get_async_db
         from app.api.v1.endpoints.auth import get_current_user_id
 
-        client.app.dependency_overrides[get_db] = lambda: mock_db
+        client.app.dependency_overrides[get_async_db] = lambda: mock_db
         client.app.dependency_overrides[get_current_user_id] = lambda: "550e8400-e29b-41d4-a716-446655440002"
 
-        with patch("app.api.v1.endpoints.users.AuthService") as mock_service_class:
+        with patch("app.api.v1.endpoints.users.AsyncAuthService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             # Act
@@ -157,24 +158,24 @@ class TestUsersEndpoints:
     def test_update_current_user_exception_handling(self, client, mock_db, sample_user):
         """Test updating current user with exception handling."""
         # Arrange
-        # Mock the AuthService
-        mock_service = Mock()
+        # Mock the AsyncAuthService
+        mock_service = AsyncMock()
         mock_service.get_user_by_id.return_value = sample_user
 
         # Override the dependencies
-        from app.core.database import get_db
+        from app.core.database import get_async_db
         from app.api.v1.endpoints.auth import get_current_user_id
 
-        client.app.dependency_overrides[get_db] = lambda: mock_db
+        client.app.dependency_overrides[get_async_db] = lambda: mock_db
         client.app.dependency_overrides[get_current_user_id] = lambda: "550e8400-e29b-41d4-a716-446655440002"
 
         # Mock database operations to raise exception
         from sqlalchemy.exc import SQLAlchemyError
 
-        mock_db.commit = Mock(side_effect=SQLAlchemyError("Database error"))
-        mock_db.rollback = Mock()
+        mock_db.commit = AsyncMock(side_effect=SQLAlchemyError("Database error"))
+        mock_db.rollback = AsyncMock()
 
-        with patch("app.api.v1.endpoints.users.AuthService") as mock_service_class:
+        with patch("app.api.v1.endpoints.users.AsyncAuthService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             # Act
@@ -192,21 +193,21 @@ class TestUsersEndpoints:
     def test_delete_current_user_success(self, client, mock_db, sample_user):
         """Test deleting current user account successfully."""
         # Arrange
-        # Mock the AuthService
-        mock_service = Mock()
+        # Mock the AsyncAuthService
+        mock_service = AsyncMock()
         mock_service.get_user_by_id.return_value = sample_user
 
         # Override the dependencies
-        from app.core.database import get_db
+        from app.core.database import get_async_db
         from app.api.v1.endpoints.auth import get_current_user_id
 
-        client.app.dependency_overrides[get_db] = lambda: mock_db
+        client.app.dependency_overrides[get_async_db] = lambda: mock_db
         client.app.dependency_overrides[get_current_user_id] = lambda: "550e8400-e29b-41d4-a716-446655440002"
 
         # Mock database operations
-        mock_db.commit = Mock()
+        mock_db.commit = AsyncMock()
 
-        with patch("app.api.v1.endpoints.users.AuthService") as mock_service_class:
+        with patch("app.api.v1.endpoints.users.AsyncAuthService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             # Act
@@ -223,18 +224,18 @@ class TestUsersEndpoints:
     def test_delete_current_user_not_found(self, client, mock_db):
         """Test deleting current user when user doesn't exist."""
         # Arrange
-        # Mock the AuthService
-        mock_service = Mock()
+        # Mock the AsyncAuthService
+        mock_service = AsyncMock()
         mock_service.get_user_by_id.return_value = None
 
         # Override the dependencies
-        from app.core.database import get_db
+        from app.core.database import get_async_db
         from app.api.v1.endpoints.auth import get_current_user_id
 
-        client.app.dependency_overrides[get_db] = lambda: mock_db
+        client.app.dependency_overrides[get_async_db] = lambda: mock_db
         client.app.dependency_overrides[get_current_user_id] = lambda: "550e8400-e29b-41d4-a716-446655440002"
 
-        with patch("app.api.v1.endpoints.users.AuthService") as mock_service_class:
+        with patch("app.api.v1.endpoints.users.AsyncAuthService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             # Act
@@ -251,24 +252,24 @@ class TestUsersEndpoints:
     def test_delete_current_user_exception_handling(self, client, mock_db, sample_user):
         """Test deleting current user with exception handling."""
         # Arrange
-        # Mock the AuthService
-        mock_service = Mock()
+        # Mock the AsyncAuthService
+        mock_service = AsyncMock()
         mock_service.get_user_by_id.return_value = sample_user
 
         # Override the dependencies
-        from app.core.database import get_db
+        from app.core.database import get_async_db
         from app.api.v1.endpoints.auth import get_current_user_id
 
-        client.app.dependency_overrides[get_db] = lambda: mock_db
+        client.app.dependency_overrides[get_async_db] = lambda: mock_db
         client.app.dependency_overrides[get_current_user_id] = lambda: "550e8400-e29b-41d4-a716-446655440002"
 
         # Mock database operations to raise exception
         from sqlalchemy.exc import SQLAlchemyError
 
-        mock_db.commit = Mock(side_effect=SQLAlchemyError("Database error"))
-        mock_db.rollback = Mock()
+        mock_db.commit = AsyncMock(side_effect=SQLAlchemyError("Database error"))
+        mock_db.rollback = AsyncMock()
 
-        with patch("app.api.v1.endpoints.users.AuthService") as mock_service_class:
+        with patch("app.api.v1.endpoints.users.AsyncAuthService") as mock_service_class:
             mock_service_class.return_value = mock_service
 
             # Act
@@ -0,0 +1,246 @@
+"""
+Unit tests for the AsyncSession-based services - fully mocked, no database connection.
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.password_hashing import PasswordHashingBusyError
+from app.models.user import User
+from app.schemas.specialty import SpecialtyCreate, SpecialtyUpdate
+from app.schemas.user import UserCreate
+from app.services.auth_service import AsyncAuthService
+from app.services.modality_service import AsyncModalityService
+from app.services.professional_service import AsyncProfessionalService
+from app.services.specialty_service import AsyncSpecialtyService
+
+
+class TestAsyncAuthServiceUnit:
+    """Unit tests for AsyncAuthService."""
+
+    @pytest.mark.asyncio
+    async def test_authenticate_user_success(self, async_db_session):
+        """Test successful user authentication."""
+        # Arrange
+        mock_user = MagicMock()
+        mock_user.hashed_password = "hashed_password"
+        async_db_session.execute.return_value.scalars.return_value.first.return_value = mock_user
+        auth_service = AsyncAuthService(async_db_session)
+
+        with patch("app.services.auth_service.verify_password", return_value=True) as mock_verify:
+            # Act
+            result = await auth_service.authenticate_user("test@example.com", "password123")
+
+        # Assert
+        assert result == mock_user
+        mock_verify.assert_called_once_with("password123", "hashed_password")
+        async_db_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_authenticate_professional_wrong_password(self, async_db_session):
+        """Test professional authentication with wrong password."""
+        # Arrange
+        mock_professional = MagicMock()
+        mock_professional.hashed_password = "hashed_password"
+        async_db_session.execute.return_value.scalars.return_value.first.return_value = mock_professional
+        auth_service = AsyncAuthService(async_db_session)
+
+        with patch("app.services.auth_service.verify_password", return_value=False):
+            # Act
+            result = await auth_service.authenticate_professional("pro@example.com", "wrong_password")
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_authenticate_with_saturated_password_hashing(self, async_db_session):
+        """Test that a full password hashing queue answers 503 with Retry-After."""
+        # Arrange
+        mock_user = MagicMock()
+        async_db_session.execute.return_value.scalars.return_value.first.return_value = mock_user
+        auth_service = AsyncAuthService(async_db_session)
+        saturated_pool = MagicMock()
+        saturated_pool.run = AsyncMock(side_effect=PasswordHashingBusyError)
+
+        with patch("app.services.auth_service.get_password_hashing_pool", return_value=saturated_pool):
+            # Act
+            with pytest.raises(HTTPException) as exc_info:
+                await auth_service.authenticate_user("test@example.com", "password123")
+
+        # Assert
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers["Retry-After"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_authenticate_user_upgrades_outdated_hash(self, async_db_session):
+        """Test that a successful login re-hashes a password made with outdated argon2 parameters."""
+        # Arrange
+        user = User(id=uuid.uuid4(), email="test@example.com", hashed_password="outdated_hash")
+        async_db_session.execute.return_value.scalars.return_value.first.return_value = user
+        auth_service = AsyncAuthService(async_db_session)
+
+        with (
+            patch("app.services.auth_service.verify_password", return_value=True),
+            patch("app.services.auth_service.password_needs_rehash", return_value=True) as mock_needs_rehash,
+            patch("app.services.auth_service.get_password_hash", return_value="current_hash") as mock_hash,
+        ):
+            # Act
+            result = await auth_service.authenticate_user("test@example.com", "password123")
+
+        # Assert
+        assert result is user
+        mock_needs_rehash.assert_called_once_with("outdated_hash")
+        mock_hash.assert_called_once_with("password123")
+        assert async_db_session.execute.await_count == 2
+        rehash = async_db_session.execute.await_args.args[0].compile()
+        assert "current_hash" in rehash.params.values()
+        assert "outdated_hash" in rehash.params.values()
+        async_db_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_create_user_success(self, async_db_session, test_user_data):
+        """Test successful user creation."""
+        # Arrange
+        auth_service = AsyncAuthService(async_db_session)
+
+        with patch("app.services.auth_service.get_password_hash", return_value="hashed_password"):
+            # Act
+            result = await auth_service.create_user(UserCreate(**test_user_data))
+
+        # Assert
+        assert result.hashed_password == "hashed_password"
+        async_db_session.add.assert_called_once()
+        async_db_session.commit.assert_awaited_once()
+        async_db_session.refresh.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_create_user_duplicate_email(self, async_db_session, test_user_data):
+        """Test user creation with duplicate email."""
+        # Arrange
+        async_db_session.execute.return_value.scalars.return_value.first.return_value = MagicMock()
+        auth_service = AsyncAuthService(async_db_session)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await auth_service.create_user(UserCreate(**test_user_data))
+
+        assert exc_info.value.status_code == 400
+        async_db_session.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_professional_by_id_invalid_uuid(self, async_db_session):
+        """Test that an invalid UUID short-circuits without touching the database."""
+        auth_service = AsyncAuthService(async_db_session)
+
+        result = await auth_service.get_professional_by_id("not-a-uuid")
+
+        assert result is None
+        async_db_session.execute.assert_not_awaited()
+
+
+class TestAsyncSpecialtyServiceUnit:
+    """Unit tests for AsyncSpecialtyService."""
+
+    @pytest.mark.asyncio
+    async def test_get_specialties(self, async_db_session):
+        """Test listing specialties."""
+        specialties = [MagicMock(), MagicMock()]
+        async_db_session.execute.return_value.scalars.return_value.all.return_value = specialties
+        service = AsyncSpecialtyService(async_db_session)
+
+        result = await service.get_specialties(skip=0, limit=10)
+
+        assert result == specialties
+        async_db_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_create_specialty(self, async_db_session):
+        """Test creating a specialty."""
+        service = AsyncSpecialtyService(async_db_session)
+
+        result = await service.create_specialty(SpecialtyCreate(name="Psicología clínica", category="clinical"))
+
+        assert result.name == "Psicología clínica"
+        async_db_session.add.assert_called_once()
+        async_db_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_update_specialty_not_found(self, async_db_session):
+        """Test updating a specialty that doesn't exist."""
+        service = AsyncSpecialtyService(async_db_session)
+
+        result = await service.update_specialty(str(uuid.uuid4()), SpecialtyUpdate(name="New name"))
+
+        assert result is None
+        async_db_session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_delete_specialty_success(self, async_db_session):
+        """Test deleting an existing specialty."""
+        specialty = MagicMock()
+        async_db_session.execute.return_value.scalars.return_value.first.return_value = specialty
+        service = AsyncSpecialtyService(async_db_session)
+
+        result = await service.delete_specialty(str(uuid.uuid4()))
+
+        assert result is True
+        async_db_session.delete.assert_awaited_once_with(specialty)
+        async_db_session.commit.assert_awaited_once()
+
+
+class TestAsyncModalityServiceUnit:
+    """Unit tests for AsyncModalityService."""
+
+    @pytest.mark.asyncio
+    async def test_deactivate_modality(self, async_db_session):
+        """Test soft deleting a modality."""
+        modality = MagicMock()
+        modality.is_active = True
+        async_db_session.execute.return_value.scalars.return_value.first.return_value = modality
+        service = AsyncModalityService(async_db_session)
+
+        result = await service.deactivate_modality(str(uuid.uuid4()))
+
+        assert result is True
+        assert modality.is_active is False
+        async_db_session.commit.assert_awaited_once()
+
+
+class TestAsyncProfessionalServiceUnit:
+    """Unit tests for AsyncProfessionalService."""
+
+    @pytest.mark.asyncio
+    async def test_get_professionals(self, async_db_session):
+        """Test listing active professionals."""
+        professionals = [MagicMock()]
+        async_db_session.execute.return_value.scalars.return_value.all.return_value = professionals
+        service = AsyncProfessionalService(async_db_session)
+
+        result = await service.get_professionals(skip=0, limit=10)
+
+        assert result == professionals
+
+    @pytest.mark.asyncio
+    async def test_get_active_professionals_by_ids_keeps_request_order(self, async_db_session):
+        """Test that a batch is read with one statement and returned in the order of the IDs."""
+        first, second = MagicMock(id=uuid.uuid4()), MagicMock(id=uuid.uuid4())
+        async_db_session.execute.return_value.scalars.return_value.all.return_value = [first, second]
+        service = AsyncProfessionalService(async_db_session)
+
+        result = await service.get_active_professionals_by_ids([second.id, uuid.uuid4(), first.id])
+
+        assert result == [second, first]
+        async_db_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_deactivate_professional_not_found(self, async_db_session):
+        """Test deactivating a professional that doesn't exist."""
+        service = AsyncProfessionalService(async_db_session)
+
+        result = await service.deactivate_professional(str(uuid.uuid4()))
+
+        assert result is False
+        async_db_session.commit.assert_not_awaited()
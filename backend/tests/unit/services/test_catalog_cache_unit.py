@@ -0,0 +1,131 @@
+"""
+Unit tests for the catalog snapshot cache - fully mocked, no database connection.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.catalog_cache import (
+    CATALOGS_CHANGED_KEY,
+    MODALITIES,
+    SPECIALTIES,
+    THERAPEUTIC_APPROACHES,
+    CatalogCache,
+    CatalogEntry,
+    CatalogSnapshot,
+    _invalidate_changed_catalogs,
+    get_catalog_cache,
+)
+from app.services.specialty_service import AsyncSpecialtyService
+from app.utils.pagination import Cursor
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+EMPTY_FINGERPRINT_ROW = (0, None, 0, None, 0, None)
+
+
+def _entry(index: int, **columns) -> CatalogEntry:
+    return CatalogEntry(
+        id=uuid.UUID(int=index), name=f"Entry {index}", created_at=BASE_TIME + timedelta(hours=index), **columns
+    )
+
+
+def _snapshot(**entries) -> CatalogSnapshot:
+    catalogs = {SPECIALTIES: (), THERAPEUTIC_APPROACHES: (), MODALITIES: ()}
+    catalogs.update(entries)
+    return CatalogSnapshot(1, (), catalogs)
+
+
+class TestCatalogSnapshotUnit:
+    """Unit tests for CatalogSnapshot."""
+
+    def test_resolves_mixed_ids(self):
+        """Test that IDs of different catalogs are resolved together and unknown IDs reported."""
+        specialty, modality = _entry(1), _entry(2)
+        snapshot = _snapshot(specialties=(specialty,), modalities=(modality,))
+
+        result = snapshot.resolve([str(modality.id), str(specialty.id).upper(), "unknown"])
+
+        assert result.specialties == {str(specialty.id).upper(): "Entry 1"}
+        assert result.modalities == {str(modality.id): "Entry 2"}
+        assert result.therapeutic_approaches == {}
+        assert result.missing_ids == ["unknown"]
+
+    def test_page_follows_keyset_pagination(self):
+        """Test that pages are filtered, then cut by cursor or offset, in (created_at, id) order."""
+        entries = tuple(_entry(index, is_active=index != 2) for index in range(1, 6))
+        snapshot = _snapshot(modalities=entries)
+
+        active = snapshot.page(MODALITIES, limit=2, where=lambda modality: modality.is_active)
+        after = snapshot.page(MODALITIES, cursor=Cursor(active[-1].created_at, active[-1].id))
+
+        assert [entry.id.int for entry in active] == [1, 3]
+        assert [entry.id.int for entry in after] == [4, 5]
+        assert [entry.id.int for entry in snapshot.page(MODALITIES, skip=3)] == [4, 5]
+
+
+class TestCatalogCacheUnit:
+    """Unit tests for CatalogCache."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_reused_until_invalidated(self, async_db_session):
+        """Test that the catalogs are read once per version: a fingerprint plus one statement per catalog."""
+        async_db_session.execute.return_value.one.return_value = EMPTY_FINGERPRINT_ROW
+        async_db_session.execute.return_value.all.return_value = []
+        cache = CatalogCache(check_interval_seconds=60)
+
+        first = await cache.snapshot(async_db_session)
+        assert await cache.snapshot(async_db_session) is first
+        assert async_db_session.execute.await_count == 4
+
+        cache.invalidate()
+        second = await cache.snapshot(async_db_session)
+        assert second.version == first.version + 1
+        assert async_db_session.execute.await_count == 8
+
+    @pytest.mark.asyncio
+    async def test_changes_from_other_workers_are_detected(self, async_db_session):
+        """Test that a changed fingerprint reloads the snapshot and an unchanged one does not."""
+        async_db_session.execute.return_value.one.return_value = EMPTY_FINGERPRINT_ROW
+        async_db_session.execute.return_value.all.return_value = []
+        cache = CatalogCache(check_interval_seconds=0)
+        first = await cache.snapshot(async_db_session)
+
+        assert await cache.snapshot(async_db_session) is first
+        assert async_db_session.execute.await_count == 5
+
+        async_db_session.execute.return_value.one.return_value = (1, BASE_TIME, 0, None, 0, None)
+        assert await cache.snapshot(async_db_session) is not first
+
+    @pytest.mark.asyncio
+    async def test_commit_touching_a_catalog_invalidates(self, async_db_session):
+        """Test that the after_commit hook makes the process-wide snapshot reload."""
+        async_db_session.execute.return_value.one.return_value = EMPTY_FINGERPRINT_ROW
+        async_db_session.execute.return_value.all.return_value = []
+        cache = get_catalog_cache()
+        cache.replace(_snapshot())
+        session = SimpleNamespace(info={CATALOGS_CHANGED_KEY: True})
+
+        _invalidate_changed_catalogs(session)
+
+        assert session.info == {}
+        assert (await cache.snapshot(async_db_session)).fingerprint == ((0, None), (0, None), (0, None))
+
+
+class TestCachedCatalogServiceUnit:
+    """Unit tests for catalog services reading from the snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_reads_come_from_the_snapshot(self, async_db_session):
+        """Test that a service with a catalog cache does not query the database."""
+        specialty = _entry(1, category="clinical")
+        cache = CatalogCache(check_interval_seconds=60)
+        cache.replace(_snapshot(specialties=(specialty,)))
+        service = AsyncSpecialtyService(async_db_session, catalog=cache)
+
+        assert await service.get_specialty(str(specialty.id)) is specialty
+        assert await service.get_specialties_by_category("clinical") == [specialty]
+        assert await service.get_specialty("not-an-id") is None
+        async_db_session.execute.assert_not_awaited()
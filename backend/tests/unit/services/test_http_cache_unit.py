@@ -0,0 +1,177 @@
+"""
+Unit tests for HTTP validators and conditional request handling.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException, Response
+from starlette.requests import Request
+
+from app.services.catalog_cache import CATALOG_MODELS, SPECIALTIES, CatalogSnapshot
+from app.utils.http_cache import (
+    catalog_conditional_request,
+    check_if_match,
+    conditional_response,
+    is_not_modified,
+    make_etag,
+    professional_validators,
+    professionals_etag,
+    version_etag,
+)
+
+UPDATED_AT = datetime(2025, 9, 1, 12, 0, 30, 123456, tzinfo=timezone.utc)
+
+
+def _request(method: str = "GET", **headers) -> Request:
+    raw_headers = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": method, "path": "/", "headers": raw_headers})
+
+
+def _catalog_snapshot(specialty_count: int = 2) -> CatalogSnapshot:
+    fingerprint = ((specialty_count, UPDATED_AT), (0, None), (0, None))
+    return CatalogSnapshot(1, fingerprint, {catalog: () for catalog in CATALOG_MODELS})
+
+
+def _professional(updated_at=UPDATED_AT, modalities=()) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.UUID(int=1),
+        updated_at=updated_at,
+        professional_specialties=[],
+        professional_modalities=list(modalities),
+    )
+
+
+class TestProfessionalValidatorsUnit:
+    """Unit tests for ETag / Last-Modified derivation."""
+
+    def test_etag_is_strong_and_stable(self):
+        """Test that equal versions give the same quoted ETag."""
+        etag, last_modified = professional_validators(_professional())
+
+        assert etag == professional_validators(_professional())[0]
+        assert etag.startswith('"') and not etag.startswith("W/")
+        assert last_modified == UPDATED_AT
+
+    def test_etag_changes_with_related_rows(self):
+        """Test that a modality change alters the ETag and Last-Modified."""
+        later = UPDATED_AT + timedelta(minutes=5)
+        modality = SimpleNamespace(id=uuid.UUID(int=2), updated_at=later, is_active=True)
+
+        etag, last_modified = professional_validators(_professional(modalities=[modality]))
+
+        assert etag != professional_validators(_professional())[0]
+        assert last_modified == later
+
+    def test_empty_list(self):
+        """Test that an empty page still has an ETag."""
+        assert professionals_etag([]) == make_etag([])
+
+    def test_list_etag_changes_when_a_row_leaves(self):
+        """Test that a page whose remaining rows are unchanged still gets a new ETag."""
+        staying = _professional()
+        leaving = SimpleNamespace(**{**vars(_professional()), "id": uuid.UUID(int=3)})
+
+        assert professionals_etag([staying]) != professionals_etag([staying, leaving])
+
+
+class TestConditionalRequestsUnit:
+    """Unit tests for If-None-Match / If-Modified-Since evaluation."""
+
+    def test_if_none_match(self):
+        """Test strong, weak, listed and wildcard ETag matches."""
+        etag = make_etag(["v1"])
+
+        assert is_not_modified(_request(if_none_match=etag), etag)
+        assert is_not_modified(_request(if_none_match=f'"other", W/{etag}'), etag)
+        assert is_not_modified(_request(if_none_match="*"), etag)
+        assert not is_not_modified(_request(if_none_match='"other"'), etag)
+
+    def test_if_modified_since(self):
+        """Test second-precision date comparison, ignored when If-None-Match is present."""
+        etag = make_etag(["v1"])
+        http_date = "Mon, 01 Sep 2025 12:00:30 GMT"
+
+        assert is_not_modified(_request(if_modified_since=http_date), etag, UPDATED_AT)
+        assert not is_not_modified(_request(if_modified_since="Mon, 01 Sep 2025 12:00:29 GMT"), etag, UPDATED_AT)
+        assert not is_not_modified(_request(if_modified_since="garbage"), etag, UPDATED_AT)
+        assert not is_not_modified(_request(if_none_match='"other"', if_modified_since=http_date), etag, UPDATED_AT)
+
+    def test_conditional_response(self):
+        """Test that a 304 carries the validators and a 200 gets them set."""
+        etag = make_etag(["v1"])
+
+        not_modified = conditional_response(_request(if_none_match=etag), Response(), etag, UPDATED_AT)
+        response = Response()
+        fresh = conditional_response(_request(), response, etag, UPDATED_AT)
+
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == etag
+        assert not_modified.headers["last-modified"] == "Mon, 01 Sep 2025 12:00:30 GMT"
+        assert fresh is None
+        assert response.headers["etag"] == etag
+
+
+class TestIfMatchUnit:
+    """Unit tests for If-Match preconditions on profile updates."""
+
+    def test_version_etag(self):
+        """Test that the ETag changes with the version."""
+        profile = SimpleNamespace(id=uuid.UUID(int=1), version=1)
+
+        assert version_etag(profile) == version_etag(SimpleNamespace(id=profile.id, version=1))
+        assert version_etag(profile) != version_etag(SimpleNamespace(id=profile.id, version=2))
+
+    def test_matching_or_missing_precondition_passes(self):
+        """Test that no header, the wildcard and a listed current ETag pass."""
+        etag = version_etag(SimpleNamespace(id=uuid.UUID(int=1), version=3))
+
+        check_if_match(_request("PUT"), etag)
+        check_if_match(_request("PUT", if_match="*"), etag)
+        check_if_match(_request("PUT", if_match=f'"other", {etag}'), etag)
+
+    @pytest.mark.parametrize("if_match", ['"other"', "W/{etag}"])
+    def test_other_version_fails(self, if_match):
+        """Test that another version, or a weak ETag (strong comparison), fails with 412."""
+        etag = version_etag(SimpleNamespace(id=uuid.UUID(int=1), version=3))
+
+        with pytest.raises(HTTPException) as exc_info:
+            check_if_match(_request("PUT", if_match=if_match.format(etag=etag)), etag)
+
+        assert exc_info.value.status_code == 412
+        assert exc_info.value.headers["ETag"] == etag
+
+
+class TestCatalogConditionalRequestUnit:
+    """Unit tests for the catalog routers' conditional request dependency."""
+
+    @pytest.mark.asyncio
+    async def test_sets_precomputed_validators(self):
+        """Test that GET responses carry the snapshot's validators and a max-age."""
+        snapshot = _catalog_snapshot()
+        response = Response()
+
+        await catalog_conditional_request(SPECIALTIES)(_request(), response, snapshot)
+
+        assert response.headers["etag"] == snapshot.validators[SPECIALTIES][0]
+        assert "max-age=" in response.headers["cache-control"]
+        # A deleted row changes the ETag even if the latest update does not
+        assert _catalog_snapshot(specialty_count=1).validators[SPECIALTIES][0] != response.headers["etag"]
+
+    @pytest.mark.asyncio
+    async def test_current_copy_is_not_modified(self):
+        """Test that a matching If-None-Match ends the request with a 304, and writes are left alone."""
+        snapshot = _catalog_snapshot()
+        etag = snapshot.validators[SPECIALTIES][0]
+        dependency = catalog_conditional_request(SPECIALTIES)
+
+        with pytest.raises(HTTPException) as raised:
+            await dependency(_request(if_none_match=etag), Response(), snapshot)
+        assert raised.value.status_code == 304
+        assert raised.value.headers["ETag"] == etag
+
+        response = Response()
+        await dependency(_request("POST", if_none_match=etag), response, snapshot)
+        assert "etag" not in response.headers
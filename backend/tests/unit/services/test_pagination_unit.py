@@ -0,0 +1,85 @@
+"""
+Unit tests for keyset pagination utilities - no database connection.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.specialty import Specialty
+from app.utils.pagination import Cursor, decode_cursor, encode_cursor, get_cursor, next_cursor, paginate
+
+
+class TestCursorEncodingUnit:
+    """Unit tests for cursor encoding and decoding."""
+
+    def test_round_trip(self):
+        """Test that a decoded cursor matches the encoded keyset."""
+        created_at = datetime(2025, 9, 1, 12, 30, tzinfo=timezone.utc)
+        row_id = uuid.uuid4()
+
+        token = encode_cursor(created_at, row_id)
+
+        assert "=" not in token
+        assert decode_cursor(token) == Cursor(created_at, row_id)
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "WyJub3QtYS1kYXRlIiwiMSJd"])
+    def test_decode_invalid(self, token):
+        """Test that malformed tokens raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(token)
+
+    def test_get_cursor_invalid_returns_400(self):
+        """Test that the dependency maps malformed tokens to a 400."""
+        with pytest.raises(HTTPException) as exc_info:
+            get_cursor("garbage")
+
+        assert exc_info.value.status_code == 400
+
+    def test_get_cursor_absent(self):
+        """Test that no cursor means offset pagination."""
+        assert get_cursor(None) is None
+
+
+class TestPaginateUnit:
+    """Unit tests for query pagination."""
+
+    def _sql(self, query) -> str:
+        return str(query.compile(dialect=postgresql.dialect()))
+
+    def test_offset_pagination(self):
+        """Test that skip is applied when no cursor is given."""
+        sql = self._sql(paginate(select(Specialty), Specialty, skip=20, limit=10))
+
+        assert "ORDER BY specialties.created_at, specialties.id" in sql
+        assert "OFFSET" in sql
+        assert "LIMIT" in sql
+
+    def test_cursor_pagination_ignores_skip(self):
+        """Test that a cursor replaces the offset with a row comparison."""
+        cursor = Cursor(datetime.now(timezone.utc), uuid.uuid4())
+
+        sql = self._sql(paginate(select(Specialty), Specialty, skip=20, limit=10, cursor=cursor))
+
+        assert "(specialties.created_at, specialties.id) >" in sql
+        assert "OFFSET" not in sql
+
+    def test_next_cursor_full_page(self):
+        """Test that a full page yields a cursor for its last row."""
+        rows = [SimpleNamespace(created_at=datetime.now(timezone.utc), id=uuid.uuid4()) for _ in range(2)]
+
+        token = next_cursor(rows, limit=2)
+
+        assert decode_cursor(token) == Cursor(rows[-1].created_at, rows[-1].id)
+
+    def test_next_cursor_last_page(self):
+        """Test that a short page or an unlimited listing has no next cursor."""
+        rows = [SimpleNamespace(created_at=datetime.now(timezone.utc), id=uuid.uuid4())]
+
+        assert next_cursor(rows, limit=2) is None
+        assert next_cursor(rows, limit=None) is None
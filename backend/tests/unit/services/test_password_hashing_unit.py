@@ -0,0 +1,79 @@
+"""
+Unit tests for the password hashing worker pool and argon2 calibration - no real hashing.
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from app.core.password_calibration import MIN_MEMORY_COST_KIB, calibrate
+from app.core.password_hashing import PasswordHashingBusyError, PasswordHashingPool
+from app.core.security import password_needs_rehash
+
+
+class TestPasswordHashingPoolUnit:
+    """Unit tests for PasswordHashingPool."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self):
+        """Test that jobs run on a pool thread and are counted."""
+        pool = PasswordHashingPool(workers=1, max_queue=0)
+
+        thread_name = await pool.run(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("password-hashing")
+        stats = pool.stats()
+        assert stats.completed == 1
+        assert stats.in_flight == 0
+        assert stats.rejected == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self):
+        """Test that jobs beyond the workers and the queue are rejected at once."""
+        pool = PasswordHashingPool(workers=1, max_queue=1)
+        release = threading.Event()
+        running = asyncio.ensure_future(pool.run(release.wait))
+        queued = asyncio.ensure_future(pool.run(lambda: "queued"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordHashingBusyError):
+            await pool.run(lambda: "rejected")
+
+        release.set()
+        assert await running is True
+        assert await queued == "queued"
+        stats = pool.stats()
+        assert stats.rejected == 1
+        assert stats.peak_in_flight == 2
+        assert stats.completed == 2
+
+
+def _fake_verify_ms(time_cost: int, memory_cost: int, parallelism: int, rounds: int = 5) -> float:
+    # 10 ms per pass over 64 MiB
+    return 10.0 * time_cost * memory_cost / 65536
+
+
+class TestPasswordCalibrationUnit:
+    """Unit tests for the argon2 parameter calibration."""
+
+    def test_raises_time_cost_until_target(self):
+        """Test that the smallest time cost reaching the target is picked."""
+        with patch("app.core.password_calibration.measure_verify_ms", side_effect=_fake_verify_ms):
+            time_cost, memory_cost, verify_ms = calibrate(35, memory_cost=65536, parallelism=4)
+
+        assert (time_cost, memory_cost, verify_ms) == (4, 65536, 40.0)
+
+    def test_halves_memory_when_too_slow(self):
+        """Test that the memory cost is halved when a single pass is already slower than the target."""
+        with patch("app.core.password_calibration.measure_verify_ms", side_effect=_fake_verify_ms):
+            time_cost, memory_cost, _verify_ms = calibrate(3, memory_cost=65536, parallelism=4)
+
+        assert time_cost == 1
+        assert memory_cost == 32768
+        assert memory_cost >= MIN_MEMORY_COST_KIB
+
+    def test_invalid_hash_needs_no_rehash(self):
+        """Test that a value which is not an argon2 hash is not flagged for rehash."""
+        assert password_needs_rehash("not-an-argon2-hash") is False
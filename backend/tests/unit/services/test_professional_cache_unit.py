@@ -0,0 +1,177 @@
+"""
+Unit tests for the professional response cache - fully mocked, no database or Redis connection.
+"""
+
+import threading
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from starlette.requests import Request
+
+from app.core.cache import InMemoryCacheBackend, RedisCacheBackend
+from app.services.professional_cache import (
+    CachedResponse,
+    ProfessionalResponseCache,
+    build_cache_backend,
+)
+from app.services.professional_changes import publish_professional_changes
+
+
+class DictRedisClient:
+    """Local stand-in for a Redis client, ignoring expiry."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, b"0")) + 1).encode()
+        return int(self.data[key])
+
+
+def _request(headers=None) -> Request:
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    backend = InMemoryCacheBackend(max_entries=8) if request.param == "memory" else RedisCacheBackend(DictRedisClient())
+    return ProfessionalResponseCache(backend, ttl_seconds=60)
+
+
+class TestInMemoryCacheBackendUnit:
+    """Unit tests for InMemoryCacheBackend."""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        backend = InMemoryCacheBackend(max_entries=2)
+        backend.set("a", b"1", 60)
+        backend.set("b", b"2", 60)
+        backend.get("a")
+        backend.set("c", b"3", 60)
+
+        assert backend.get("a") == b"1"
+        assert backend.get("b") is None
+        assert backend.get("c") == b"3"
+
+    def test_expiry(self):
+        """Test that expired entries are not returned."""
+        backend = InMemoryCacheBackend()
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            backend.set("a", b"1", 10)
+        with patch("app.core.cache.time.monotonic", return_value=111.0):
+            assert backend.get("a") is None
+
+    def test_counters_are_not_evicted(self):
+        """Test that counters survive eviction and read back like Redis counters."""
+        backend = InMemoryCacheBackend(max_entries=1)
+        assert backend.incr("version") == 1
+        backend.set("a", b"1", 60)
+        backend.set("b", b"2", 60)
+
+        assert backend.incr("version") == 2
+        assert backend.get("version") == b"2"
+
+
+class TestProfessionalResponseCacheUnit:
+    """Unit tests for ProfessionalResponseCache."""
+
+    def test_round_trip(self, cache):
+        """Test that a stored entry is returned unchanged."""
+        entry = CachedResponse(b'{"id": 1}', {"ETag": '"abc"'})
+        key = cache.detail_key(uuid.uuid4())
+        cache.set(key, entry)
+
+        assert cache.get(key) == entry
+
+    @pytest.mark.asyncio
+    async def test_async_round_trip(self, cache):
+        """Test that the request path methods find what they stored, and nothing after invalidation."""
+        professional_id = uuid.uuid4()
+        entry = CachedResponse(b'{"id": 1}', {"ETag": '"abc"'})
+        key, cached = await cache.cached_detail(professional_id)
+        assert cached is None
+
+        await cache.store(key, entry)
+
+        assert await cache.cached_detail(professional_id) == (key, entry)
+        cache.invalidate({professional_id})
+        assert (await cache.cached_detail(professional_id))[1] is None
+        assert (await cache.cached_list([("limit", "10")]))[1] is None
+
+    @pytest.mark.asyncio
+    async def test_blocking_backend_runs_off_the_event_loop(self):
+        """Test that a network backend is called from a worker thread."""
+        client = DictRedisClient()
+        calling_threads = []
+        original_get = client.get
+
+        def get(key):
+            calling_threads.append(threading.current_thread())
+            return original_get(key)
+
+        client.get = get
+        cache = ProfessionalResponseCache(RedisCacheBackend(client))
+
+        await cache.cached_list([("limit", "10")])
+
+        assert calling_threads
+        assert threading.current_thread() not in calling_threads
+
+    def test_invalidate_changes_keys(self, cache):
+        """Test that invalidation moves the changed detail and every listing to new keys."""
+        changed, other = uuid.uuid4(), uuid.uuid4()
+        detail_key, other_key = cache.detail_key(changed), cache.detail_key(other)
+        list_key = cache.list_key([("limit", "10")])
+
+        cache.invalidate({changed})
+
+        assert cache.detail_key(changed) != detail_key
+        assert cache.detail_key(other) == other_key
+        assert cache.list_key([("limit", "10")]) != list_key
+
+    def test_list_key_ignores_parameter_order(self, cache):
+        """Test that equivalent query strings share a key."""
+        assert cache.list_key([("a", "1"), ("b", "2")]) == cache.list_key([("b", "2"), ("a", "1")])
+
+    def test_to_response_honours_validators(self):
+        """Test that a cached entry answers a matching If-None-Match with 304."""
+        entry = CachedResponse(b"[]", {"ETag": '"abc"', "Cache-Control": "public, no-cache"})
+
+        assert entry.to_response(_request({"If-None-Match": '"abc"'})).status_code == 304
+        fresh = entry.to_response(_request())
+        assert fresh.status_code == 200
+        assert fresh.body == b"[]"
+        assert fresh.headers["etag"] == '"abc"'
+
+    def test_build_cache_backend(self):
+        """Test backend selection from settings."""
+        assert build_cache_backend("none", 10, "") is None
+        assert isinstance(build_cache_backend("memory", 10, ""), InMemoryCacheBackend)
+        with pytest.raises(ValueError):
+            build_cache_backend("memcached", 10, "")
+
+
+class TestProfessionalChangesUnit:
+    """Unit tests for change notifications."""
+
+    def test_publish_notifies_subscribers(self):
+        """Test that IDs are normalized and a failing subscriber does not stop the others."""
+        professional_id = uuid.uuid4()
+        failing, subscriber = MagicMock(side_effect=RuntimeError("down")), MagicMock()
+
+        with patch("app.services.professional_changes._subscribers", [failing, subscriber]):
+            publish_professional_changes([str(professional_id), None])
+
+        subscriber.assert_called_once_with({professional_id})
@@ -0,0 +1,52 @@
+"""
+Unit tests for the professional card projection - fully mocked, no database connection.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.professional_card_service import AsyncProfessionalCardService, professional_card_query
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestProfessionalCardQueryUnit:
+    """Unit tests for professional_card_query."""
+
+    def test_selects_only_card_columns(self):
+        """Test that long text columns are not read."""
+        sql = _sql(professional_card_query())
+
+        assert "professionals.full_name" in sql
+        assert "professionals.bio" not in sql
+        assert "professionals.certifications" not in sql
+
+    def test_resolves_names_in_the_same_statement(self):
+        """Test that specialties and modalities are aggregated in subqueries, not loaded separately."""
+        sql = _sql(professional_card_query())
+
+        assert "WITH ORDINALITY" in sql
+        assert "json_agg" in sql
+        assert "LATERAL" in sql
+        assert "least(" in sql
+
+
+class TestAsyncProfessionalCardServiceUnit:
+    """Unit tests for AsyncProfessionalCardService."""
+
+    @pytest.mark.asyncio
+    async def test_get_cards_single_statement(self, async_db_session):
+        """Test that a page of cards is read with one statement."""
+        row = MagicMock()
+        async_db_session.execute.return_value.all.return_value = [row]
+
+        cards = await AsyncProfessionalCardService(async_db_session).get_cards(limit=500)
+
+        assert cards == [row]
+        async_db_session.execute.assert_awaited_once()
+        statement = async_db_session.execute.await_args.args[0]
+        assert "LIMIT" in _sql(statement)
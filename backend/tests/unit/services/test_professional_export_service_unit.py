@@ -0,0 +1,101 @@
+"""
+Unit tests for the professional directory export - fully mocked, no database connection.
+"""
+
+from collections import namedtuple
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+from asyncpg.pgproto.pgproto import UUID as AsyncpgUUID
+from sqlalchemy.dialects import postgresql
+
+from app.services.professional_export_service import (
+    AsyncProfessionalExportService,
+    csv_chunk,
+    ndjson_chunk,
+    professional_export_query,
+)
+
+ExportRow = namedtuple("ExportRow", ["id", "full_name", "specialties", "license_number"])
+
+ANA_ID = "6f1c2b9e-3d4a-4e5f-8a7b-1c2d3e4f5a6b"
+LUIS_ID = "0a9b8c7d-6e5f-4a3b-9c2d-1e0f9a8b7c6d"
+
+
+def _rows():
+    # IDs come back from asyncpg as its own UUID type
+    return [
+        ExportRow(AsyncpgUUID(ANA_ID), "Ana", ["Ansiedad", "Pareja"], None),
+        ExportRow(AsyncpgUUID(LUIS_ID), "Luis, Jr.", None, "LIC-2"),
+    ]
+
+
+def _stream_result(partitions):
+    async def iterate(*_args):
+        for rows in partitions:
+            yield rows
+
+    result = MagicMock()
+    result.keys.return_value = list(ExportRow._fields)
+    result.partitions = iterate
+    return result
+
+
+class TestProfessionalExportQueryUnit:
+    """Unit tests for professional_export_query."""
+
+    def test_resolves_names_in_the_same_statement(self):
+        """Test that catalog names are aggregated in subqueries and long texts are not read."""
+        sql = str(professional_export_query().compile(dialect=postgresql.dialect()))
+
+        assert "WITH ORDINALITY" in sql
+        assert "array_agg" in sql
+        assert "professionals.bio" not in sql
+        assert "ORDER BY professionals.created_at, professionals.id" in sql
+
+
+class TestExportEncodingUnit:
+    """Unit tests for the NDJSON and CSV encoders."""
+
+    def test_ndjson_chunk(self):
+        """Test that each row is one JSON document on its own line."""
+        lines = ndjson_chunk(_rows()).splitlines()
+
+        assert [orjson.loads(line)["id"] for line in lines] == [ANA_ID, LUIS_ID]
+        assert [orjson.loads(line)["full_name"] for line in lines] == ["Ana", "Luis, Jr."]
+        assert orjson.loads(lines[0])["specialties"] == ["Ansiedad", "Pareja"]
+
+    def test_csv_chunk(self):
+        """Test that lists are joined, NULLs are empty and values are quoted as needed."""
+        lines = csv_chunk(_rows(), list(ExportRow._fields)).decode().splitlines()
+
+        assert lines == [
+            "id,full_name,specialties,license_number",
+            f"{ANA_ID},Ana,Ansiedad; Pareja,",
+            f'{LUIS_ID},"Luis, Jr.",,LIC-2',
+        ]
+
+
+class TestAsyncProfessionalExportServiceUnit:
+    """Unit tests for AsyncProfessionalExportService."""
+
+    @pytest.mark.asyncio
+    async def test_export_streams_partitions(self, async_db_session):
+        """Test that rows are streamed with yield_per and encoded one partition at a time."""
+        async_db_session.stream = AsyncMock(return_value=_stream_result([_rows()[:1], _rows()[1:]]))
+
+        chunks = [chunk async for chunk in AsyncProfessionalExportService(async_db_session).export("ndjson")]
+
+        assert len(chunks) == 2
+        statement = async_db_session.stream.await_args.args[0]
+        assert statement.get_execution_options()["yield_per"] > 0
+
+    @pytest.mark.asyncio
+    async def test_csv_export_sends_header_without_rows(self, async_db_session):
+        """Test that a CSV export always starts with the header line."""
+        async_db_session.stream = AsyncMock(return_value=_stream_result([]))
+
+        chunks = [chunk async for chunk in AsyncProfessionalExportService(async_db_session).export("csv")]
+
+        assert chunks == [b"id,full_name,specialties,license_number\r\n"]
@@ -0,0 +1,118 @@
+"""
+Unit tests for professional serialization and sparse fieldsets - fully mocked, no database connection.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.professional import Professional
+from app.schemas.professional import ProfessionalResponse
+from app.services.professional_service import professional_field_loaders
+from app.utils.http_cache import professional_validators
+from app.utils.parsers import parse_professional_data, professional_json, professionals_json
+
+UPDATED_AT = datetime(2025, 9, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _sql(fields) -> str:
+    statement = select(Professional).options(*professional_field_loaders(fields))
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _professional(**attributes) -> SimpleNamespace:
+    # Only what a sparse fieldset loads: reading anything else fails
+    return SimpleNamespace(id=uuid.UUID(int=1), updated_at=UPDATED_AT, **attributes)
+
+
+class TestProfessionalFieldLoadersUnit:
+    """Unit tests for professional_field_loaders."""
+
+    def test_only_requested_columns_are_selected(self):
+        """Test that unrequested columns, such as the long texts, are not selected."""
+        sql = _sql(frozenset({"id", "full_name", "rate_cents"}))
+
+        assert "professionals.full_name" in sql
+        assert "professionals.rate_cents" in sql
+        # Keyset and validator columns are always selected
+        assert "professionals.created_at" in sql
+        assert "professionals.updated_at" in sql
+        assert "professionals.bio" not in sql
+        assert "professionals.certifications" not in sql
+
+    def test_without_fields_selects_everything(self):
+        """Test that no fieldset loads every column."""
+        assert "professionals.bio" in _sql(None)
+
+
+class TestSparseSerializationUnit:
+    """Unit tests for serializing and validating sparse fieldsets."""
+
+    def test_parse_requested_fields(self):
+        """Test that only requested fields are read, in the usual order."""
+        professional = _professional(full_name="Ana", professional_modalities=[])
+
+        data = parse_professional_data(professional, frozenset({"modalities", "full_name", "id"}))
+
+        assert list(data) == ["id", "full_name", "modalities"]
+        assert data["modalities"] == []
+
+    def test_validators_skip_unloaded_relationships(self):
+        """Test that validators only read what the fieldset loaded and vary with the fieldset."""
+        professional = _professional()
+
+        name_etag, last_modified = professional_validators(professional, frozenset({"id", "full_name"}))
+        rate_etag, _ = professional_validators(professional, frozenset({"id", "rate_cents"}))
+
+        assert name_etag != rate_etag
+        assert last_modified == UPDATED_AT
+
+
+class TestProfessionalJsonUnit:
+    """Unit tests for the precompiled professional serializers."""
+
+    def test_full_professional(self):
+        """Test that a professional is serialized with every response field."""
+        professional = _professional(
+            email="ana@example.com",
+            full_name="Ana",
+            phone_country_code=None,
+            phone_number=None,
+            license_number=None,
+            years_experience=3,
+            rate_cents=90000,
+            currency="COP",
+            professional_specialties=[],
+            bio=None,
+            academic_experience=None,
+            work_experience=[{"company": "Clínica"}],
+            certifications=None,
+            languages=["es"],
+            therapy_approaches_ids=None,
+            specialty_ids=None,
+            professional_modalities=[],
+            timezone="America/Bogota",
+            working_hours=None,
+            profile_picture=None,
+            is_active=True,
+            is_verified=False,
+            created_at=UPDATED_AT,
+        )
+
+        data = orjson.loads(professional_json(professional))
+
+        assert set(data) == set(ProfessionalResponse.model_fields)
+        assert data["work_experience"] == [{"company": "Clínica"}]
+        assert data["academic_experience"] == []
+
+    def test_sparse_page(self):
+        """Test that a sparse fieldset only carries the requested fields."""
+        professional = _professional(full_name="Ana")
+
+        data = orjson.loads(professionals_json([professional], frozenset({"id", "full_name"})))
+
+        assert data == [{"id": str(professional.id), "full_name": "Ana"}]
@@ -0,0 +1,185 @@
+"""
+Unit tests for the in-process professional index - fully mocked, no database connection.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+
+from app.schemas.professional import ProfessionalSearchFilters
+from app.services.professional_index import ProfessionalIndex, iter_positions
+from app.services.professional_search_service import AsyncProfessionalSearchService
+from app.utils.pagination import Cursor
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+ONLINE = uuid.uuid4()
+IN_PERSON = uuid.uuid4()
+
+
+def _professional(index: int, specialty_ids=(), languages=(), is_verified=False) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.UUID(int=index + 1),
+        created_at=BASE_TIME + timedelta(days=index),
+        is_verified=is_verified,
+        specialty_ids=list(specialty_ids),
+        therapy_approaches_ids=None,
+        languages=list(languages),
+    )
+
+
+def _results(professionals, modalities) -> list:
+    """Results for the two statements issued per load: modalities first, then professionals."""
+    modality_result, professional_result = MagicMock(), MagicMock()
+    modality_result.all.return_value = modalities
+    professional_result.all.return_value = professionals
+    return [modality_result, professional_result]
+
+
+@pytest.fixture
+def professionals():
+    return [
+        _professional(0, specialty_ids=["anxiety"], languages=["es"], is_verified=True),
+        _professional(1, specialty_ids=["anxiety", "couples"], languages=["es", "en"]),
+        _professional(2, specialty_ids=["couples"], languages=["en"], is_verified=True),
+    ]
+
+
+@pytest.fixture
+def modalities(professionals):
+    # (professional_id, modality_id, virtual_price, presencial_price, offers_presencial)
+    return [
+        (professionals[0].id, ONLINE, 40000, 0, False),
+        (professionals[1].id, ONLINE, 80000, 0, False),
+        (professionals[2].id, IN_PERSON, 95000, 120000, True),
+    ]
+
+
+@pytest_asyncio.fixture
+async def index(async_db_session, professionals, modalities):
+    async_db_session.execute.side_effect = _results(professionals, modalities)
+    professional_index = ProfessionalIndex()
+    await professional_index.ensure_fresh(async_db_session)
+    return professional_index
+
+
+class TestProfessionalIndexUnit:
+    """Unit tests for ProfessionalIndex."""
+
+    def test_iter_positions(self):
+        """Test that set bits are yielded in increasing order."""
+        assert list(iter_positions(0b101001)) == [0, 3, 5]
+
+    @pytest.mark.asyncio
+    async def test_search_without_filters(self, index, professionals):
+        """Test that every professional is returned in keyset order."""
+        result = index.search(ProfessionalSearchFilters())
+
+        assert result.ids == [professional.id for professional in professionals]
+        assert result.total == 3
+
+    @pytest.mark.asyncio
+    async def test_facet_counts_exclude_own_filter(self, index, professionals):
+        """Test disjunctive facet counts, as computed by the SQL facet query."""
+        result = index.search(ProfessionalSearchFilters(specialty_ids=["anxiety"], languages=["en"]))
+
+        assert result.ids == [professionals[1].id]
+        counts = {item.value: item.count for item in result.facets.specialty_ids}
+        # Specialty counts ignore the specialty filter but keep the language filter
+        assert counts == {"anxiety": 1, "couples": 2}
+        languages = {item.value: item.count for item in result.facets.languages}
+        assert languages == {"es": 2, "en": 1}
+
+    @pytest.mark.asyncio
+    async def test_match_all_and_verified(self, index, professionals):
+        """Test containment semantics and the verified flag."""
+        both = index.search(ProfessionalSearchFilters(specialty_ids=["anxiety", "couples"], specialty_ids_match="all"))
+        verified = index.search(ProfessionalSearchFilters(is_verified=True))
+
+        assert both.ids == [professionals[1].id]
+        assert verified.ids == [professionals[0].id, professionals[2].id]
+
+    @pytest.mark.asyncio
+    async def test_price_range(self, index, professionals):
+        """Test price ranges across whole and edge buckets, including presencial prices."""
+        cheap = index.search(ProfessionalSearchFilters(max_price_cents=50000))
+        presencial = index.search(ProfessionalSearchFilters(min_price_cents=110000, max_price_cents=125000))
+        modality = index.search(ProfessionalSearchFilters(modality_ids=[ONLINE]))
+
+        assert cheap.ids == [professionals[0].id]
+        assert presencial.ids == [professionals[2].id]
+        assert modality.ids == [professionals[0].id, professionals[1].id]
+
+    @pytest.mark.asyncio
+    async def test_pagination(self, index, professionals):
+        """Test skip/limit and cursor pagination."""
+        skipped = index.search(ProfessionalSearchFilters(), skip=1, limit=1)
+        after_first = index.search(
+            ProfessionalSearchFilters(), cursor=Cursor(professionals[0].created_at, professionals[0].id)
+        )
+
+        assert skipped.ids == [professionals[1].id]
+        assert skipped.total == 3
+        assert after_first.ids == [professionals[1].id, professionals[2].id]
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh(self, index, async_db_session, professionals):
+        """Test that dirty professionals are reloaded, removed or appended."""
+        updated = _professional(0, specialty_ids=["couples"], languages=["es"])
+        added = _professional(5, specialty_ids=["anxiety"])
+        # professionals[1] was deactivated: no longer returned by the load
+        async_db_session.execute.side_effect = _results([updated, added], [])
+        index.mark_dirty([str(updated.id), professionals[1].id, added.id])
+
+        await index.ensure_fresh(async_db_session)
+        result = index.search(ProfessionalSearchFilters(specialty_ids=["couples"]))
+
+        assert result.ids == [updated.id, professionals[2].id]
+        assert index.search(ProfessionalSearchFilters(specialty_ids=["anxiety"])).ids == [added.id]
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_insert_rebuilds(self, index, async_db_session, professionals, modalities):
+        """Test that a professional sorting before the last position triggers a rebuild."""
+        early = SimpleNamespace(**{**vars(_professional(-1)), "id": uuid.uuid4()})
+        async_db_session.execute.side_effect = [
+            *_results([early], []),
+            *_results([early, *professionals], modalities),
+        ]
+        index.mark_dirty([early.id])
+
+        await index.ensure_fresh(async_db_session)
+
+        assert index.search(ProfessionalSearchFilters()).ids[0] == early.id
+
+
+class TestAsyncProfessionalSearchServiceIndexUnit:
+    """Unit tests for the index path of AsyncProfessionalSearchService."""
+
+    @pytest.mark.asyncio
+    async def test_search_uses_index(self, async_db_session, index, professionals):
+        """Test that only the page rows are read from the database."""
+        async_db_session.execute.reset_mock(side_effect=True)
+        async_db_session.execute.return_value.scalars.return_value.all.return_value = professionals[:1]
+        service = AsyncProfessionalSearchService(async_db_session, index=index)
+
+        result = await service.search(ProfessionalSearchFilters(specialty_ids=["anxiety"]), limit=1)
+
+        assert result.items == professionals[:1]
+        assert result.total == 2
+        async_db_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_text_search_falls_back_to_sql(self, async_db_session):
+        """Test that free text bypasses the index."""
+        index = MagicMock(spec=ProfessionalIndex)
+        index.supports.return_value = False
+        index.ensure_fresh = AsyncMock()
+        service = AsyncProfessionalSearchService(async_db_session, index=index)
+
+        await service.search(ProfessionalSearchFilters(text="ansiedad"), limit=10)
+
+        index.ensure_fresh.assert_not_awaited()
+        assert async_db_session.execute.await_count == 2
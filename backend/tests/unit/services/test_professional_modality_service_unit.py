@@ -3,7 +3,8 @@ Unit tests for ProfessionalModalityService.
 """
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 from app.services.professional_modality_service import ProfessionalModalityService
@@ -11,6 +12,10 @@ from app.models.professional_modality import ProfessionalModality
 from app.schemas.professional_modality import ProfessionalModalityCreate, ProfessionalModalityUpdate
 
 
+def _sql(call) -> str:
+    return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+
 class TestProfessionalModalityServiceUnit:
     """Unit tests for ProfessionalModalityService."""
 
@@ -151,14 +156,6 @@ class TestProfessionalModalityServiceUnit:
         mock_db.commit = Mock()
         mock_db.refresh = Mock()
 
-        # Mock the query for removing default flag from other modalities
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_update = Mock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.update.return_value = mock_update
-        mock_db.query.return_value = mock_query
-
         # Mock the ProfessionalModality constructor to avoid schema/model mismatch
         with pytest.MonkeyPatch().context() as m:
             m.setattr(ProfessionalModality, "__init__", lambda self, **kwargs: None)
@@ -169,6 +166,11 @@ class TestProfessionalModalityServiceUnit:
             # Assert
             assert result is not None
             mock_db.add.assert_called_once()
+            # Inserted first, then made the default by one switch statement
+            mock_db.flush.assert_called_once()
+            (switch_call,) = mock_db.execute.call_args_list
+            assert _sql(switch_call).startswith("UPDATE professional_modalities SET is_default=")
+            mock_db.query.assert_not_called()
             mock_db.commit.assert_called_once()
             mock_db.refresh.assert_called_once()
 
@@ -201,6 +203,7 @@ class TestProfessionalModalityServiceUnit:
             # Assert
             assert result is not None
             mock_db.add.assert_called_once()
+            mock_db.execute.assert_not_called()
             mock_db.commit.assert_called_once()
             mock_db.refresh.assert_called_once()
 
@@ -215,26 +218,22 @@ class TestProfessionalModalityServiceUnit:
         # Mock get_professional_modality to return our sample modality
         professional_modality_service.get_professional_modality = Mock(return_value=sample_professional_modality)
 
-        # Mock the query for removing default flag from other modalities
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_update = Mock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.update.return_value = mock_update
-        mock_db.query.return_value = mock_query
-
         mock_db.commit = Mock()
         mock_db.refresh = Mock()
 
         # Act
-        result = professional_modality_service.update_professional_modality(modality_id, update_data)
+        with patch("app.services.professional_modality_service.publish_professional_changes") as mock_publish:
+            result = professional_modality_service.update_professional_modality(modality_id, update_data)
 
         # Assert
         assert result == sample_professional_modality
         assert sample_professional_modality.is_default is True
         assert sample_professional_modality.is_active is False
+        mock_db.execute.assert_called_once()
         mock_db.commit.assert_called_once()
         mock_db.refresh.assert_called_once()
+        # The switch bypasses the session hooks
+        mock_publish.assert_called_once_with(["test-professional-1"])
 
     def test_update_professional_modality_not_found(self, professional_modality_service, mock_db):
         """Test updating a professional modality that doesn't exist."""
@@ -289,7 +288,7 @@ class TestProfessionalModalityServiceUnit:
         mock_query = Mock()
         mock_filter = Mock()
         mock_query.filter.return_value = mock_filter
-        mock_filter.all.return_value = [Mock(spec=ProfessionalModality)]  # Other modality exists
+        mock_filter.first.return_value = Mock(spec=ProfessionalModality)  # Other modality exists
         mock_db.query.return_value = mock_query
 
         mock_db.delete = Mock()
@@ -300,8 +299,10 @@ class TestProfessionalModalityServiceUnit:
 
         # Assert
         assert result is True
+        # The default moves to the other modality in one statement, in the same transaction
+        mock_db.execute.assert_called_once()
         mock_db.delete.assert_called_once_with(sample_professional_modality)
-        mock_db.commit.assert_called()
+        mock_db.commit.assert_called_once()
 
     def test_delete_professional_modality_not_found(self, professional_modality_service, mock_db):
         """Test deleting a professional modality that doesn't exist."""
@@ -333,7 +334,7 @@ class TestProfessionalModalityServiceUnit:
         mock_query = Mock()
         mock_filter = Mock()
         mock_query.filter.return_value = mock_filter
-        mock_filter.all.return_value = []  # No other modalities
+        mock_filter.first.return_value = None  # No other modalities
         mock_db.query.return_value = mock_query
 
         mock_db.delete = Mock()
@@ -344,73 +345,49 @@ class TestProfessionalModalityServiceUnit:
 
         # Assert
         assert result is True
+        mock_db.execute.assert_not_called()
         mock_db.delete.assert_called_once_with(sample_professional_modality)
         mock_db.commit.assert_called()
 
     def test_set_default_modality_success(self, professional_modality_service, mock_db):
-        """Test setting a modality as default successfully."""
+        """Test that the default is switched by a single statement."""
         # Arrange
         professional_id = "test-professional-1"
         modality_id = "test-modality-1"
-
-        # Mock the query for removing default flag from all modalities
-        mock_query1 = Mock()
-        mock_filter1 = Mock()
-        mock_update1 = Mock()
-        mock_query1.filter.return_value = mock_filter1
-        mock_filter1.update.return_value = mock_update1
-
-        # Mock the query for setting the specified modality as default
-        mock_query2 = Mock()
-        mock_filter2 = Mock()
-        mock_update2 = Mock()
-        mock_query2.filter.return_value = mock_filter2
-        mock_filter2.update.return_value = mock_update2
-        mock_update2.__gt__ = Mock(return_value=True)  # result > 0
-
-        # Mock db.query to return different mocks for different calls
-        mock_db.query.side_effect = [mock_query1, mock_query2]
+        mock_db.execute.return_value.rowcount = 2  # Previous default cleared, new one set
         mock_db.commit = Mock()
 
         # Act
-        result = professional_modality_service.set_default_modality(professional_id, modality_id)
+        with patch("app.services.professional_modality_service.publish_professional_changes") as mock_publish:
+            result = professional_modality_service.set_default_modality(professional_id, modality_id)
 
         # Assert
         assert result is True
-        assert mock_db.query.call_count == 2
+        mock_publish.assert_called_once_with([professional_id])
+        (switch_call,) = mock_db.execute.call_args_list
+        sql = _sql(switch_call)
+        assert sql.startswith("UPDATE professional_modalities SET is_default=")
+        assert "professional_modalities.is_default OR professional_modalities.id = " in sql
+        assert "EXISTS (SELECT" in sql
+        mock_db.query.assert_not_called()
         mock_db.commit.assert_called_once()
 
     def test_set_default_modality_not_found(self, professional_modality_service, mock_db):
-        """Test setting a modality as default when the modality doesn't exist."""
+        """Test that nothing changes when the modality is not the professional's."""
         # Arrange
         professional_id = "test-professional-1"
         modality_id = "non-existent-modality"
-
-        # Mock the query for removing default flag from all modalities
-        mock_query1 = Mock()
-        mock_filter1 = Mock()
-        mock_update1 = Mock()
-        mock_query1.filter.return_value = mock_filter1
-        mock_filter1.update.return_value = mock_update1
-
-        # Mock the query for setting the specified modality as default (returns 0)
-        mock_query2 = Mock()
-        mock_filter2 = Mock()
-        mock_update2 = Mock()
-        mock_query2.filter.return_value = mock_filter2
-        mock_filter2.update.return_value = mock_update2
-        mock_update2.__gt__ = Mock(return_value=False)  # result > 0 is False
-
-        # Mock db.query to return different mocks for different calls
-        mock_db.query.side_effect = [mock_query1, mock_query2]
+        mock_db.execute.return_value.rowcount = 0
         mock_db.commit = Mock()
 
         # Act
-        result = professional_modality_service.set_default_modality(professional_id, modality_id)
+        with patch("app.services.professional_modality_service.publish_professional_changes") as mock_publish:
+            result = professional_modality_service.set_default_modality(professional_id, modality_id)
 
         # Assert
         assert result is False
-        assert mock_db.query.call_count == 2
+        mock_publish.assert_not_called()
+        mock_db.execute.assert_called_once()
         mock_db.commit.assert_called_once()
 
     def test_professional_modality_service_initialization(self, mock_db):
@@ -0,0 +1,122 @@
+"""
+Unit tests for the faceted professional search service - fully mocked, no database connection.
+"""
+
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.professional import Professional
+from app.schemas.professional import ProfessionalSearchFilters
+from app.services.professional_search_service import (
+    LANGUAGE_FACET,
+    MODALITY_FACET,
+    PRICE_FILTER,
+    SPECIALTY_FACET,
+    TEXT_FILTER,
+    TOTAL_FACET,
+    AsyncProfessionalSearchService,
+    array_criterion,
+    build_facet_query,
+    build_search_criteria,
+)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestBuildSearchCriteriaUnit:
+    """Unit tests for search criteria construction."""
+
+    def test_no_filters(self):
+        """Test that empty filters produce no criteria."""
+        assert build_search_criteria(ProfessionalSearchFilters()) == {}
+
+    def test_criteria_keyed_by_facet(self):
+        """Test that each active filter yields one criterion."""
+        filters = ProfessionalSearchFilters(
+            specialty_ids=["a", "b"],
+            languages=["es"],
+            modality_ids=[uuid.uuid4()],
+            max_price_cents=80000,
+        )
+
+        criteria = build_search_criteria(filters)
+
+        assert set(criteria) == {SPECIALTY_FACET, LANGUAGE_FACET, MODALITY_FACET, PRICE_FILTER}
+        assert "&&" in _sql(criteria[SPECIALTY_FACET])
+        assert "EXISTS" in _sql(criteria[MODALITY_FACET])
+
+    def test_array_criterion_match_modes(self):
+        """Test that "any" uses overlap and "all" uses containment."""
+        assert "professionals.languages && " in _sql(array_criterion(Professional.languages, ["es", "en"]))
+        assert "professionals.languages @> " in _sql(array_criterion(Professional.languages, ["es", "en"], "all"))
+
+    def test_text_criterion_uses_search_vector(self):
+        """Test that free text is matched against the indexed search vector."""
+        criteria = build_search_criteria(ProfessionalSearchFilters(text="terapia de pareja"))
+
+        sql = _sql(criteria[TEXT_FILTER])
+
+        assert "professionals.search_vector @@ websearch_to_tsquery" in sql
+        assert "REGCONFIG" in sql
+
+    def test_facet_query_excludes_own_filter(self):
+        """Test that a facet's counts are not narrowed by its own selection."""
+        criteria = build_search_criteria(ProfessionalSearchFilters(specialty_ids=["a"]))
+
+        sql = _sql(build_facet_query(criteria))
+
+        # Applied to the total and the three other facets, not to the specialty facet
+        assert sql.count("&&") == 4
+        assert "UNION ALL" in sql
+
+    def test_facet_query_keeps_own_filter_when_conjunctive(self):
+        """Test that an "all" facet is counted within its own selection."""
+        filters = ProfessionalSearchFilters(specialty_ids=["a", "b"], specialty_ids_match="all")
+        criteria = build_search_criteria(filters)
+
+        sql = _sql(build_facet_query(criteria, conjunctive=[SPECIALTY_FACET]))
+
+        assert sql.count("@>") == 5
+
+
+class TestAsyncProfessionalSearchServiceUnit:
+    """Unit tests for AsyncProfessionalSearchService."""
+
+    @pytest.mark.asyncio
+    async def test_search_groups_facet_rows(self, async_db_session):
+        """Test that facet rows are grouped, sorted and the total extracted."""
+        professionals = [MagicMock()]
+        page_result = MagicMock()
+        page_result.scalars.return_value.all.return_value = professionals
+        facet_result = MagicMock()
+        facet_result.all.return_value = [
+            (TOTAL_FACET, "", 3),
+            (SPECIALTY_FACET, "b", 1),
+            (SPECIALTY_FACET, "a", 2),
+            (LANGUAGE_FACET, None, 1),
+        ]
+        async_db_session.execute.side_effect = [page_result, facet_result]
+        service = AsyncProfessionalSearchService(async_db_session)
+
+        result = await service.search(ProfessionalSearchFilters(), limit=10)
+
+        assert result.items == professionals
+        assert result.total == 3
+        assert [(item.value, item.count) for item in result.facets.specialty_ids] == [("a", 2), ("b", 1)]
+        assert not result.facets.languages
+        assert async_db_session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_with_text_ranks_page(self, async_db_session):
+        """Test that the page query is ordered by text rank when free text is given."""
+        service = AsyncProfessionalSearchService(async_db_session)
+
+        await service.search(ProfessionalSearchFilters(text="ansiedad"), limit=10)
+
+        page_query = async_db_session.execute.await_args_list[0].args[0]
+        assert "ORDER BY ts_rank_cd" in _sql(page_query)
@@ -2,14 +2,32 @@
 Unit tests for ProfessionalSpecialtyService.
 """
 
+import uuid
+
 import pytest
 from unittest.mock import Mock
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 from app.services.professional_specialty_service import ProfessionalSpecialtyService
 from app.models.professional_specialty import ProfessionalSpecialty
 from app.schemas.professional_specialty import ProfessionalSpecialtyCreate, ProfessionalSpecialtyUpdate
 
+PROFESSIONAL_ID = str(uuid.UUID(int=1))
+SPECIALTY_1 = str(uuid.UUID(int=11))
+SPECIALTY_2 = str(uuid.UUID(int=12))
+SPECIALTY_3 = str(uuid.UUID(int=13))
+
+
+def _sql(call) -> str:
+    return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+
+def _bound_values(call) -> list:
+    # Bound values of a statement, whatever the parameter names; generated link IDs are left out
+    params = call.args[0].compile(dialect=postgresql.dialect()).params
+    return sorted((value for value in params.values() if isinstance(value, (str, list))), key=str)
+
 
 class TestProfessionalSpecialtyServiceUnit:
     """Unit tests for ProfessionalSpecialtyService."""
@@ -191,93 +209,70 @@ class TestProfessionalSpecialtyServiceUnit:
         mock_db.commit.assert_not_called()
 
     def test_add_specialties_to_professional_success(self, professional_specialty_service, mock_db):
-        """Test adding multiple specialties to a professional successfully."""
+        """Test that new specialties are written with one bulk insert and no per-row refresh."""
         # Arrange
-        professional_id = "test-professional-1"
-        specialty_ids = ["specialty-1", "specialty-2", "specialty-3"]
-
-        # Mock the query for deleting existing specialties
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.delete = Mock()
-        mock_db.query.return_value = mock_query
-
-        # Mock the database operations
-        mock_db.add = Mock()
-        mock_db.commit = Mock()
-        mock_db.refresh = Mock()
+        specialty_ids = [SPECIALTY_1, SPECIALTY_2, SPECIALTY_1]
+        mock_db.scalars.return_value.all.return_value = []
+        stored = [Mock(spec=ProfessionalSpecialty), Mock(spec=ProfessionalSpecialty)]
+        mock_db.query.return_value.filter.return_value.all.return_value = stored
 
-        # Mock the ProfessionalSpecialty constructor to avoid schema/model mismatch
-        with pytest.MonkeyPatch().context() as m:
-            m.setattr(ProfessionalSpecialty, "__init__", lambda self, **kwargs: None)
-
-            # Act
-            result = professional_specialty_service.add_specialties_to_professional(professional_id, specialty_ids)
+        # Act
+        result = professional_specialty_service.add_specialties_to_professional(PROFESSIONAL_ID, specialty_ids)
 
-            # Assert
-            assert len(result) == 3
-            assert mock_db.add.call_count == 3
-            mock_db.commit.assert_called_once()
-            assert mock_db.refresh.call_count == 3
+        # Assert
+        assert result == stored
+        (insert_call,) = mock_db.execute.call_args_list
+        sql = _sql(insert_call)
+        assert sql.startswith("INSERT INTO professional_specialties")
+        assert "ON CONFLICT (professional_id, specialty_id) DO NOTHING" in sql
+        # Duplicated IDs are inserted once
+        assert _bound_values(insert_call) == sorted([PROFESSIONAL_ID, PROFESSIONAL_ID, SPECIALTY_1, SPECIALTY_2])
+        mock_db.add.assert_not_called()
+        mock_db.refresh.assert_not_called()
+        mock_db.commit.assert_called_once()
 
     def test_add_specialties_to_professional_empty_list(self, professional_specialty_service, mock_db):
-        """Test adding empty list of specialties to a professional."""
+        """Test that an empty list removes the stored specialties with one bulk delete."""
         # Arrange
-        professional_id = "test-professional-1"
-        specialty_ids = []
-
-        # Mock the query for deleting existing specialties
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.delete = Mock()
-        mock_db.query.return_value = mock_query
-
-        # Mock the database operations
-        mock_db.add = Mock()
-        mock_db.commit = Mock()
-        mock_db.refresh = Mock()
+        mock_db.scalars.return_value.all.return_value = [uuid.UUID(SPECIALTY_1)]
+        mock_db.query.return_value.filter.return_value.all.return_value = []
 
         # Act
-        result = professional_specialty_service.add_specialties_to_professional(professional_id, specialty_ids)
+        result = professional_specialty_service.add_specialties_to_professional(PROFESSIONAL_ID, [])
 
         # Assert
         assert len(result) == 0
-        mock_db.add.assert_not_called()
+        (delete_call,) = mock_db.execute.call_args_list
+        assert _sql(delete_call).startswith("DELETE FROM professional_specialties")
         mock_db.commit.assert_called_once()
-        mock_db.refresh.assert_not_called()
 
-    def test_add_specialties_to_professional_single_specialty(self, professional_specialty_service, mock_db):
-        """Test adding a single specialty to a professional."""
+    def test_add_specialties_to_professional_only_writes_the_difference(self, professional_specialty_service, mock_db):
+        """Test that kept specialties are not rewritten: only the difference is written."""
         # Arrange
-        professional_id = "test-professional-1"
-        specialty_ids = ["specialty-1"]
+        mock_db.scalars.return_value.all.return_value = [uuid.UUID(SPECIALTY_1), uuid.UUID(SPECIALTY_2)]
+        mock_db.query.return_value.filter.return_value.all.return_value = []
 
-        # Mock the query for deleting existing specialties
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.delete = Mock()
-        mock_db.query.return_value = mock_query
+        # Act
+        professional_specialty_service.add_specialties_to_professional(PROFESSIONAL_ID, [SPECIALTY_2, SPECIALTY_3])
 
-        # Mock the database operations
-        mock_db.add = Mock()
-        mock_db.commit = Mock()
-        mock_db.refresh = Mock()
+        # Assert
+        delete_call, insert_call = mock_db.execute.call_args_list
+        assert _bound_values(delete_call) == [PROFESSIONAL_ID, [SPECIALTY_1]]
+        assert _bound_values(insert_call) == sorted([PROFESSIONAL_ID, SPECIALTY_3])
+        mock_db.commit.assert_called_once()
 
-        # Mock the ProfessionalSpecialty constructor to avoid schema/model mismatch
-        with pytest.MonkeyPatch().context() as m:
-            m.setattr(ProfessionalSpecialty, "__init__", lambda self, **kwargs: None)
+    def test_add_specialties_to_professional_unchanged(self, professional_specialty_service, mock_db):
+        """Test that setting the stored specialties again writes nothing."""
+        # Arrange
+        mock_db.scalars.return_value.all.return_value = [uuid.UUID(SPECIALTY_1)]
+        mock_db.query.return_value.filter.return_value.all.return_value = []
 
-            # Act
-            result = professional_specialty_service.add_specialties_to_professional(professional_id, specialty_ids)
+        # Act
+        professional_specialty_service.add_specialties_to_professional(PROFESSIONAL_ID, [SPECIALTY_1.upper()])
 
-            # Assert
-            assert len(result) == 1
-            mock_db.add.assert_called_once()
-            mock_db.commit.assert_called_once()
-            mock_db.refresh.assert_called_once()
+        # Assert
+        mock_db.execute.assert_not_called()
+        mock_db.commit.assert_called_once()
 
     def test_professional_specialty_service_initialization(self, mock_db):
         """Test ProfessionalSpecialtyService initialization."""
@@ -2,8 +2,11 @@
 Unit tests for ProfessionalTherapeuticApproachService.
 """
 
+import uuid
+
 import pytest
 from unittest.mock import Mock
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 from app.services.professional_therapeutic_approach_service import ProfessionalTherapeuticApproachService
@@ -13,6 +16,21 @@ from app.schemas.professional_therapeutic_approach import (
     ProfessionalTherapeuticApproachUpdate,
 )
 
+PROFESSIONAL_ID = str(uuid.UUID(int=1))
+APPROACH_1 = str(uuid.UUID(int=11))
+APPROACH_2 = str(uuid.UUID(int=12))
+APPROACH_3 = str(uuid.UUID(int=13))
+
+
+def _sql(call) -> str:
+    return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+
+def _bound_values(call) -> list:
+    # Bound values of a statement, whatever the parameter names; generated link IDs are left out
+    params = call.args[0].compile(dialect=postgresql.dialect()).params
+    return sorted((value for value in params.values() if isinstance(value, (str, list))), key=str)
+
 
 class TestProfessionalTherapeuticApproachServiceUnit:
     """Unit tests for ProfessionalTherapeuticApproachService."""
@@ -210,103 +228,84 @@ class TestProfessionalTherapeuticApproachServiceUnit:
     def test_add_therapeutic_approaches_to_professional_success(
         self, professional_therapeutic_approach_service, mock_db
     ):
-        """Test adding multiple therapeutic approaches to a professional successfully."""
+        """Test that new therapeutic approaches are written with one bulk insert and no per-row refresh."""
         # Arrange
-        professional_id = "test-professional-1"
-        approach_ids = ["approach-1", "approach-2", "approach-3"]
-
-        # Mock the query for deleting existing approaches
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.delete = Mock()
-        mock_db.query.return_value = mock_query
-
-        # Mock the database operations
-        mock_db.add = Mock()
-        mock_db.commit = Mock()
-        mock_db.refresh = Mock()
-
-        # Mock the ProfessionalTherapeuticApproach constructor to avoid schema/model mismatch
-        with pytest.MonkeyPatch().context() as m:
-            m.setattr(ProfessionalTherapeuticApproach, "__init__", lambda self, **kwargs: None)
+        approach_ids = [APPROACH_1, APPROACH_2, APPROACH_1]
+        mock_db.scalars.return_value.all.return_value = []
+        stored = [Mock(spec=ProfessionalTherapeuticApproach), Mock(spec=ProfessionalTherapeuticApproach)]
+        mock_db.query.return_value.filter.return_value.all.return_value = stored
 
-            # Act
-            result = professional_therapeutic_approach_service.add_therapeutic_approaches_to_professional(
-                professional_id, approach_ids
-            )
+        # Act
+        result = professional_therapeutic_approach_service.add_therapeutic_approaches_to_professional(
+            PROFESSIONAL_ID, approach_ids
+        )
 
-            # Assert
-            assert len(result) == 3
-            assert mock_db.add.call_count == 3
-            mock_db.commit.assert_called_once()
-            assert mock_db.refresh.call_count == 3
+        # Assert
+        assert result == stored
+        (insert_call,) = mock_db.execute.call_args_list
+        sql = _sql(insert_call)
+        assert sql.startswith("INSERT INTO professional_therapeutic_approaches")
+        assert "ON CONFLICT (professional_id, therapeutic_approach_id) DO NOTHING" in sql
+        # Duplicated IDs are inserted once
+        assert _bound_values(insert_call) == sorted([PROFESSIONAL_ID, PROFESSIONAL_ID, APPROACH_1, APPROACH_2])
+        mock_db.add.assert_not_called()
+        mock_db.refresh.assert_not_called()
+        mock_db.commit.assert_called_once()
 
     def test_add_therapeutic_approaches_to_professional_empty_list(
         self, professional_therapeutic_approach_service, mock_db
     ):
-        """Test adding empty list of therapeutic approaches to a professional."""
+        """Test that an empty list removes the stored therapeutic approaches with one bulk delete."""
         # Arrange
-        professional_id = "test-professional-1"
-        approach_ids = []
-
-        # Mock the query for deleting existing approaches
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.delete = Mock()
-        mock_db.query.return_value = mock_query
-
-        # Mock the database operations
-        mock_db.add = Mock()
-        mock_db.commit = Mock()
-        mock_db.refresh = Mock()
+        mock_db.scalars.return_value.all.return_value = [uuid.UUID(APPROACH_1)]
+        mock_db.query.return_value.filter.return_value.all.return_value = []
 
         # Act
         result = professional_therapeutic_approach_service.add_therapeutic_approaches_to_professional(
-            professional_id, approach_ids
+            PROFESSIONAL_ID, []
         )
 
         # Assert
         assert len(result) == 0
-        mock_db.add.assert_not_called()
+        (delete_call,) = mock_db.execute.call_args_list
+        assert _sql(delete_call).startswith("DELETE FROM professional_therapeutic_approaches")
         mock_db.commit.assert_called_once()
-        mock_db.refresh.assert_not_called()
 
-    def test_add_therapeutic_approaches_to_professional_single_approach(
+    def test_add_therapeutic_approaches_to_professional_only_writes_the_difference(
         self, professional_therapeutic_approach_service, mock_db
     ):
-        """Test adding a single therapeutic approach to a professional."""
+        """Test that kept therapeutic approaches are not rewritten: only the difference is written."""
         # Arrange
-        professional_id = "test-professional-1"
-        approach_ids = ["approach-1"]
+        mock_db.scalars.return_value.all.return_value = [uuid.UUID(APPROACH_1), uuid.UUID(APPROACH_2)]
+        mock_db.query.return_value.filter.return_value.all.return_value = []
 
-        # Mock the query for deleting existing approaches
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_query.filter.return_value = mock_filter
-        mock_filter.delete = Mock()
-        mock_db.query.return_value = mock_query
+        # Act
+        professional_therapeutic_approach_service.add_therapeutic_approaches_to_professional(
+            PROFESSIONAL_ID, [APPROACH_2, APPROACH_3]
+        )
 
-        # Mock the database operations
-        mock_db.add = Mock()
-        mock_db.commit = Mock()
-        mock_db.refresh = Mock()
+        # Assert
+        delete_call, insert_call = mock_db.execute.call_args_list
+        assert _bound_values(delete_call) == [PROFESSIONAL_ID, [APPROACH_1]]
+        assert _bound_values(insert_call) == sorted([PROFESSIONAL_ID, APPROACH_3])
+        mock_db.commit.assert_called_once()
 
-        # Mock the ProfessionalTherapeuticApproach constructor to avoid schema/model mismatch
-        with pytest.MonkeyPatch().context() as m:
-            m.setattr(ProfessionalTherapeuticApproach, "__init__", lambda self, **kwargs: None)
+    def test_add_therapeutic_approaches_to_professional_unchanged(
+        self, professional_therapeutic_approach_service, mock_db
+    ):
+        """Test that setting the stored therapeutic approaches again writes nothing."""
+        # Arrange
+        mock_db.scalars.return_value.all.return_value = [uuid.UUID(APPROACH_1)]
+        mock_db.query.return_value.filter.return_value.all.return_value = []
 
-            # Act
-            result = professional_therapeutic_approach_service.add_therapeutic_approaches_to_professional(
-                professional_id, approach_ids
-            )
+        # Act
+        professional_therapeutic_approach_service.add_therapeutic_approaches_to_professional(
+            PROFESSIONAL_ID, [APPROACH_1.upper()]
+        )
 
-            # Assert
-            assert len(result) == 1
-            mock_db.add.assert_called_once()
-            mock_db.commit.assert_called_once()
-            mock_db.refresh.assert_called_once()
+        # Assert
+        mock_db.execute.assert_not_called()
+        mock_db.commit.assert_called_once()
 
     def test_professional_therapeutic_approach_service_initialization(self, mock_db):
         """Test ProfessionalTherapeuticApproachService initialization."""
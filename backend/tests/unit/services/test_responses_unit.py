@@ -0,0 +1,33 @@
+"""
+Unit tests for the default response class.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import orjson
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.core.responses import default_response_class
+
+
+class TestDefaultResponseClassUnit:
+    """Unit tests for default_response_class."""
+
+    def test_toggle(self):
+        """Test that the setting selects the encoder."""
+        with patch("app.core.responses.get_settings", return_value=SimpleNamespace(ORJSON_RESPONSES_ENABLED=True)):
+            assert default_response_class() is ORJSONResponse
+        with patch("app.core.responses.get_settings", return_value=SimpleNamespace(ORJSON_RESPONSES_ENABLED=False)):
+            assert default_response_class() is JSONResponse
+
+    def test_native_types(self):
+        """Test that UUIDs and datetimes are encoded without jsonable_encoder."""
+        professional_id = uuid.UUID(int=1)
+        created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        body = ORJSONResponse({"id": professional_id, "created_at": created_at}).body
+
+        assert orjson.loads(body) == {"id": str(professional_id), "created_at": "2025-01-01T00:00:00+00:00"}